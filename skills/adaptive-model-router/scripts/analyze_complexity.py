@@ -10,7 +10,22 @@ Routes to:
 
 import re
 import sys
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick: optional C-level multi-pattern matcher
+except ImportError:
+    ahocorasick = None
+
+# Tier -> model alias, indexed by tier - 1
+MODELS = ("glm-4.5-flash", "glm-4.7-flash", "glm-4.7")
+
+# Tier -> (confidence cap, confidence offset), indexed by tier - 1
+CONFIDENCE = ((0.95, 0.6), (0.95, 0.55), (0.9, 0.4))
+
+# Word tokens, keeping hyphenated/dotted terms like "multi-step" or "4.7" whole
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.\-][a-z0-9]+)*")
 
 
 class ComplexityAnalyzer:
@@ -37,11 +52,11 @@ class ComplexityAnalyzer:
             'portfolio', 'market analysis', 'hft', 'high frequency'
         }
 
-        self.code_keywords = {
+        self.code_keywords = frozenset({
             'code', 'function', 'class', 'script', 'program', 'algorithm',
             'implementation', 'api', 'database', 'sql', 'python', 'rust',
             'javascript', 'typescript', 'html', 'css', 'docker', 'kubernetes'
-        }
+        })
 
         self.reasoning_indicators = {
             'because', 'therefore', 'however', 'although', 'considering',
@@ -49,6 +64,36 @@ class ComplexityAnalyzer:
             'trade-off', 'weighing', 'balancing', 'decision'
         }
 
+        # Tier tag -> keyword set; tier keywords and reasoning indicators
+        # are all matched together in a single pass
+        self._tiered_keywords = (
+            ('T1', self.tier1_keywords),
+            ('T2', self.tier2_keywords),
+            ('T3', self.tier3_keywords),
+        )
+        all_keywords = frozenset().union(
+            self.reasoning_indicators, *(kws for _, kws in self._tiered_keywords)
+        )
+        # Single words match by token-set intersection; only true
+        # multi-word phrases need a substring scan
+        self._keyword_words = frozenset(kw for kw in all_keywords if ' ' not in kw)
+        self._keyword_phrases = all_keywords - self._keyword_words
+        self._automaton = self._build_automaton(self._keyword_phrases)
+
+        # Analysis is a pure function of the query; memoize per analyzer
+        self._analyze_cached = lru_cache(maxsize=1024)(self._analyze)
+
+    @staticmethod
+    def _build_automaton(keywords):
+        """Build an Aho-Corasick automaton over keywords (None if unavailable)."""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return automaton
+
     def analyze(self, query: str) -> Dict:
         """
         Analyze query complexity and return recommendation.
@@ -63,58 +108,67 @@ class ComplexityAnalyzer:
                 - confidence: Float 0-1
                 - reasoning: Explanation of classification
         """
-        query_lower = query.lower()
-        length = len(query.split())
-        code_ratio = self._code_ratio(query_lower)
-        reasoning_depth = self._reasoning_depth(query_lower)
-        keywords = self._extract_keywords(query_lower)
-
-        # Score each tier
-        tier1_score = self._score_tier1(query_lower, length, code_ratio, reasoning_depth)
-        tier2_score = self._score_tier2(query_lower, length, code_ratio, reasoning_depth)
-        tier3_score = self._score_tier3(query_lower, length, code_ratio, reasoning_depth)
-
-        # Determine winner
-        if tier3_score >= 7:
-            tier = 3
-            model = "glm-4.7"
-            confidence = min(0.9, tier3_score / 10 + 0.4)
-        elif tier2_score >= 5:
-            tier = 2
-            model = "glm-4.7-flash"
-            confidence = min(0.95, tier2_score / 10 + 0.55)
-        else:
-            tier = 1
-            model = "glm-4.5-flash"
-            confidence = min(0.95, tier1_score / 10 + 0.6)
-
-        reasoning = self._generate_reasoning(
-            tier, tier1_score, tier2_score, tier3_score,
-            length, code_ratio, reasoning_depth, keywords
+        tier, model, confidence, reasoning, length, code_ratio, reasoning_depth, keywords = (
+            self._analyze_cached(query)
         )
 
         return {
             'tier': tier,
             'model': model,
-            'confidence': round(confidence, 2),
+            'confidence': confidence,
             'reasoning': reasoning,
             'metrics': {
                 'word_count': length,
                 'code_ratio': code_ratio,
                 'reasoning_depth': reasoning_depth,
-                'keywords': keywords
+                'keywords': list(keywords)
             }
         }
 
-    def _code_ratio(self, query: str) -> float:
+    def _analyze(self, query: str) -> Tuple:
+        """Compute the analysis as an immutable tuple (cached by analyze())."""
+        query_lower = query.lower()
+        tokens = frozenset(TOKEN_RE.findall(query_lower))
+        words = query_lower.split()
+        length = len(words)
+        code_ratio = self._code_ratio(words)
+        matched = self._match_keywords(query_lower, tokens)
+        reasoning_depth = self._reasoning_depth(query_lower, matched)
+        keywords = self._extract_keywords(matched)
+
+        # Score each tier
+        tier1_score, tier2_score, tier3_score = self._score_tiers(
+            len(self.tier1_keywords & matched),
+            len(self.tier2_keywords & matched),
+            len(self.tier3_keywords & matched),
+            length, code_ratio, reasoning_depth
+        )
+
+        # Determine winner
+        tier = 3 if tier3_score >= 7 else (2 if tier2_score >= 5 else 1)
+        model = MODELS[tier - 1]
+        cap, offset = CONFIDENCE[tier - 1]
+        confidence = min(cap, (tier1_score, tier2_score, tier3_score)[tier - 1] / 10 + offset)
+
+        reasoning = self._generate_reasoning(
+            tier, tier1_score, tier2_score, tier3_score,
+            length, code_ratio, reasoning_depth, keywords
+        )
+
+        return (
+            tier, model, round(confidence, 2), reasoning,
+            length, code_ratio, reasoning_depth, tuple(keywords)
+        )
+
+    def _code_ratio(self, words: List[str]) -> float:
         """Calculate ratio of code-related keywords."""
-        code_words = [w for w in query.split() if w in self.code_keywords]
-        return len(code_words) / max(1, len(query.split()))
+        # Counts every occurrence, so a set intersection would undercount;
+        # map() over the bound __contains__ keeps the loop in C instead
+        return sum(map(self.code_keywords.__contains__, words)) / max(1, len(words))
 
-    def _reasoning_depth(self, query: str) -> float:
+    def _reasoning_depth(self, query: str, matched: Set[str]) -> float:
         """Estimate reasoning complexity based on indicators."""
-        indicators = [i for i in self.reasoning_indicators if i in query]
-        depth = len(indicators)
+        depth = len(self.reasoning_indicators & matched)
 
         # Boost for multi-part questions
         if '?' in query:
@@ -126,91 +180,71 @@ class ComplexityAnalyzer:
 
         return min(10, depth * 2)
 
-    def _extract_keywords(self, query: str) -> List[str]:
+    def _match_keywords(self, query: str, tokens: FrozenSet[str]) -> Set[str]:
+        """Return every tier keyword and reasoning indicator present in the query."""
+        matched = set(self._keyword_words & tokens)
+        if self._automaton is not None:
+            matched.update(kw for _, kw in self._automaton.iter(query))
+        else:
+            matched.update(kw for kw in self._keyword_phrases if kw in query)
+        return matched
+
+    def _extract_keywords(self, matched: Set[str]) -> List[str]:
         """Extract matching keywords for debugging."""
         found = []
-        for kw in self.tier1_keywords:
-            if kw in query:
-                found.append(f"T1:{kw}")
-        for kw in self.tier2_keywords:
-            if kw in query:
-                found.append(f"T2:{kw}")
-        for kw in self.tier3_keywords:
-            if kw in query:
-                found.append(f"T3:{kw}")
+        for tag, kws in self._tiered_keywords:
+            found.extend(f"{tag}:{kw}" for kw in sorted(kws & matched))
         return found[:10]  # Limit to 10
 
-    def _score_tier1(self, query: str, length: int, code_ratio: float, reasoning: float) -> float:
-        """Score for Tier 1 (simple)."""
-        score = 0
-
-        # Keyword matches
-        matches = sum(1 for kw in self.tier1_keywords if kw in query)
-        score += matches * 2
-
+    @staticmethod
+    def _score_tiers(
+        m1: int, m2: int, m3: int,
+        length: int, code_ratio: float, reasoning: float
+    ) -> Tuple[float, float, float]:
+        """Score Tier 1 (simple), 2 (medium) and 3 (complex) from keyword match counts."""
+        # Tier 1: keyword matches
+        t1 = m1 * 2
         # Short queries favor Tier 1
         if length < 30:
-            score += 3
+            t1 += 3
         elif length < 50:
-            score += 1
-
+            t1 += 1
         # Low reasoning favors Tier 1
         if reasoning < 2:
-            score += 2
-
+            t1 += 2
         # Penalize if complex reasoning
         if reasoning >= 4:
-            score -= 2
-
-        return max(0, score)
-
-    def _score_tier2(self, query: str, length: int, code_ratio: float, reasoning: float) -> float:
-        """Score for Tier 2 (medium)."""
-        score = 0
-
-        # Keyword matches
-        matches = sum(1 for kw in self.tier2_keywords if kw in query)
-        score += matches * 2
+            t1 -= 2
 
+        # Tier 2: keyword matches
+        t2 = m2 * 2
         # Medium length
         if 30 <= length < 100:
-            score += 3
+            t2 += 3
         elif 100 <= length < 200:
-            score += 2
-
+            t2 += 2
         # Medium reasoning
         if 2 <= reasoning < 5:
-            score += 3
-
+            t2 += 3
         # Some code content
         if 0.1 <= code_ratio < 0.3:
-            score += 2
-
-        return max(0, score)
-
-    def _score_tier3(self, query: str, length: int, code_ratio: float, reasoning: float) -> float:
-        """Score for Tier 3 (complex)."""
-        score = 0
-
-        # Keyword matches (highest weight)
-        matches = sum(1 for kw in self.tier3_keywords if kw in query)
-        score += matches * 3
+            t2 += 2
 
+        # Tier 3: keyword matches (highest weight)
+        t3 = m3 * 3
         # Long queries
         if length >= 100:
-            score += 3
+            t3 += 3
         elif length >= 200:
-            score += 5
-
+            t3 += 5
         # Deep reasoning
         if reasoning >= 5:
-            score += 4
-
+            t3 += 4
         # High code ratio
         if code_ratio >= 0.3:
-            score += 3
+            t3 += 3
 
-        return max(0, score)
+        return max(0, t1), max(0, t2), max(0, t3)
 
     def _generate_reasoning(
         self, tier: int, t1: float, t2: float, t3: float,
@@ -5,16 +5,28 @@ Auto-route task to optimal model based on complexity.
 Analyzes the task, checks current model, and switches if needed.
 """
 
+import os
 import sys
-import subprocess
 import json
-from pathlib import Path
 
-# Add scripts to path
-SCRIPT_DIR = Path(__file__).parent
-sys.path.insert(0, str(SCRIPT_DIR))
+# Add scripts to path (os.path rather than pathlib keeps CLI startup lean)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
 
-from analyze_complexity import ComplexityAnalyzer
+from analyze_complexity import MODELS, ComplexityAnalyzer
+
+# (variant, canonical) pairs, most specific first
+MODEL_VARIANTS = (
+    ('glm-4.7-flash', 'glm-4.7-flash'),
+    ('glm4.7flash', 'glm-4.7-flash'),
+    ('glm-4.5-flash', 'glm-4.5-flash'),
+    ('glm4.5flash', 'glm-4.5-flash'),
+    ('glm-4.7', 'glm-4.7'),
+    ('glm4.7', 'glm-4.7'),
+)
+
+# Exact variant -> canonical name, for the common case of a bare model name
+MODEL_VARIANT_MAP = dict(MODEL_VARIANTS)
 
 
 class ModelRouter:
@@ -22,11 +34,7 @@ class ModelRouter:
 
     def __init__(self):
         self.analyzer = ComplexityAnalyzer()
-        self.model_aliases = {
-            1: "glm-4.5-flash",
-            2: "glm-4.7-flash",
-            3: "glm-4.7"
-        }
+        self.model_aliases = dict(enumerate(MODELS, start=1))
 
     def route(self, query: str, current_model: str = None) -> dict:
         """
@@ -41,7 +49,7 @@ class ModelRouter:
         """
         # Analyze complexity
         analysis = self.analyzer.analyze(query)
-        recommended_model = self.model_aliases[analysis['tier']]
+        recommended_model = MODELS[analysis['tier'] - 1]
 
         # Determine if switch is needed
         needs_switch = False
@@ -62,19 +70,33 @@ class ModelRouter:
             'metrics': analysis['metrics']
         }
 
+    def route_batch(self, queries: list, current_model: str = None) -> list:
+        """
+        Route many queries through one router/analyzer instance.
+
+        Args:
+            queries: List of user tasks/queries
+            current_model: Current model (if known), shared by all queries
+
+        Returns:
+            List of routing decisions, in input order
+        """
+        return [self.route(query, current_model) for query in queries]
+
     def _normalize_model(self, model: str) -> str:
         """Normalize model name for comparison."""
         model_lower = model.lower().replace(' ', '-')
 
-        # Map variations to canonical names
-        if 'glm-4.7-flash' in model_lower or 'glm4.7flash' in model_lower:
-            return 'glm-4.7-flash'
-        elif 'glm-4.5-flash' in model_lower or 'glm4.5flash' in model_lower:
-            return 'glm-4.5-flash'
-        elif 'glm-4.7' in model_lower or 'glm4.7' in model_lower:
-            return 'glm-4.7'
-        else:
-            return model_lower
+        # Bare names resolve with one dict lookup
+        canonical = MODEL_VARIANT_MAP.get(model_lower)
+        if canonical:
+            return canonical
+
+        # Prefixed/suffixed names (e.g. "zai/glm-4.7") need the substring scan
+        for variant, canonical in MODEL_VARIANTS:
+            if variant in model_lower:
+                return canonical
+        return model_lower
 
     def execute_switch(self, model_alias: str) -> bool:
         """
@@ -88,6 +110,112 @@ class ModelRouter:
         return True
 
 
+def read_batch_queries(batch_file: str) -> list:
+    """
+    Read queries from an NDJSON file ('-' for stdin).
+
+    Each non-empty line is either a JSON string or an object with a "query" key.
+    """
+    if batch_file == '-':
+        return _parse_batch_lines(sys.stdin)
+    # Only close the file opened here, never stdin
+    with open(batch_file, encoding='utf-8') as stream:
+        return _parse_batch_lines(stream)
+
+
+def _parse_batch_lines(stream) -> list:
+    queries = []
+    for lineno, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"line {lineno}: {e}") from None
+        if isinstance(item, dict) and 'query' not in item:
+            raise ValueError(f"line {lineno}: missing \"query\" key")
+        query = item['query'] if isinstance(item, dict) else item
+        if not isinstance(query, str):
+            raise ValueError(f"line {lineno}: query must be a string, got {type(query).__name__}")
+        queries.append(query)
+    return queries
+
+
+def route_batch_file(batch_file: str, current_model: str = None) -> int:
+    """Route every query in an NDJSON batch file; returns the CLI exit code."""
+    try:
+        queries = read_batch_queries(batch_file)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Cannot read batch file {batch_file}: {e}", file=sys.stderr)
+        return 2
+
+    router = ModelRouter()
+    decisions = router.route_batch(queries, current_model)
+    for decision in decisions:
+        print(json.dumps(decision))
+
+    # Exit code indicates whether any query needs a switch
+    return 1 if any(d['needs_switch'] for d in decisions) else 0
+
+
+def serve(socket_path: str, current_model: str = None) -> None:
+    """
+    Serve routing decisions on a Unix domain socket.
+
+    Each request line is either a plain-text query or a JSON object with a
+    "query" key (and optionally "current_model"); each response is one JSON
+    line. The router and its analyzer are built once for the daemon's lifetime.
+    """
+    import signal
+    import socketserver
+    import stat
+
+    router = ModelRouter()
+
+    class RouteHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode('utf-8', errors='replace').strip()
+                if not line:
+                    continue
+                query, model = line, current_model
+                if line.startswith('{'):
+                    try:
+                        request = json.loads(line)
+                        query = request['query']
+                        model = request.get('current_model', current_model)
+                        if not isinstance(query, str):
+                            raise TypeError("query must be a string")
+                        if model is not None and not isinstance(model, str):
+                            raise TypeError("current_model must be a string")
+                    except (ValueError, KeyError, TypeError, AttributeError) as e:
+                        response = {'error': f"Invalid request: {e}"}
+                        self.wfile.write((json.dumps(response) + '\n').encode('utf-8'))
+                        continue
+                decision = router.route(query, model)
+                self.wfile.write((json.dumps(decision) + '\n').encode('utf-8'))
+
+    # Replace a stale socket from a previous run, but never a regular file
+    if os.path.exists(socket_path):
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            print(f"ERROR: {socket_path} exists and is not a socket", file=sys.stderr)
+            sys.exit(2)
+        os.unlink(socket_path)
+
+    # Exit cleanly (removing the socket) when stopped by a service manager
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    with socketserver.ThreadingUnixStreamServer(socket_path, RouteHandler) as server:
+        print(f"Routing on {socket_path} (Ctrl+C to stop)", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
 def main():
     """CLI interface."""
     if len(sys.argv) < 2:
@@ -95,22 +223,39 @@ def main():
         print("\nExamples:", file=sys.stderr)
         print('  python auto_route.py "What is the capital of France?"', file=sys.stderr)
         print('  python auto_route.py "Design a microservices architecture" --current-model glm-4.7-flash', file=sys.stderr)
-        print("\nOutput: JSON routing decision", file=sys.stderr)
+        print('  python auto_route.py --batch-file queries.ndjson', file=sys.stderr)
+        print('  python auto_route.py --serve /tmp/router.sock', file=sys.stderr)
+        print("\nOutput: JSON routing decision (one JSON line per query with --batch-file)", file=sys.stderr)
         sys.exit(1)
 
     # Parse args
     query = ''
     current_model = None
+    batch_file = None
+    socket_path = None
     i = 1
     while i < len(sys.argv):
         arg = sys.argv[i]
         if arg == '--current-model' and i + 1 < len(sys.argv):
             current_model = sys.argv[i + 1]
             i += 2
+        elif arg == '--batch-file' and i + 1 < len(sys.argv):
+            batch_file = sys.argv[i + 1]
+            i += 2
+        elif arg == '--serve' and i + 1 < len(sys.argv):
+            socket_path = sys.argv[i + 1]
+            i += 2
         else:
             query += arg + ' '
             i += 1
 
+    if socket_path:
+        serve(socket_path, current_model)
+        sys.exit(0)
+
+    if batch_file:
+        sys.exit(route_batch_file(batch_file, current_model))
+
     query = query.strip()
     if not query:
         print("ERROR: No query provided", file=sys.stderr)
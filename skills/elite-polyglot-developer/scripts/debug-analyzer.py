@@ -5,9 +5,14 @@ Elite Debug Analyzer - Automated root cause analysis
 import sys
 import subprocess
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Shared spawn options: no interactive stdin, and close_fds=False so CPython
+# can use posix_spawn (fds it creates are non-inheritable anyway, PEP 446)
+SPAWN_KW = {'stdin': subprocess.DEVNULL, 'close_fds': False}
+
 class DebugAnalyzer:
     def __init__(self):
         self.tools = {
@@ -18,6 +23,22 @@ class DebugAnalyzer:
             'c': ['gcc', 'valgrind', 'gdb'],
             'cpp': ['g++', 'valgrind', 'gdb']
         }
+        
+        # Error categories, checked in priority order
+        patterns = {
+            'memory': r'segfault|sigsegv|memory|heap|stack overflow',
+            'concurrency': r'race|deadlock|thread|mutex|lock',
+            'logic': r'assertion|invariant|precondition',
+            'type': r'type error|cannot convert|incompatible',
+            'runtime': r'exception|panic|crash|abort',
+            'performance': r'timeout|slow|bottleneck'
+        }
+        # One precompiled alternation; the anchored lookaheads keep the
+        # category priority (first category wins, not leftmost match)
+        self._error_re = re.compile(
+            "|".join(f"(?=.*?(?P<{category}>{pattern}))" for category, pattern in patterns.items()),
+            re.IGNORECASE | re.DOTALL
+        )
     
     def analyze_error(self, error_msg: str, language: str, code_path: Path) -> Dict:
         """Deep error analysis with root cause identification"""
@@ -69,40 +90,37 @@ class DebugAnalyzer:
     
     def _classify_error(self, error_msg: str) -> str:
         """Classify error into categories"""
-        patterns = {
-            'memory': r'(segfault|sigsegv|memory|heap|stack overflow)',
-            'concurrency': r'(race|deadlock|thread|mutex|lock)',
-            'logic': r'(assertion|invariant|precondition)',
-            'type': r'(type error|cannot convert|incompatible)',
-            'runtime': r'(exception|panic|crash|abort)',
-            'performance': r'(timeout|slow|bottleneck)'
-        }
-        
-        for category, pattern in patterns.items():
-            if re.search(pattern, error_msg, re.IGNORECASE):
-                return category
-        
-        return 'unknown'
+        match = self._error_re.match(error_msg)
+        return match.lastgroup if match else 'unknown'
     
     def _run_static_analysis(self, language: str, code_path: Path) -> List[str]:
-        """Run language-specific static analysis"""
-        issues = []
+        """Run language-specific static analysis (tools run concurrently)"""
         tools = self.tools.get(language, [])
+        if not tools:
+            return []
         
-        for tool in tools:
-            try:
-                result = subprocess.run(
-                    [tool, str(code_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                if result.returncode != 0:
-                    issues.append(f"{tool}: {result.stderr[:200]}")
-            except Exception:
-                pass
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            futures = [executor.submit(self._run_tool, tool, code_path) for tool in tools]
+            # Collect in tool order so the report is stable across runs
+            results = [future.result() for future in futures]
         
-        return issues
+        return [issue for issue in results if issue]
+    
+    def _run_tool(self, tool: str, code_path: Path) -> Optional[str]:
+        """Run a single analysis tool, returning its issue line if it failed"""
+        try:
+            result = subprocess.run(
+                [tool, str(code_path)],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                **SPAWN_KW
+            )
+            if result.returncode != 0:
+                return f"{tool}: {result.stderr[:200]}"
+        except Exception:
+            pass
+        return None
     
     def suggest_profiling(self, error_type: str) -> List[str]:
         """Suggest profiling tools based on error type"""
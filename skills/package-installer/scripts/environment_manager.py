@@ -8,45 +8,129 @@ import os
 import sys
 import subprocess
 import json
+import re
 import venv
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 import shutil
 
+# Optional pre-downloaded pip/setuptools/wheel wheels (skill-level wheels/ directory)
+WHEELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "wheels")
+# Basic package -> minimum version worth keeping without an upgrade
+BASIC_PACKAGES = {"pip": (23, 0), "setuptools": (65, 0), "wheel": (0, 40)}
+
 class EnvironmentManager:
     """Manages Python virtual environments"""
     
     def __init__(self, base_path: str = None):
         self.base_path = base_path or "G:\\PROGRAMMES_FILES\\Github\\Finance_Agent\\LABO\\GIT STOCKAGE\\CREATION\\PERSONNAL ASSISTANCE\\moltbot"
         self.envs_path = os.path.join(self.base_path, "virtual_envs")
+        # env name -> [size_bytes, env mtime] from the last `list --sizes`
+        self.size_cache_path = os.path.join(self.envs_path, ".sizecache.json")
+        # path -> os.stat result (None if missing), shared by list/info lookups;
+        # cleared whenever an environment is created or removed
+        self._stat_cache: Dict[str, Optional[os.stat_result]] = {}
+        # Python version -> resolved executable, and versions known to be missing
+        self._pyver_pos_cache: Dict[str, str] = {}
+        self._pyver_neg_cache: Set[str] = set()
+        
+        # Platform-specific layout inside an environment, resolved once
+        if sys.platform == "win32":
+            self._py_suffix = "Scripts\\python.exe"
+            self._pip_suffix = "Scripts\\pip.exe"
+            self._activate_suffix = "Scripts\\activate.bat"
+            self._activate_cmd = "CALL"
+        else:
+            self._py_suffix = "bin/python"
+            self._pip_suffix = "bin/pip"
+            self._activate_suffix = "bin/activate"
+            self._activate_cmd = "source"
+            
         self.ensure_envs_directory()
         
     def ensure_envs_directory(self):
         """Ensure the environments directory exists"""
         os.makedirs(self.envs_path, exist_ok=True)
         
-    def list_environments(self) -> List[Dict]:
+    def list_environments(self, include_size: bool = False) -> List[Dict]:
         """List all available environments"""
         environments = []
         
         if not os.path.exists(self.envs_path):
             return environments
             
-        for env_name in os.listdir(self.envs_path):
-            env_path = os.path.join(self.envs_path, env_name)
-            if os.path.isdir(env_path):
-                py_exe = self.get_python_path(env_name)
+        size_cache = self._load_size_cache() if include_size else {}
+        fresh_sizes = {}
+            
+        # scandir yields the entry type with the listing (no isdir stat per entry)
+        with os.scandir(self.envs_path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                py_exe = self.get_python_path(entry.name)
                 info = {
-                    "name": env_name,
-                    "path": env_path,
+                    "name": entry.name,
+                    "path": entry.path,
                     "python_executable": py_exe,
-                    "size_mb": self.get_directory_size(env_path) / (1024*1024),
-                    "exists": os.path.exists(py_exe)
+                    "exists": self._exists_cached(py_exe)
                 }
+                # Sizes need a full recursive walk per environment: opt-in only,
+                # and reused until the environment is modified
+                if include_size:
+                    mtime = self._env_mtime(entry.path)
+                    cached = size_cache.get(entry.name)
+                    if cached and cached[1] >= mtime:
+                        size = cached[0]
+                    else:
+                        size = self.get_directory_size(entry.path, skip_pycache=True)
+                    fresh_sizes[entry.name] = [size, mtime]
+                    info["size_mb"] = size / (1024*1024)
                 environments.append(info)
                 
+        if include_size and fresh_sizes != size_cache:
+            self._save_size_cache(fresh_sizes)
+                
         return environments
         
+    def _load_size_cache(self) -> Dict:
+        """Load cached environment sizes"""
+        try:
+            with open(self.size_cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+            
+    def _save_size_cache(self, sizes: Dict):
+        """Save environment sizes (best effort)"""
+        try:
+            with open(self.size_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(sizes, f)
+        except OSError:
+            pass
+            
+    def _site_packages_dirs(self, env_path: str) -> List[str]:
+        """Candidate site-packages directories (Lib/ on Windows, lib/pythonX.Y/ elsewhere)"""
+        paths = [os.path.join(env_path, "Lib", "site-packages")]
+        try:
+            with os.scandir(os.path.join(env_path, "lib")) as entries:
+                paths.extend(os.path.join(entry.path, "site-packages") 
+                             for entry in entries if entry.name.startswith("python"))
+        except OSError:
+            pass
+        return paths
+            
+    def _env_mtime(self, env_path: str) -> float:
+        """Latest mtime of the environment root and its site-packages"""
+        # Installs and uninstalls add/remove entries directly in site-packages
+        paths = [env_path, *self._site_packages_dirs(env_path)]
+        mtimes = []
+        for path in paths:
+            try:
+                mtimes.append(os.stat(path).st_mtime)
+            except OSError:
+                continue
+        return max(mtimes, default=0.0)
+        
     def create_environment(self, env_name: str, python_version: str = None) -> Tuple[bool, str]:
         """Create a new virtual environment"""
         try:
@@ -86,6 +170,8 @@ class EnvironmentManager:
             return False, f"Failed to create environment: {str(e)}"
         except Exception as e:
             return False, f"Error creating environment: {str(e)}"
+        finally:
+            self._stat_cache.clear()
             
     def remove_environment(self, env_name: str) -> Tuple[bool, str]:
         """Remove a virtual environment"""
@@ -106,6 +192,7 @@ class EnvironmentManager:
                 
             # Remove the environment
             shutil.rmtree(env_path)
+            self._stat_cache.clear()
             return True, f"Environment '{env_name}' removed successfully"
             
         except Exception as e:
@@ -113,72 +200,162 @@ class EnvironmentManager:
             
     def get_python_path(self, env_name: str) -> str:
         """Get the Python executable path for an environment"""
-        # Support for both Windows and Unix-like systems
-        if sys.platform == "win32":
-            return os.path.join(self.envs_path, env_name, "Scripts", "python.exe")
-        else:
-            return os.path.join(self.envs_path, env_name, "bin", "python")
+        # Plain concatenation: envs_path and the suffixes are already normalized
+        return f"{self.envs_path}{os.sep}{env_name}{os.sep}{self._py_suffix}"
+            
+    def get_site_packages_dirs(self, env_name: str) -> List[str]:
+        """Get the candidate site-packages directories of an environment"""
+        return self._site_packages_dirs(f"{self.envs_path}{os.sep}{env_name}")
             
     def get_pip_path(self, env_name: str) -> str:
         """Get the pip executable path for an environment"""
-        if sys.platform == "win32":
-            return os.path.join(self.envs_path, env_name, "Scripts", "pip.exe")
-        else:
-            return os.path.join(self.envs_path, env_name, "bin", "pip")
+        return f"{self.envs_path}{os.sep}{env_name}{os.sep}{self._pip_suffix}"
             
     def activate_environment(self, env_name: str) -> str:
         """Get activation command for an environment"""
-        if sys.platform == "win32":
-            return f"CALL {os.path.join(self.envs_path, env_name, 'Scripts', 'activate.bat')}"
-        else:
-            return f"source {os.path.join(self.envs_path, env_name, 'bin', 'activate')}"
+        return f"{self._activate_cmd} {self.envs_path}{os.sep}{env_name}{os.sep}{self._activate_suffix}"
             
     def find_python_executable(self, version: str) -> Optional[str]:
         """Find Python executable for a specific version"""
-        possible_names = [
+        # Every miss probes each candidate, so remember both outcomes
+        if version in self._pyver_pos_cache:
+            return self._pyver_pos_cache[version]
+        if version in self._pyver_neg_cache:
+            return None
+            
+        python_exe = self._resolve_python_executable(version)
+        if python_exe:
+            self._pyver_pos_cache[version] = python_exe
+        else:
+            self._pyver_neg_cache.add(version)
+        return python_exe
+        
+    def _resolve_python_executable(self, version: str) -> Optional[str]:
+        """Locate a Python executable for a version (uncached)"""
+        # The running interpreter needs no probing at all
+        if version in (f"{sys.version_info.major}.{sys.version_info.minor}", 
+                       ".".join(map(str, sys.version_info[:3]))):
+            return sys.executable
+            
+        # Windows launcher: a single `py -0p` lists every installed interpreter
+        if sys.platform == "win32":
+            python_exe = self._find_with_py_launcher(version)
+            if python_exe:
+                return python_exe
+                
+        parts = version.split('.')
+        possible_names = dict.fromkeys([
             f"python{version}",
-            f"python{version.split('.')[0]}.{version.split('.')[1]}",
-            f"python{version.split('.')[0]}",
+            f"python{'.'.join(parts[:2])}",
+            f"python{parts[0]}",
             "python"
-        ]
+        ])
         
         for name in possible_names:
+            # PATH lookup is filesystem-only; spawn only for executables that exist
+            python_exe = shutil.which(name)
+            if not python_exe:
+                continue
             try:
-                result = subprocess.run([name, "--version"], 
-                                      capture_output=True, text=True)
+                result = subprocess.run([python_exe, "--version"], 
+                                      stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, 
+                                      text=True)
                 if result.returncode == 0 and version in result.stdout:
-                    return name
+                    return python_exe
             except:
                 continue
                 
         return None
         
+    def _find_with_py_launcher(self, version: str) -> Optional[str]:
+        """Resolve a Python version through the Windows `py` launcher"""
+        try:
+            result = subprocess.run(["py", "-0p"], stdout=subprocess.PIPE, 
+                                  stderr=subprocess.DEVNULL, text=True)
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+            
+        # Lines look like " -V:3.11 *  C:\\Python311\\python.exe" (or " -3.11-64 ...")
+        for line in result.stdout.splitlines():
+            match = re.match(r"\s*-(?:V:)?(\d+(?:\.\d+)*)\S*\s+(?:\*\s+)?(.+)$", line)
+            if match and (match.group(1) == version or match.group(1).startswith(version + ".")
+                          or version.startswith(match.group(1) + ".")):
+                return match.group(2).strip()
+        return None
+        
+    def _outdated_basic_packages(self, env_name: str) -> List[str]:
+        """Basic packages missing from the environment or older than BASIC_PACKAGES"""
+        # dist-info directory names carry the version ("pip-23.2.1.dist-info"),
+        # so a directory listing replaces a pip run
+        installed = {}
+        for site_packages in self._site_packages_dirs(os.path.join(self.envs_path, env_name)):
+            try:
+                names = os.listdir(site_packages)
+            except OSError:
+                continue
+            for name in names:
+                if name.endswith(".dist-info") and "-" in name:
+                    package, version = name[:-len(".dist-info")].split("-", 1)
+                    installed[package.lower()] = tuple(
+                        int(part) for part in re.findall(r"\d+", version)[:2]
+                    )
+                    
+        return [package for package, minimum in BASIC_PACKAGES.items()
+                if installed.get(package, ()) < minimum]
+        
     def _install_basic_packages(self, env_name: str):
         """Install basic packages in the environment"""
         try:
+            packages = self._outdated_basic_packages(env_name)
+            if not packages:
+                return
             pip_path = self.get_pip_path(env_name)
+            
+            # Bundled wheels avoid the PyPI round trips; fall back to the network
+            # if they are missing or incomplete
+            if os.path.isdir(WHEELS_DIR):
+                result = subprocess.run([
+                    pip_path, "install", "--upgrade", "--no-index", "--find-links", WHEELS_DIR,
+                    *packages
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                if result.returncode == 0:
+                    return
+                    
             subprocess.run([
-                pip_path, "install", "--upgrade", "pip", "setuptools", "wheel"
-            ], check=True, capture_output=True)
+                pip_path, "install", "--upgrade", *packages
+            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except:
             # Ignore errors for basic packages
             pass
             
-    def get_directory_size(self, path: str) -> int:
-        """Get total size of directory in bytes"""
+    def get_directory_size(self, path: str, skip_pycache: bool = False) -> int:
+        """Get total size of directory in bytes (optionally ignoring __pycache__)"""
+        # scandir hands back entry types (and on Windows, sizes) with the
+        # listing itself, so each file costs at most one lstat
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Bytecode caches are numerous and regenerated on demand
+                            if not (skip_pycache and entry.name == "__pycache__"):
+                                stack.append(entry.path)
+                        else:
+                            total_size += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                # Unreadable directory: skip it, as os.walk did
+                continue
         return total_size
         
-    def get_environment_info(self, env_name: str) -> Optional[Dict]:
+    def get_environment_info(self, env_name: str, include_size: bool = False) -> Optional[Dict]:
         """Get detailed information about an environment"""
         env_path = os.path.join(self.envs_path, env_name)
         
-        if not os.path.exists(env_path):
+        if not self._exists_cached(env_path):
             return None
             
         py_path = self.get_python_path(env_name)
@@ -189,24 +366,54 @@ class EnvironmentManager:
             "path": env_path,
             "python_executable": py_path,
             "pip_executable": pip_path,
-            "size_bytes": self.get_directory_size(env_path),
             "python_version": self._get_python_version(py_path),
             "platform": sys.platform,
-            "exists": os.path.exists(py_path)
+            "exists": self._exists_cached(py_path)
         }
         
+        # The recursive size walk is opt-in; most callers only need paths/version
+        if include_size:
+            info["size_bytes"] = self.get_directory_size(env_path)
+            
         return info
         
-    def _get_python_version(self, python_path: str) -> str:
-        """Get Python version from executable"""
+    def _stat_cached(self, path: str) -> Optional[os.stat_result]:
+        """os.stat(path), or None if it does not exist, memoized per manager"""
         try:
-            result = subprocess.run([python_path, "--version"], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().replace("Python ", "")
-        except:
+            return self._stat_cache[path]
+        except KeyError:
             pass
-        return "Unknown"
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        self._stat_cache[path] = st
+        return st
+        
+    def _exists_cached(self, path: str) -> bool:
+        """os.path.exists backed by the stat cache"""
+        return self._stat_cached(path) is not None
+        
+    def _get_python_version(self, python_path: str) -> str:
+        """Get Python version from executable"""
+        st = self._stat_cached(python_path)
+        if st is None:
+            return "Unknown"
+        # Keyed on mtime so a recreated/upgraded interpreter is probed again
+        return _probe_python_version(python_path, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _probe_python_version(python_path: str, mtime_ns: int) -> str:
+    """Run `python --version` once per (executable, mtime)"""
+    try:
+        result = subprocess.run([python_path, "--version"], 
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        if result.returncode == 0:
+            return result.stdout.strip().replace("Python ", "")
+    except:
+        pass
+    return "Unknown"
 
 
 def main():
@@ -214,7 +421,7 @@ def main():
     if len(sys.argv) < 2:
         print("Usage: python environment_manager.py <command> [args]")
         print("Commands:")
-        print("  list                    - List all environments")
+        print("  list [--sizes]          - List all environments (--sizes: compute disk usage)")
         print("  create <name> [version] - Create new environment")
         print("  remove <name>           - Remove environment")
         print("  info <name>             - Get environment info")
@@ -224,15 +431,22 @@ def main():
     command = sys.argv[1].lower()
     
     if command == "list":
-        environments = manager.list_environments()
+        with_sizes = "--sizes" in sys.argv[2:]
+        environments = manager.list_environments(include_size=with_sizes)
         if not environments:
             print("No environments found")
-        else:
+        elif with_sizes:
             print(f"{'Name':<20} {'Size (MB)':<10} {'Python':<10} {'Status':<10}")
             print("-" * 50)
             for env in environments:
                 status = "✓" if env["exists"] else "✗"
                 print(f"{env['name']:<20} {env['size_mb']:<10.1f} {env['python_executable'].split('/')[-1]:<10} {status:<10}")
+        else:
+            print(f"{'Name':<20} {'Python':<10} {'Status':<10}")
+            print("-" * 40)
+            for env in environments:
+                status = "✓" if env["exists"] else "✗"
+                print(f"{env['name']:<20} {env['python_executable'].split('/')[-1]:<10} {status:<10}")
                 
     elif command == "create":
         if len(sys.argv) < 3:
@@ -260,7 +474,7 @@ def main():
             sys.exit(1)
             
         env_name = sys.argv[2]
-        info = manager.get_environment_info(env_name)
+        info = manager.get_environment_info(env_name, include_size=True)
         
         if info:
             print(json.dumps(info, indent=2))
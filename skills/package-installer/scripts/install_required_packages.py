@@ -5,8 +5,9 @@ Installs: chromadb, openai, yfinance, aiohttp, pandas, numpy, python-dotenv
 """
 
 import sys
-import os
 import json
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 # Add scripts to path
@@ -15,6 +16,39 @@ sys.path.append('scripts')
 from package_installer import PackageInstaller
 from environment_manager import EnvironmentManager
 
+def test_imports(python_path: str, packages: List[dict]):
+    """Import every installed package in one run of the target environment's Python"""
+    if not packages:
+        return
+    
+    # "module" is only set where the import name differs from the package name
+    modules = [pkg.get("module", pkg["name"]) for pkg in packages]
+    try:
+        result = subprocess.run([python_path, '-c', 'import ' + ', '.join(modules)], 
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, 
+                              timeout=60)
+        if result.returncode == 0:
+            for pkg in packages:
+                print(f"✅ {pkg['name']}: Test OK")
+            return
+    except Exception:
+        pass
+    
+    # Something failed to import: test individually to find which
+    for pkg, module in zip(packages, modules):
+        try:
+            result = subprocess.run([python_path, '-c', f'import {module}'], 
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, 
+                                  text=True, timeout=10)
+            
+            if result.returncode == 0:
+                print(f"✅ {pkg['name']}: Test OK")
+            else:
+                print(f"❌ {pkg['name']}: Test échoué - {result.stderr.strip()}")
+                
+        except Exception as e:
+            print(f"❌ {pkg['name']}: Test erreur - {str(e)}")
+
 def main():
     """Install required packages with security checks"""
     print("=" * 60)
@@ -22,8 +56,13 @@ def main():
     print("=" * 60)
     
     # Initialize components
+    from security_checker import SecurityChecker
+    
     installer = PackageInstaller()
     env_manager = EnvironmentManager()
+    # One checker for every package; its PyPI cache is thread-safe, so the
+    # worker threads can share it
+    checker = SecurityChecker()
     
     # Required packages list
     required_packages = [
@@ -59,6 +98,7 @@ def main():
         },
         {
             "name": "python-dotenv",
+            "module": "dotenv",
             "version": None,
             "description": "Python dotenv file parsing"
         }
@@ -97,20 +137,32 @@ def main():
     # Install packages with security checks
     successful_installs = []
     failed_installs = []
+    installed_versions = {}
     
-    for package_info in required_packages:
-        package_name = package_info["name"]
-        
-        print(f"\n🔄 Installation de: {package_name}")
-        print("-" * 40)
+    # Security checks are network-bound and independent: run them all up front,
+    # then ask for every needed approval at once so installs never wait on input.
+    # Installs themselves stay sequential (concurrent pip runs in one venv can
+    # clobber shared dependencies).
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        safety_futures = {
+            pkg["name"]: executor.submit(checker.check_package_safety, pkg["name"])
+            for pkg in required_packages
+        }
         
-        try:
-            # Perform security check first
-            from security_checker import SecurityChecker
-            checker = SecurityChecker()
+        to_install = []
+        needs_confirm = []
+        for package_info in required_packages:
+            package_name = package_info["name"]
+            
+            print(f"\n🔍 Vérification de sécurité: {package_name}")
+            print("-" * 40)
             
-            print("🔍 Vérification de sécurité en cours...")
-            safety_report = checker.check_package_safety(package_name)
+            try:
+                safety_report = safety_futures[package_name].result()
+            except Exception as e:
+                print(f"❌ Erreur lors de la vérification de {package_name}: {str(e)}")
+                failed_installs.append(package_info)
+                continue
             
             print(f"📊 Rapport de sécurité:")
             print(f"   Status: {safety_report['overall_status']}")
@@ -124,19 +176,45 @@ def main():
             if safety_report['score'] < 70:
                 print(f"❌ Score sécurité trop bas ({safety_report['score']}/100) - Installation refusée")
                 failed_installs.append(package_info)
-                continue
-            
-            # Ask for user approval
-            if safety_report['warnings']:
-                print(f"\n⚠️  Avertissements détectés - Confirmer installation? (oui/non): ", end="")
-                response = input().strip().lower()
-                if response != 'oui':
-                    print(f"❌ Installation annulée par l'utilisateur")
-                    failed_installs.append(package_info)
-                    continue
-            
+            elif safety_report['warnings']:
+                needs_confirm.append(package_info)
+            else:
+                to_install.append(package_info)
+    
+    # Ask for user approval, once for all packages with warnings
+    if needs_confirm:
+        names = ", ".join(pkg["name"] for pkg in needs_confirm)
+        print(f"\n⚠️  Avertissements détectés pour: {names}")
+        print(f"Confirmer installation? (oui/non/select): ", end="")
+        response = input().strip().lower()
+        
+        if response == 'oui':
+            approved = {pkg["name"] for pkg in needs_confirm}
+        elif response == 'select':
+            print(f"Packages à installer (séparés par des virgules): ", end="")
+            approved = {name.strip() for name in input().split(",")}
+        else:
+            approved = set()
+        
+        for package_info in needs_confirm:
+            if package_info["name"] in approved:
+                to_install.append(package_info)
+            else:
+                print(f"❌ Installation annulée par l'utilisateur: {package_info['name']}")
+                failed_installs.append(package_info)
+        
+        # Keep the declared installation order
+        to_install.sort(key=required_packages.index)
+    
+    for package_info in to_install:
+        package_name = package_info["name"]
+        
+        print(f"\n🔄 Installation de: {package_name}")
+        print("-" * 40)
+        
+        try:
             # Install package
-            print(f"\n🚀 Installation en cours...")
+            print(f"🚀 Installation en cours...")
             success, message = installer.install_package(
                 package_name=package_name,
                 version=None,
@@ -150,6 +228,7 @@ def main():
                 
                 # Verify installation
                 installed_version = installer._get_installed_version(package_name, default_env)
+                installed_versions[package_name] = installed_version
                 if installed_version:
                     print(f"📦 Version installée: {installed_version}")
             else:
@@ -171,7 +250,7 @@ def main():
     if successful_installs:
         print(f"\n🎉 Packages installés avec succès:")
         for pkg in successful_installs:
-            installed_version = installer._get_installed_version(pkg['name'], default_env)
+            installed_version = installed_versions.get(pkg['name'])
             print(f"   • {pkg['name']}: {installed_version or 'version inconnue'}")
     
     if failed_installs:
@@ -183,35 +262,7 @@ def main():
     print(f"\n🧪 TEST DES INSTALLATIONS")
     print("-" * 30)
     
-    for package_info in successful_installs:
-        package_name = package_info["name"]
-        try:
-            # Test import
-            test_env = {
-                'venv_ninja_moltbot': f"venv_ninja_moltbot\\Scripts\\python.exe" if os.name == 'nt' else "venv_ninja_moltbot/bin/python"
-            }
-            
-            import subprocess
-            test_script = f"""
-import sys
-sys.path.insert(0, 'G:\\\\PROGRAMMES_FILES\\\\Github\\\\Finance_Agent\\\\LABO\\\\GIT STOCKAGE\\\\CREATION\\\\PERSONNAL ASSISTANCE\\\\moltbot\\\\venv_ninja_moltbot\\\\Lib\\\\site-packages')
-try:
-    import {package_name}
-    print(f"✅ {package_name} importé avec succès")
-except ImportError as e:
-    print(f"❌ {package_name} import échoué: {{e}}")
-"""
-            
-            result = subprocess.run([sys.executable, '-c', test_script], 
-                                  capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0:
-                print(f"✅ {package_name}: Test OK")
-            else:
-                print(f"❌ {package_name}: Test échoué - {result.stderr.strip()}")
-                
-        except Exception as e:
-            print(f"❌ {package_name}: Test erreur - {str(e)}")
+    test_imports(env_manager.get_python_path(default_env), successful_installs)
     
     print(f"\n{'='*60}")
     if len(successful_installs) == len(required_packages):
@@ -5,8 +5,169 @@ Simple script to install required packages for WALLACE system
 
 import sys
 import os
+import glob
+import json
+import time
 import subprocess
 
+# Per-environment record of packages this script verified as installed
+INSTALLED_CACHE = os.path.join(os.path.expanduser("~"), ".moltbot", "installed.json")
+
+# Distribution name -> import name, where they differ
+IMPORT_NAMES = {
+    "python-dotenv": "dotenv"
+}
+
+def site_packages_mtime(venv_path):
+    """Latest mtime of the environment's site-packages (changes on install/uninstall)"""
+    candidates = [os.path.join(venv_path, "Lib", "site-packages")]
+    candidates += glob.glob(os.path.join(venv_path, "lib", "python*", "site-packages"))
+    mtimes = []
+    for path in candidates:
+        try:
+            mtimes.append(os.stat(path).st_mtime)
+        except OSError:
+            continue
+    return max(mtimes, default=0.0)
+
+def load_installed_cache(venv_path):
+    """Return {package: version} cached for this env, or {} if missing or stale"""
+    try:
+        with open(INSTALLED_CACHE, "r", encoding="utf-8") as f:
+            entry = json.load(f).get(os.path.abspath(venv_path), {})
+    except (OSError, ValueError):
+        return {}
+    
+    # Anything installed/removed since the cache was written invalidates it
+    if entry.get("checked_at", 0) < site_packages_mtime(venv_path):
+        return {}
+    return entry.get("packages", {})
+
+def save_installed_cache(venv_path, packages):
+    """Record {package: version} as installed in this env"""
+    try:
+        with open(INSTALLED_CACHE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    
+    cache[os.path.abspath(venv_path)] = {
+        "checked_at": time.time(),
+        "packages": packages
+    }
+    
+    try:
+        os.makedirs(os.path.dirname(INSTALLED_CACHE), exist_ok=True)
+        with open(INSTALLED_CACHE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass  # The cache is only an optimization
+
+def list_installed(python_path):
+    """Return {package: version} for everything installed, in one pip call"""
+    try:
+        result = subprocess.run([python_path, "-m", "pip", "list", "--format=json"], 
+                              capture_output=True, text=True, timeout=60)
+        if result.returncode != 0:
+            return {}
+        return {row["name"].lower().replace("_", "-"): row["version"]
+                for row in json.loads(result.stdout)}
+    except (subprocess.TimeoutExpired, ValueError, OSError):
+        return {}
+
+def install_single(python_path, package):
+    """Install one package, returning True on success"""
+    cmd = [python_path, "-m", "pip", "install", package]
+    print(f"Commande: {' '.join(cmd)}")
+    
+    try:
+        result = subprocess.run(cmd, 
+                              stdout=subprocess.DEVNULL, 
+                              stderr=subprocess.PIPE, 
+                              text=True, 
+                              timeout=120)
+    except subprocess.TimeoutExpired:
+        print(f"Timeout: {package}")
+        return False
+    except Exception as e:
+        print(f"ERREUR: {package} - {str(e)}")
+        return False
+    
+    if result.returncode == 0:
+        print(f"Installation reussie: {package}")
+        return True
+    
+    print(f"Echec d'installation: {package}")
+    print(f"Erreur: {result.stderr}")
+    return False
+
+def install_batch(python_path, packages, successful, failed):
+    """Install packages in one pip run, retrying one by one if the batch fails"""
+    # Single pip run for every package: one interpreter start and one
+    # dependency resolution; pip skips requirements that are already satisfied
+    cmd = [python_path, "-m", "pip", "install", *packages]
+    print(f"Commande: {' '.join(cmd)}")
+    
+    try:
+        # Only the exit status matters here; failures are re-run one by one
+        # and report their own errors
+        result = subprocess.run(cmd, 
+                              stdout=subprocess.DEVNULL, 
+                              stderr=subprocess.DEVNULL, 
+                              timeout=120 * len(packages))
+        batch_ok = result.returncode == 0
+    except subprocess.TimeoutExpired:
+        print("Timeout de l'installation groupee")
+        batch_ok = False
+    
+    if batch_ok:
+        print(f"Installation reussie: {', '.join(packages)}")
+        successful.extend(packages)
+    else:
+        # One unresolvable package fails the whole batch: retry one by one
+        # to isolate the culprit(s)
+        print("Echec de l'installation groupee - installation individuelle")
+        for package in packages:
+            print(f"\nInstallation de: {package}")
+            print("-" * 30)
+            
+            if install_single(python_path, package):
+                successful.append(package)
+            else:
+                failed.append(package)
+
+def verify_imports(python_path, packages):
+    """Import every package in one interpreter; isolate failures only if needed"""
+    modules = [IMPORT_NAMES.get(pkg, pkg) for pkg in packages]
+    if not modules:
+        return True
+    
+    try:
+        result = subprocess.run([python_path, "-c", "import " + ", ".join(modules)], 
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if result.returncode == 0:
+            for package in packages:
+                print(f"OK: {package}")
+            return True
+    except Exception:
+        pass
+    
+    # At least one import failed: check individually to report which
+    all_good = True
+    for package, module in zip(packages, modules):
+        try:
+            result = subprocess.run([python_path, "-c", f"import {module}"], 
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result.returncode == 0:
+                print(f"OK: {package}")
+            else:
+                print(f"ERREUR: {package}")
+                all_good = False
+        except:
+            print(f"ERREUR: {package}")
+            all_good = False
+    return all_good
+
 def install_packages():
     """Install required packages using venv_ninja_moltbot"""
     print("============================================================")
@@ -64,53 +225,20 @@ def install_packages():
     successful = []
     failed = []
     
+    # Packages verified on a previous run (and untouched since) need no pip call;
+    # otherwise one pip list tells what is already there
+    installed = load_installed_cache(venv_path)
+    if not all(pkg in installed for pkg in packages):
+        installed = list_installed(python_path)
+    
     for package in packages:
-        print(f"\nInstallation de: {package}")
-        print("-" * 30)
-        
-        try:
-            # First check if package already exists
-            result = subprocess.run([python_path, "-m", "pip", "show", package], 
-                                  capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print(f"Package deja installe: {result.stdout}")
-                successful.append(package)
-                continue
-            
-            # Install package
-            cmd = [python_path, "-m", "pip", "install", package]
-            print(f"Commande: {' '.join(cmd)}")
-            
-            result = subprocess.run(cmd, 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=120)
-            
-            if result.returncode == 0:
-                print(f"Installation reussie: {package}")
-                successful.append(package)
-                
-                # Verify installation
-                verify_result = subprocess.run([python_path, "-c", f"import {package}; print('{package} OK')"], 
-                                            capture_output=True, text=True)
-                
-                if verify_result.returncode == 0:
-                    print(f"Verification: OK")
-                else:
-                    print(f"Verification: ECHOUE - {verify_result.stderr}")
-                    
-            else:
-                print(f"Echec d'installation: {package}")
-                print(f"Erreur: {result.stderr}")
-                failed.append(package)
-                
-        except subprocess.TimeoutExpired:
-            print(f"Timeout: {package}")
-            failed.append(package)
-        except Exception as e:
-            print(f"ERREUR: {package} - {str(e)}")
-            failed.append(package)
+        if package in installed:
+            print(f"Package deja installe: {package}")
+            successful.append(package)
+    
+    to_install = [pkg for pkg in packages if pkg not in installed]
+    if to_install:
+        install_batch(python_path, to_install, successful, failed)
     
     # Summary
     print("\n" + "=" * 60)
@@ -134,19 +262,11 @@ def install_packages():
     print(f"\nVERIFICATION FINALE")
     print("-" * 30)
     
-    all_good = True
-    for package in successful:
-        try:
-            result = subprocess.run([python_path, "-c", f"import {package}"], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"OK: {package}")
-            else:
-                print(f"ERREUR: {package}")
-                all_good = False
-        except:
-            print(f"ERREUR: {package}")
-            all_good = False
+    all_good = verify_imports(python_path, successful)
+    
+    # Only a fully verified set is trusted on the next run
+    if all_good:
+        save_installed_cache(venv_path, {pkg: installed.get(pkg) for pkg in successful})
     
     if len(failed) == 0 and all_good:
         print(f"\n{'='*60}")
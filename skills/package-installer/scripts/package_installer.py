@@ -7,25 +7,204 @@ Handles secure package installation with user approval
 import os
 import sys
 import json
+import atexit
 import subprocess
-import tempfile
-import requests
 import re
-from typing import Dict, List, Optional, Tuple
+import time
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
-import ast
-from pathlib import Path
 
 from environment_manager import EnvironmentManager
 
+# requests, aiohttp and asyncio are imported on first network use: commands
+# like `list` never touch PyPI and shouldn't pay their import time
+
+try:
+    import orjson  # optional: faster parsing of large PyPI documents
+    _loads = orjson.loads
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# PyPI JSON documents are reused across runs for this long (seconds)
+PYPI_CACHE_TTL = 6 * 3600
+
+USER_AGENT = "moltbot-package-installer"
+
+# Upper bound on concurrent PyPI requests; the connection pool is sized to
+# match so every worker reuses a pooled connection (and PyPI isn't hammered
+# into 429s)
+PYPI_MAX_CONNECTIONS = 10
+
+# Shared HTTP session (created on first use): PyPI lookups reuse pooled
+# keep-alive connections instead of paying a TCP+TLS handshake per request.
+# Worker threads share it for plain GETs; that is safe as long as the pool
+# holds one connection per worker (PYPI_MAX_CONNECTIONS)
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> "requests.Session":
+    """Return the shared HTTP session used for PyPI requests"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            session.headers["User-Agent"] = USER_AGENT
+            # Transient PyPI/CDN failures (throttling, 5xx) are retried with
+            # backoff rather than surfacing as "package not found"
+            retry = Retry(
+                total=3, backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(["GET"])
+            )
+            session.mount("https://", HTTPAdapter(
+                pool_connections=10, pool_maxsize=PYPI_MAX_CONNECTIONS, max_retries=retry
+            ))
+            _SESSION = session
+    return _SESSION
+
+
+@lru_cache(maxsize=None)
+def _import_aiohttp():
+    """aiohttp module if installed (optional: concurrent lookups on one event loop)"""
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+    return aiohttp
+
+
+def canonical_name(package_name: str) -> str:
+    """Normalize a distribution name (PEP 503) for lookups"""
+    return re.sub(r"[-_.]+", "-", package_name).lower()
+
+
+def requirement_spec(package_name: str, version: Optional[str] = None) -> str:
+    """pip requirement for a package, pinned when a version is given"""
+    return f"{package_name}=={version}" if version else package_name
+
+
+# General options for every pip run: no PyPI self-version check, never wait
+# on a prompt, no colour/TTY probing
+PIP_BASE = ["--disable-pip-version-check", "--no-input", "--no-color"]
+
+# Extra install options: prefer existing wheels over building sdists
+PIP_INSTALL = [*PIP_BASE, "install", "--prefer-binary"]
+
+
+# Restricts pip to wheels (no sdist builds) when the caller opts in
+ONLY_BINARY = "--only-binary=:all:"
+
+
+# Keywords flagging a suspicious package name (matched anywhere in the name)
+_SUSPICIOUS_RE = re.compile(r"hack|crack|steal|fake|malware|virus", re.IGNORECASE)
+
+
+# "<name>-<version>[-pyX.Y].dist-info" / ".egg-info" entries in site-packages
+_DIST_INFO_RE = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._]*)-([^-]+?)(?:-py[\d.]+)?\.(?:dist|egg)-info$")
+
+
+# "Successfully installed a-1.0 b_c-2.0" line printed by pip install
+_INSTALLED_RE = re.compile(r"^Successfully installed (.+)$", re.MULTILINE)
+
+# requirements.txt line: a bare name, optionally pinned with ==
+_REQUIREMENT_RE = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:==\s*([^\s;]+))?\s*$")
+
+
+def run_pip_streaming(cmd: List[str], timeout: Optional[float] = None, 
+                      tail_lines: int = 200) -> Tuple[int, str]:
+    """Run a pip command echoing its output live; return (exit code, last lines)"""
+    # Only a bounded tail is kept (for errors and the "Successfully installed"
+    # line), so large builds don't accumulate their whole log in memory
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
+                            stdin=subprocess.DEVNULL, text=True, bufsize=1)
+    timed_out = threading.Event()
+    
+    def kill():
+        timed_out.set()
+        proc.kill()
+        
+    timer = threading.Timer(timeout, kill) if timeout else None
+    if timer:
+        timer.start()
+    tail = deque(maxlen=tail_lines)
+    try:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+        proc.wait()
+    finally:
+        if timer:
+            timer.cancel()
+        proc.stdout.close()
+        
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode, "".join(tail)
+
+
+@lru_cache(maxsize=512)
+def _fetch_pypi_info(package_name: str) -> Optional[Dict]:
+    """Fetch a package's PyPI JSON document (None if the package does not exist)"""
+    # Memoized per process; network errors raise, so they are not cached
+    response = get_session().get(f"https://pypi.org/pypi/{package_name}/json", timeout=10)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    # Parse the raw bytes (skips requests' text decoding step)
+    return _loads(response.content)
+
+
+async def _aio_fetch_all(package_names: List[str]) -> List[Optional[Dict]]:
+    """Fetch several PyPI JSON documents concurrently (None for missing/failed)"""
+    import asyncio
+    aiohttp = _import_aiohttp()
+    
+    connector = aiohttp.TCPConnector(limit=PYPI_MAX_CONNECTIONS, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=10)
+    headers = {"User-Agent": USER_AGENT}
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, 
+                                     headers=headers) as session:
+        async def fetch(package_name: str) -> Optional[Dict]:
+            try:
+                async with session.get(f"https://pypi.org/pypi/{package_name}/json") as response:
+                    if response.status != 200:
+                        return None
+                    return _loads(await response.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Warning: Could not fetch package info for {package_name}: {e}")
+                return None
+                
+        return await asyncio.gather(*(fetch(name) for name in package_names))
+
 
 class PackageInstaller:
     """Handles secure package installation with user approval"""
     
-    def __init__(self, base_path: str = None):
+    def __init__(self, base_path: str = None, use_pypi_cache: bool = True):
         self.base_path = base_path or "G:\\PROGRAMMES_FILES\\Github\\Finance_Agent\\LABO\\GIT STOCKAGE\\CREATION\\PERSONNAL ASSISTANCE\\moltbot"
         self.env_manager = EnvironmentManager(self.base_path)
         self.log_file = os.path.join(self.base_path, "package_installation.log")
+        # One JSON file per package, valid for PYPI_CACHE_TTL
+        self.pypi_cache_dir = os.path.join(self.base_path, ".pypi_cache")
+        self.use_pypi_cache = use_pypi_cache
+        # Log lines waiting to be appended in one write (see flush_logs)
+        self._pending_logs: List[str] = []
+        atexit.register(self.flush_logs)
+        # env -> {canonical package name: version}, from one `pip list` per env
+        self._installed_cache: Dict[str, Dict[str, str]] = {}
         self.ensure_log_file()
         
     def ensure_log_file(self):
@@ -33,29 +212,25 @@ class PackageInstaller:
         os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
         
     def install_package(self, package_name: str, version: str = None, 
-                       env_name: str = None, force: bool = False) -> Tuple[bool, str]:
+                       env_name: str = None, force: bool = False, 
+                       binary_only: bool = False) -> Tuple[bool, str]:
         """Install a package with user approval"""
         
         # Get environment information
-        if env_name:
-            env_info = self.env_manager.get_environment_info(env_name)
-            if not env_info:
-                return False, f"Environment '{env_name}' not found"
-        else:
-            # Use default environment
-            env_name = "venv_ninja_moltbot"
-            env_info = self.env_manager.get_environment_info(env_name)
-            if not env_info:
-                # Create default environment if it doesn't exist
-                success, message = self.env_manager.create_environment(env_name)
-                if not success:
-                    return False, message
-                env_info = self.env_manager.get_environment_info(env_name)
-                
+        env_name, error = self._resolve_environment(env_name)
+        if error:
+            return False, error
+            
         pip_path = self.env_manager.get_pip_path(env_name)
         
+        # Forced installs show no banner or security check: skip the PyPI
+        # lookup and go straight to pip
+        if force:
+            return self._run_install(package_name, version, env_name, 
+                                     {"name": package_name, "version": version}, binary_only)
+            
         # Check if package is already installed
-        if not force and self._is_package_installed(package_name, env_name):
+        if self._is_package_installed(package_name, env_name):
             return True, f"Package '{package_name}' is already installed in '{env_name}'"
             
         # Get package information
@@ -70,69 +245,185 @@ class PackageInstaller:
             "size": package_info.get("size", "Unknown"),
             "description": package_info.get("description", ""),
             "author": package_info.get("author", ""),
-            "dependencies": package_info.get("dependencies", []),
+            "dependencies_count": package_info.get("dependencies_count", 0),
             "last_updated": package_info.get("last_updated", ""),
             "environment": env_name,
             "pip_path": pip_path
         }
         
         # Ask for user approval
-        if not force:
-            print(f"\n📦 PACKAGE INSTALLATION REQUEST:")
+        print(f"\n📦 PACKAGE INSTALLATION REQUEST:")
+        print(f"{'='*50}")
+        print(f"Package: {package_name}")
+        print(f"Version: {install_details['version']}")
+        print(f"Environment: {env_name}")
+        print(f"Size: {install_details['size']}")
+        print(f"Description: {install_details['description']}")
+        print(f"Author: {install_details['author']}")
+        print(f"Dependencies: {install_details['dependencies_count']} packages")
+        print(f"Last Updated: {install_details['last_updated']}")
+        
+        # Check security
+        security_check = self._check_package_security(package_name, install_details['version'], package_info)
+        print(f"\n🔒 SECURITY CHECK:")
+        print(f"Status: {security_check['status']}")
+        print(f"Source: {security_check['source']}")
+        print(f"License: {security_check['license']}")
+        
+        if security_check['warnings']:
+            print(f"\n⚠️  WARNINGS:")
+            for warning in security_check['warnings']:
+                print(f"  • {warning}")
+                
+        print(f"\n{'='*50}")
+        print(f"Approve installation? (yes/no/skip): ", end="")
+        response = input().strip().lower()
+        
+        if response == 'skip':
+            return True, "Installation skipped by user"
+        elif response != 'yes':
+            return False, "Installation cancelled by user"
+            
+        # Perform installation
+        return self._run_install(package_name, version, env_name, package_info, binary_only)
+        
+    def install_packages(self, specs: List[Tuple[str, Optional[str]]], env_name: str = None, 
+                         force: bool = False, max_workers: int = PYPI_MAX_CONNECTIONS, 
+                         binary_only: bool = False) -> List[Tuple[str, bool, str]]:
+        """Install several (name, version) packages with a single approval"""
+        env_name, error = self._resolve_environment(env_name)
+        if error:
+            return [(name, False, error) for name, _ in specs]
+            
+        results = []
+        pending = []
+        for name, version in specs:
+            if not force and self._is_package_installed(name, env_name):
+                results.append((name, True, f"Package '{name}' is already installed in '{env_name}'"))
+            else:
+                pending.append((name, version))
+                
+        # PyPI lookups are independent network round trips: overlap them
+        # (forced installs skip them, as they show no approval table)
+        if force:
+            infos = [{"name": name, "version": version} for name, version in pending]
+        else:
+            infos = self._get_many_package_infos([name for name, _ in pending], max_workers)
+            
+        approved = []
+        for (name, version), package_info in zip(pending, infos):
+            if package_info:
+                approved.append((name, version, package_info))
+            else:
+                results.append((name, False, f"Package '{name}' not found in PyPI"))
+                
+        # Ask for user approval once for the whole batch
+        if approved and not force:
+            print(f"\n📦 PACKAGE INSTALLATION REQUEST ({len(approved)} packages):")
             print(f"{'='*50}")
-            print(f"Package: {package_name}")
-            print(f"Version: {install_details['version']}")
-            print(f"Environment: {env_name}")
-            print(f"Size: {install_details['size']}")
-            print(f"Description: {install_details['description']}")
-            print(f"Author: {install_details['author']}")
-            print(f"Dependencies: {len(install_details['dependencies'])} packages")
-            print(f"Last Updated: {install_details['last_updated']}")
-            
-            # Check security
-            security_check = self._check_package_security(package_name, install_details['version'])
-            print(f"\n🔒 SECURITY CHECK:")
-            print(f"Status: {security_check['status']}")
-            print(f"Source: {security_check['source']}")
-            print(f"License: {security_check['license']}")
-            
-            if security_check['warnings']:
-                print(f"\n⚠️  WARNINGS:")
+            now = datetime.now()  # one reference time for the whole batch
+            for name, version, package_info in approved:
+                security_check = self._check_package_security(
+                    name, version or package_info["version"], package_info, now
+                )
+                print(f"{name:<25} {version or package_info['version']:<12} "
+                      f"{package_info['size']:<10} {security_check['status']}")
                 for warning in security_check['warnings']:
-                    print(f"  • {warning}")
+                    print(f"  ⚠️  {warning}")
                     
             print(f"\n{'='*50}")
-            print(f"Approve installation? (yes/no/skip): ", end="")
+            print(f"Approve installation of {len(approved)} packages? (yes/no): ", end="")
             response = input().strip().lower()
             
-            if response == 'skip':
-                return True, "Installation skipped by user"
-            elif response != 'yes':
-                return False, "Installation cancelled by user"
+            if response != 'yes':
+                results.extend((name, False, "Installation cancelled by user") 
+                               for name, _, _ in approved)
+                approved = []
                 
-        # Perform installation
+        # One pip run for the whole batch (one interpreter start, one resolve);
+        # pip installs nothing if any requirement fails, so isolate failures
+        # with sequential per-package runs (concurrent pip runs in one
+        # environment can overwrite each other's shared dependencies)
+        if len(approved) > 1 and self._run_install_batch(approved, env_name, binary_only):
+            for name, _, _ in approved:
+                installed_version = self._get_installed_version(name, env_name)
+                message = f"Package '{name}' successfully installed in '{env_name}'"
+                if installed_version:
+                    message += f" (version {installed_version})"
+                results.append((name, True, message))
+        else:
+            for name, version, package_info in approved:
+                results.append((name, *self._run_install(name, version, env_name, package_info, 
+                                                         binary_only)))
+            
+        # Report in the order the packages were requested
+        order = {name: index for index, (name, _) in enumerate(specs)}
+        results.sort(key=lambda result: order[result[0]])
+        self.flush_logs()
+        return results
+        
+    def _resolve_environment(self, env_name: str = None) -> Tuple[str, Optional[str]]:
+        """Return (env_name, error), creating the default environment if needed"""
+        if env_name:
+            if not self.env_manager.get_environment_info(env_name):
+                return env_name, f"Environment '{env_name}' not found"
+            return env_name, None
+            
+        # Use default environment
+        env_name = "venv_ninja_moltbot"
+        if not self.env_manager.get_environment_info(env_name):
+            # Create default environment if it doesn't exist
+            success, message = self.env_manager.create_environment(env_name)
+            if not success:
+                return env_name, message
+        return env_name, None
+        
+    def _run_install_batch(self, approved: List[Tuple[str, Optional[str], Dict]], 
+                           env_name: str, binary_only: bool = False) -> bool:
+        """Install several approved packages in a single pip run"""
+        pip_path = self.env_manager.get_pip_path(env_name)
+        specs = [requirement_spec(name, version) for name, version, _ in approved]
+        cmd = [pip_path, *PIP_INSTALL, *specs]
+        if binary_only:
+            cmd.append(ONLY_BINARY)
+        
+        print(f"\n🚀 INSTALLING {len(approved)} PACKAGES: {', '.join(specs)}...")
+        try:
+            returncode, output = run_pip_streaming(cmd, timeout=300 * len(approved))
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+            
+        if returncode != 0:
+            print("⚠️  Batch installation failed - installing packages one by one")
+            return False
+            
+        self._record_installed(env_name, output)
+        for _, _, package_info in approved:
+            self._log_installation(package_info, True)
+        return True
+        
+    def _run_install(self, package_name: str, version: Optional[str], env_name: str, 
+                     package_info: Dict, binary_only: bool = False) -> Tuple[bool, str]:
+        """Run pip install for an approved package"""
+        pip_path = self.env_manager.get_pip_path(env_name)
+        
         try:
             print(f"\n🚀 INSTALLING PACKAGE: {package_name}...")
             
-            # Build installation command
-            cmd = [pip_path, "install"]
-            if version:
-                cmd.extend(["==", version])
-            cmd.append(package_name)
-            
-            # Run installation
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutes timeout
-            )
+            # Build installation command ("name==version" must be one argument)
+            cmd = [pip_path, *PIP_INSTALL, requirement_spec(package_name, version)]
+            if binary_only:
+                cmd.append(ONLY_BINARY)
             
-            if result.returncode == 0:
+            # Run installation, showing pip's progress as it goes
+            returncode, output = run_pip_streaming(cmd, timeout=300)  # 5 minutes timeout
+            
+            if returncode == 0:
                 # Log successful installation
                 self._log_installation(package_info, True)
                 
-                # Verify installation
+                # Record what pip reports as installed (dependencies included)
+                self._record_installed(env_name, output)
                 installed_version = self._get_installed_version(package_name, env_name)
                 
                 success_message = f"Package '{package_name}' successfully installed in '{env_name}'"
@@ -143,8 +434,8 @@ class PackageInstaller:
                 
             else:
                 # Log failed installation
-                self._log_installation(package_info, False, result.stderr)
-                return False, f"Installation failed: {result.stderr}"
+                self._log_installation(package_info, False, output)
+                return False, f"Installation failed: {output}"
                 
         except subprocess.TimeoutExpired:
             error_msg = f"Installation timeout for package '{package_name}'"
@@ -158,73 +449,189 @@ class PackageInstaller:
             
     def _is_package_installed(self, package_name: str, env_name: str) -> bool:
         """Check if package is already installed"""
-        try:
-            pip_path = self.env_manager.get_pip_path(env_name)
-            result = subprocess.run([
-                pip_path, "show", package_name
-            ], capture_output=True, text=True)
-            
-            return result.returncode == 0
-        except:
-            return False
+        return self._get_installed_version(package_name, env_name) is not None
             
     def _get_installed_version(self, package_name: str, env_name: str) -> Optional[str]:
         """Get version of installed package"""
-        try:
-            pip_path = self.env_manager.get_pip_path(env_name)
-            result = subprocess.run([
-                pip_path, "show", package_name
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                # Parse version from pip show output
-                for line in result.stdout.split('\n'):
-                    if line.startswith('Version:'):
-                        return line.split(':', 1)[1].strip()
-        except:
-            pass
-        return None
+        return self._get_installed_map(env_name).get(canonical_name(package_name))
         
-    def _get_package_info(self, package_name: str) -> Optional[Dict]:
-        """Get package information from PyPI"""
-        try:
-            url = f"https://pypi.org/pypi/{package_name}/json"
-            response = requests.get(url, timeout=10)
+    def _get_installed_map(self, env_name: str) -> Dict[str, str]:
+        """Installed packages of an environment, listed once and then kept up to date"""
+        if env_name not in self._installed_cache:
+            installed = self._scan_site_packages(env_name)
+            if installed is not None:
+                self._installed_cache[env_name] = installed
+                return installed
+                
+            installed = {}
+            try:
+                pip_path = self.env_manager.get_pip_path(env_name)
+                result = subprocess.run([
+                    pip_path, *PIP_BASE, "list", "--format=json"
+                ], capture_output=True, text=True)
+                
+                if result.returncode == 0:
+                    installed = {canonical_name(pkg["name"]): pkg["version"] 
+                                 for pkg in json.loads(result.stdout)}
+            except:
+                pass
+            self._installed_cache[env_name] = installed
+        return self._installed_cache[env_name]
+        
+    def _scan_site_packages(self, env_name: str) -> Optional[Dict[str, str]]:
+        """Read installed versions from site-packages metadata directory names"""
+        # A directory listing instead of a pip subprocess; None if there is no
+        # site-packages to read (the caller then asks pip)
+        installed = None
+        for site_packages in self.env_manager.get_site_packages_dirs(env_name):
+            try:
+                names = os.listdir(site_packages)
+            except OSError:
+                continue
+            installed = installed or {}
+            for name in names:
+                match = _DIST_INFO_RE.match(name)
+                if match:
+                    installed[canonical_name(match.group(1))] = match.group(2)
+        return installed
+        
+    def _record_installed(self, env_name: str, pip_output: str):
+        """Update the installed-package cache from pip install output"""
+        match = _INSTALLED_RE.search(pip_output or "")
+        if not match or env_name not in self._installed_cache:
+            # Nothing parseable: list the environment again on next lookup
+            self._installed_cache.pop(env_name, None)
+            return
+        installed = self._installed_cache[env_name]
+        for item in match.group(1).split():
+            name, _, version = item.rpartition("-")
+            if name:
+                installed[canonical_name(name)] = version
+        
+    def _get_many_package_infos(self, package_names: List[str], 
+                                max_workers: int = PYPI_MAX_CONNECTIONS) -> List[Optional[Dict]]:
+        """Get package information for several packages concurrently"""
+        if not package_names:
+            return []
             
-            if response.status_code == 200:
-                data = response.json()
+        if _import_aiohttp() is None:
+            # No aiohttp: the same lookups on a thread pool over the shared session,
+            # never more workers than pooled connections
+            from concurrent.futures import ThreadPoolExecutor
+            workers = min(max_workers, PYPI_MAX_CONNECTIONS, len(package_names))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(self._get_package_info, package_names))
                 
-                # Extract package information
-                info = {
-                    "name": data["info"]["name"],
-                    "version": data["info"]["version"],
-                    "description": data["info"]["summary"] or "",
-                    "author": data["info"]["author"] or "",
-                    "license": data["info"]["license"] or "Unknown",
-                    "last_updated": data["info"]["upload_time"],
-                    "size": self._estimate_package_size(data),
-                    "dependencies": self._extract_dependencies(data),
-                    "downloads": data["info"].get("downloads", 0),
-                    "home_page": data["info"].get("home_page", "")
-                }
+        documents = {name: self._load_cached_pypi(name) for name in package_names}
+        missing = [name for name, data in documents.items() if data is None]
+        if missing:
+            import asyncio
+            for package_name, data in zip(missing, asyncio.run(_aio_fetch_all(missing))):
+                if data:
+                    self._store_cached_pypi(package_name, data)
+                documents[package_name] = data
                 
-                return info
+        infos = []
+        for package_name in package_names:
+            data = documents[package_name]
+            try:
+                infos.append(self._parse_package_info(data) if data else None)
+            except Exception as e:
+                print(f"Warning: Could not fetch package info: {e}")
+                infos.append(None)
+        return infos
+        
+    def _get_package_info(self, package_name: str, include_deps: bool = False) -> Optional[Dict]:
+        """Get package information from PyPI"""
+        try:
+            data = self._load_cached_pypi(package_name)
+            if data is None:
+                data = _fetch_pypi_info(package_name)
+                if data:
+                    self._store_cached_pypi(package_name, data)
+            
+            if data:
+                return self._parse_package_info(data, include_deps)
                 
         except Exception as e:
             print(f"Warning: Could not fetch package info: {e}")
             
         return None
         
+    def _pypi_cache_path(self, package_name: str) -> str:
+        """Disk cache file for a package's PyPI document"""
+        safe_name = re.sub(r"[^a-z0-9._-]", "_", package_name.lower())
+        return os.path.join(self.pypi_cache_dir, f"{safe_name}.json")
+        
+    def _load_cached_pypi(self, package_name: str) -> Optional[Dict]:
+        """Return the cached PyPI document if present and fresh"""
+        if not self.use_pypi_cache:
+            return None
+        path = self._pypi_cache_path(package_name)
+        try:
+            if time.time() - os.stat(path).st_mtime > PYPI_CACHE_TTL:
+                return None
+            with open(path, 'rb') as f:
+                return _loads(f.read())
+        except (OSError, ValueError):
+            return None
+            
+    def _store_cached_pypi(self, package_name: str, data: Dict):
+        """Save a PyPI document to the disk cache (best effort)"""
+        if not self.use_pypi_cache:
+            return
+        path = self._pypi_cache_path(package_name)
+        try:
+            os.makedirs(self.pypi_cache_dir, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(_dumps(data))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+            
+    def _parse_package_info(self, data: Dict, include_deps: bool = False) -> Dict:
+        """Extract package information from a PyPI JSON document"""
+        info = {
+            "name": data["info"]["name"],
+            "version": data["info"]["version"],
+            "description": data["info"]["summary"] or "",
+            "author": data["info"]["author"] or "",
+            "license": data["info"]["license"] or "Unknown",
+            "last_updated": self._latest_upload_time(data),
+            "size": self._estimate_package_size(data),
+            "dependencies_count": len(data["info"].get("requires_dist") or ()),
+            "downloads": data["info"].get("downloads", 0),
+            "home_page": data["info"].get("home_page", "")
+        }
+        
+        # The full requirement list can run to hundreds of strings; most
+        # callers only show the count
+        if include_deps:
+            info["dependencies"] = self._extract_dependencies(data)
+            
+        return info
+        
+    def _latest_upload_time(self, package_data: Dict) -> str:
+        """Upload time of the newest file of the current release ("" if none)"""
+        # The "info" block has no upload time; each release file carries one,
+        # as an ISO string ("2024-01-31T12:00:00"), so the max is the latest
+        return max((u.get("upload_time") or "" for u in package_data.get("urls", ())), default="")
+        
     def _estimate_package_size(self, package_data: Dict) -> str:
         """Estimate package size from PyPI data"""
         try:
-            urls = package_data.get("urls", [])
-            wheels = [u for u in urls if u.get("packagetype") == "bdist_wheel"]
-            
-            if wheels:
-                largest = max(wheels, key=lambda x: x.get("size", 0))
-                size_bytes = largest.get("size", 0)
-                return self._format_size(size_bytes)
+            # Largest wheel, in one pass over the release files
+            largest = None
+            for url in package_data.get("urls", ()):
+                if url.get("packagetype") == "bdist_wheel":
+                    size = url.get("size") or 0
+                    if largest is None or size > largest:
+                        largest = size
+                        
+            if largest is not None:
+                return self._format_size(largest)
                 
             return "Unknown"
             
@@ -258,8 +665,9 @@ class PackageInstaller:
         except:
             return []
             
-    def _check_package_security(self, package_name: str, version: str) -> Dict:
-        """Check package security"""
+    def _check_package_security(self, package_name: str, version: str, 
+                                package_info: Dict = None, now: datetime = None) -> Dict:
+        """Check package security (reusing package_info if already fetched)"""
         security_info = {
             "status": "✓ Safe",
             "source": "PyPI Official",
@@ -269,7 +677,8 @@ class PackageInstaller:
         
         try:
             # Get package info for security check
-            package_info = self._get_package_info(package_name)
+            if package_info is None:
+                package_info = self._get_package_info(package_name)
             if package_info:
                 security_info["license"] = package_info["license"]
                 
@@ -278,15 +687,14 @@ class PackageInstaller:
                     security_info["warnings"].append("MIT License - Permissive but review carefully")
                     
                 # Check for suspicious package names
-                if any(keyword in package_name.lower() for keyword in 
-                       ["hack", "crack", "steal", "fake", "malware", "virus"]):
+                if _SUSPICIOUS_RE.search(package_name):
                     security_info["status"] = "⚠️  Suspicious name"
                     security_info["warnings"].append("Package name contains suspicious keywords")
                     
                 # Check for recently created packages
                 if package_info["last_updated"]:
-                    upload_time = datetime.strptime(package_info["last_updated"], "%Y-%m-%dT%H:%M:%S")
-                    days_old = (datetime.now() - upload_time).days
+                    upload_time = datetime.fromisoformat(package_info["last_updated"].rstrip("Z"))
+                    days_old = ((now or datetime.now()) - upload_time).days
                     
                     if days_old < 30:
                         security_info["warnings"].append(f"Package created {days_old} days ago - review carefully")
@@ -307,9 +715,17 @@ class PackageInstaller:
             "environment": "venv_ninja_moltbot"
         }
         
+        # Buffered: a batch of installs costs one open/write/close
+        self._pending_logs.append(_dumps(log_entry) + "\n")
+        
+    def flush_logs(self):
+        """Append buffered log entries to the log file"""
+        if not self._pending_logs:
+            return
+        lines, self._pending_logs = self._pending_logs, []
         try:
-            with open(self.log_file, "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
+            with open(self.log_file, "a", buffering=8192) as f:
+                f.write("".join(lines))
         except:
             pass  # Ignore logging errors
             
@@ -327,7 +743,7 @@ class PackageInstaller:
                 pip_path = self.env_manager.get_pip_path(env_name)
                 
             result = subprocess.run([
-                pip_path, "list", "--format=json"
+                pip_path, *PIP_BASE, "list", "--format=json"
             ], capture_output=True, text=True)
             
             if result.returncode == 0:
@@ -359,87 +775,153 @@ class PackageInstaller:
             if response != 'yes':
                 return True, "Uninstallation cancelled by user"
                 
-            result = subprocess.run([
-                pip_path, "uninstall", "-y", package_name
-            ], capture_output=True, text=True)
+            returncode, output = run_pip_streaming([
+                pip_path, *PIP_BASE, "uninstall", "-y", package_name
+            ])
             
-            if result.returncode == 0:
+            if returncode == 0:
+                self._installed_cache.get(env_name, {}).pop(canonical_name(package_name), None)
                 return True, f"Package '{package_name}' uninstalled successfully"
             else:
-                return False, f"Uninstallation failed: {result.stderr}"
+                return False, f"Uninstallation failed: {output}"
                 
         except Exception as e:
             return False, f"Uninstallation error: {str(e)}"
 
 
-def main():
-    """Main function for CLI usage"""
-    if len(sys.argv) < 2:
-        print("Usage: python package_installer.py <command> [args]")
-        print("Commands:")
-        print("  install <package> [version] [env]  - Install package")
-        print("  uninstall <package> [env]          - Uninstall package")
-        print("  list [env]                        - List installed packages")
-        print("  info <package>                    - Get package information")
+def read_requirements(path: str) -> List[Tuple[str, Optional[str]]]:
+    """Parse a requirements file into (name, pinned version or None) pairs"""
+    specs = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            match = _REQUIREMENT_RE.match(line)
+            if match:
+                specs.append((match.group(1), match.group(2)))
+            else:
+                print(f"Unsupported requirement skipped: {line}")
+    return specs
+
+
+LIST_HEADER = f"{'Name':<30} {'Version':<15} {'Location':<25}"
+LIST_SEPARATOR = "-" * 70
+
+
+def _cmd_install(installer: PackageInstaller, args: List[str], options: Dict):
+    """install <package> [version] [env]"""
+    if len(args) < 1:
+        print("Usage: python package_installer.py install <package> [version] [env]")
         sys.exit(1)
         
-    installer = PackageInstaller()
-    command = sys.argv[1].lower()
+    package_name = args[0]
+    version = args[1] if len(args) > 1 else None
+    env_name = args[2] if len(args) > 2 else None
     
-    if command == "install":
-        if len(sys.argv) < 3:
-            print("Usage: python package_installer.py install <package> [version] [env]")
-            sys.exit(1)
-            
-        package_name = sys.argv[2]
-        version = sys.argv[3] if len(sys.argv) > 3 else None
-        env_name = sys.argv[4] if len(sys.argv) > 4 else None
-        
-        success, message = installer.install_package(package_name, version, env_name)
-        print(message)
+    success, message = installer.install_package(package_name, version, env_name, 
+                                                 binary_only=options["binary_only"])
+    print(message)
+    
+    
+def _cmd_install_many(installer: PackageInstaller, args: List[str], options: Dict):
+    """install-many <requirements.txt> [env]"""
+    if len(args) < 1:
+        print("Usage: python package_installer.py install-many <requirements.txt> [env]")
+        sys.exit(1)
         
-    elif command == "uninstall":
-        if len(sys.argv) < 3:
-            print("Usage: python package_installer.py uninstall <package> [env]")
-            sys.exit(1)
-            
-        package_name = sys.argv[2]
-        env_name = sys.argv[3] if len(sys.argv) > 3 else None
+    specs = read_requirements(args[0])
+    env_name = args[1] if len(args) > 1 else None
+    
+    for name, success, message in installer.install_packages(specs, env_name, 
+                                                             binary_only=options["binary_only"]):
+        print(f"{'✅' if success else '❌'} {name}: {message}")
         
-        success, message = installer.uninstall_package(package_name, env_name)
-        print(message)
         
-    elif command == "list":
-        env_name = sys.argv[2] if len(sys.argv) > 2 else None
+def _cmd_uninstall(installer: PackageInstaller, args: List[str], options: Dict):
+    """uninstall <package> [env]"""
+    if len(args) < 1:
+        print("Usage: python package_installer.py uninstall <package> [env]")
+        sys.exit(1)
         
-        packages = installer.list_installed_packages(env_name)
-        if not packages:
-            print("No packages found")
-        else:
-            print(f"{'Name':<30} {'Version':<15} {'Location':<25}")
-            print("-" * 70)
-            for pkg in packages:
-                name = pkg.get("name", "Unknown")
-                version = pkg.get("version", "Unknown")
-                env = env_name or "venv_ninja_moltbot"
-                print(f"{name:<30} {version:<15} {env:<25}")
-                
-    elif command == "info":
-        if len(sys.argv) < 3:
-            print("Usage: python package_installer.py info <package>")
-            sys.exit(1)
+    package_name = args[0]
+    env_name = args[1] if len(args) > 1 else None
+    
+    success, message = installer.uninstall_package(package_name, env_name)
+    print(message)
+    
+    
+def _cmd_list(installer: PackageInstaller, args: List[str], options: Dict):
+    """list [env]"""
+    env_name = args[0] if args else None
+    
+    packages = installer.list_installed_packages(env_name)
+    if not packages:
+        print("No packages found")
+    else:
+        # One write for the whole table: large envs list hundreds of rows
+        env = env_name or "venv_ninja_moltbot"
+        rows = [f"{pkg.get('name', 'Unknown'):<30} {pkg.get('version', 'Unknown'):<15} {env:<25}"
+                for pkg in packages]
+        sys.stdout.write("\n".join([LIST_HEADER, LIST_SEPARATOR, *rows]) + "\n")
             
-        package_name = sys.argv[2]
-        package_info = installer._get_package_info(package_name)
-        
-        if package_info:
-            print(json.dumps(package_info, indent=2))
-        else:
-            print(f"Package information for '{package_name}' not found")
             
+def _cmd_info(installer: PackageInstaller, args: List[str], options: Dict):
+    """info <package>"""
+    if len(args) < 1:
+        print("Usage: python package_installer.py info <package>")
+        sys.exit(1)
+        
+    package_name = args[0]
+    package_info = installer._get_package_info(package_name, include_deps=True)
+    
+    if package_info:
+        print(json.dumps(package_info, indent=2))
     else:
+        print(f"Package information for '{package_name}' not found")
+        
+        
+# CLI command -> handler(installer, positional args, options)
+COMMANDS: Dict[str, Callable[[PackageInstaller, List[str], Dict], None]] = {
+    "install": _cmd_install,
+    "install-many": _cmd_install_many,
+    "uninstall": _cmd_uninstall,
+    "list": _cmd_list,
+    "info": _cmd_info,
+}
+
+
+def main():
+    """Main function for CLI usage"""
+    # Options may appear anywhere; strip them before positional parsing
+    options = {
+        "use_pypi_cache": "--no-cache" not in sys.argv,
+        "binary_only": "--only-binary" in sys.argv
+    }
+    args = [arg for arg in sys.argv[1:] if arg not in ("--no-cache", "--only-binary")]
+    
+    if not args:
+        print("Usage: python package_installer.py <command> [args]")
+        print("Commands:")
+        print("  install <package> [version] [env]  - Install package")
+        print("  install-many <requirements> [env]  - Install packages from a requirements file")
+        print("  uninstall <package> [env]          - Uninstall package")
+        print("  list [env]                        - List installed packages")
+        print("  info <package>                    - Get package information")
+        print("Options:")
+        print("  --no-cache                        - Ignore the cached PyPI metadata")
+        print("  --only-binary                     - Install wheels only (no source builds)")
+        sys.exit(1)
+        
+    command = args[0].lower()
+    handler = COMMANDS.get(command)
+    if handler is None:
         print(f"Unknown command: {command}")
+        return
+        
+    installer = PackageInstaller(use_pypi_cache=options["use_pypi_cache"])
+    handler(installer, args[1:], options)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -7,21 +7,84 @@ Performs security validation of packages before installation
 import os
 import sys
 import json
-import requests
-import hashlib
-import subprocess
 import re
-from typing import Dict, List, Optional, Set, Tuple
-from datetime import datetime, timedelta
-import tempfile
-import shutil
-from urllib.parse import urlparse
+import time
+import threading
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from packaging.specifiers import SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+try:
+    import ahocorasick  # pyahocorasick: optional C-level multi-pattern matcher
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # optional: faster (de)serialization of PyPI documents and reports
+    _loads = orjson.loads
+    
+    def _dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, default=str, indent=2 if indent else None, 
+                          ensure_ascii=False).encode("utf-8")
+
+# PyPI documents are reused across runs for this long (seconds)
+PYPI_CACHE_TTL = 6 * 3600
+PYPI_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".moltbot", "pypi_cache")
+
+# Vulnerability database (https://osv.dev) queried per package version
+OSV_QUERY_URL = "https://api.osv.dev/v1/query"
+# Many versions in one request (at most OSV_BATCH_SIZE queries each)
+OSV_QUERYBATCH_URL = "https://api.osv.dev/v1/querybatch"
+OSV_BATCH_SIZE = 1000
+
+# Offline fallback when OSV can't be reached: name -> affected versions
+VULNERABLE_PACKAGES = {
+    "requests": SpecifierSet("<2.25.0"),
+    "django": SpecifierSet("<3.2.0"),
+    "flask": SpecifierSet("<2.0.0"),
+    "sqlalchemy": SpecifierSet("<1.4.0")
+}
+
+# Permissive but review-required licenses, lowercased for matching
+PERMISSIVE_LICENSES = ("mit", "apache", "bsd", "gpl")
+
+# Accepted package names; \Z (unlike $) doesn't let a trailing newline through
+_PKG_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]*\Z')
+
+# Leading comparison operator of a requirement-style version ("==1.0", ">=2")
+VERSION_OPERATORS = "<>=!~"
+
+
+# Outcome of one check; only turned into a dict for the final report
+CheckResult = namedtuple("CheckResult", "status issues warnings details")
+
+
+@dataclass
+class _ScoreAccumulator:
+    """Running score and findings of one package's checks"""
+    score: int = 100
+    critical_issues: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    has_suspicious: bool = False
 
 
 class SecurityChecker:
     """Performs security validation of Python packages"""
     
-    def __init__(self):
+    # Hosts PyPI serves package files from
+    TRUSTED_DOMAINS = frozenset({"pypi.org", "files.pythonhosted.org"})
+    
+    def __init__(self, use_cache: bool = True, cache_dir: str = None, 
+                 probe_source_urls: bool = False):
         self.trusted_sources = [
             "https://pypi.org",
             "https://conda-forge.org"
@@ -40,253 +103,259 @@ class SecurityChecker:
             r"virus",
             r"backdoor",
             r"rootkit"
-        }
+        ]
+        # All patterns in one case-insensitive pass; the lookahead reports
+        # overlapping matches too, so each pattern is found as before
+        self._malicious_re = re.compile(
+            "(?=(" + "|".join(self.malicious_patterns) + "))", re.IGNORECASE
+        )
+        # Same scan as a native Aho-Corasick automaton when available
+        self._malicious_automaton = self._build_automaton(self.malicious_patterns)
         
         # Common suspicious extensions
-        self.suspicious_extensions = [
+        self.suspicious_extensions = frozenset({
             ".exe", ".dll", ".so", ".dylib", ".app", ".scr", ".bat", ".cmd", ".ps1"
-        ]
+        })
+        # str.endswith() takes a tuple: every extension tested in one call
+        self._suspicious_suffixes = tuple(self.suspicious_extensions)
         
         # High-risk packages (use with caution)
-        self.high_risk_packages = [
+        self.high_risk_packages = frozenset({
             "pip", "setuptools", "wheel", "cython", "numpy", "pandas"
-        ]
+        })
         
-    def check_package_safety(self, package_name: str, version: str = None) -> Dict:
-        """Comprehensive safety check for a package"""
+        # (package, version) -> Future of (HTTP status, parsed JSON); every
+        # check reads the same PyPI document, so it's fetched only once even
+        # when the checks run concurrently
+        self._pypi_cache: Dict[Tuple[str, Optional[str]], Future] = {}
+        self._pypi_lock = threading.Lock()
+        # One JSON file per (package, version), valid for PYPI_CACHE_TTL
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir or PYPI_CACHE_DIR
+        # Also check that the declared source URL answers (one more request)
+        self.probe_source_urls = probe_source_urls
+        # (package, version) -> OSV records, or the error of a failed query
+        self._osv_cache: Dict[Tuple[str, str], object] = {}
         
-        safety_report = {
-            "package": package_name,
-            "version": version or "latest",
-            "overall_status": "SAFE",
-            "checks": {},
-            "recommendations": [],
-            "critical_issues": [],
-            "warnings": [],
-            "score": 100
-        }
+        # Pooled keep-alive connections (created on first network use): the
+        # concurrent checks and every package checked by this instance share
+        # TLS sessions to PyPI
+        self._session = None
+        
+    def check_package_safety(self, package_name: str, version: str = None, 
+                             full: bool = False) -> Dict:
+        """Comprehensive safety check for a package (full: never stop early)"""
+        
+        overall_status = "SAFE"
+        checks = {}
+        tally = _ScoreAccumulator()
+        
+        # One clock reading for every check of this package
+        now = datetime.now(timezone.utc)
         
         try:
             # 1. Basic validation
             basic_check = self._basic_validation(package_name, version)
-            safety_report["checks"]["basic_validation"] = basic_check
-            self._update_score(safety_report, basic_check)
-            
-            # 2. Package name and metadata check
-            metadata_check = self._check_package_metadata(package_name, version)
-            safety_report["checks"]["metadata"] = metadata_check
-            self._update_score(safety_report, metadata_check)
-            
-            # 4. Download URL validation
-            url_check = self._check_download_urls(package_name, version)
-            safety_report["checks"]["download_urls"] = url_check
-            self._update_score(safety_report, url_check)
-            
-            # 5. File type and extension check
-            filetype_check = self._check_file_types(package_name, version)
-            safety_report["checks"]["file_types"] = filetype_check
-            self._update_score(safety_report, filetype_check)
-            
-            # 6. Dependencies check
-            deps_check = self._check_dependencies(package_name, version)
-            safety_report["checks"]["dependencies"] = deps_check
-            self._update_score(safety_report, deps_check)
-            
-            # 7. Age and popularity check
-            age_check = self._check_package_age_and_popularity(package_name)
-            safety_report["checks"]["age_popularity"] = age_check
-            self._update_score(safety_report, age_check)
-            
-            # 8. Known vulnerabilities check
-            vuln_check = self._check_known_vulnerabilities(package_name, version)
-            safety_report["checks"]["vulnerabilities"] = vuln_check
-            self._update_score(safety_report, vuln_check)
-            
-            # 9. License check
-            license_check = self._check_license(package_name, version)
-            safety_report["checks"]["license"] = license_check
-            self._update_score(safety_report, license_check)
-            
-            # 10. Source code review check
-            code_check = self._check_source_code_integrity(package_name, version)
-            safety_report["checks"]["source_code"] = code_check
-            self._update_score(safety_report, code_check)
-            
+            checks["basic_validation"] = basic_check
+            self._update_score(tally, basic_check)
+            
+            # A blocklisted name can't be redeemed by anything PyPI says:
+            # reject it without any network traffic
+            if basic_check.details["blocklisted"] and not full:
+                overall_status = "FAIL"
+                tally.score = 0
+            else:
+                # 2-10. The remaining checks wait on PyPI rather than the CPU:
+                # run them concurrently, then score them serially in report order
+                pending = [
+                    ("metadata", self._check_package_metadata, (package_name, version)),
+                    ("download_urls", self._check_download_urls, (package_name, version)),
+                    ("file_types", self._check_file_types, (package_name, version)),
+                    ("dependencies", self._check_dependencies, (package_name, version)),
+                    ("age_popularity", self._check_package_age_and_popularity, (package_name, now)),
+                    ("vulnerabilities", self._check_known_vulnerabilities, (package_name, version)),
+                    ("license", self._check_license, (package_name, version)),
+                    ("source_code", self._check_source_code_integrity, (package_name, version))
+                ]
+                with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                    futures = [executor.submit(check, *args) for _, check, args in pending]
+                    
+                for (check_name, _, _), future in zip(pending, futures):
+                    check_result = future.result()
+                    checks[check_name] = check_result
+                    self._update_score(tally, check_result)
+                    
         except Exception as e:
-            safety_report["overall_status"] = "CHECK_FAILED"
-            safety_report["critical_issues"].append(f"Security check failed: {str(e)}")
+            overall_status = "CHECK_FAILED"
+            tally.critical_issues.append(f"Security check failed: {str(e)}")
             
-        # Generate final recommendations
-        self._generate_recommendations(safety_report)
+        if overall_status == "SAFE":
+            overall_status = self._status_for_score(tally.score)
+            
+        # The report dict is only built once every check has been scored
+        return {
+            "package": package_name,
+            "version": version or "latest",
+            "overall_status": overall_status,
+            "checks": {name: check_result._asdict() for name, check_result in checks.items()},
+            "recommendations": self._generate_recommendations(overall_status, tally),
+            "critical_issues": tally.critical_issues,
+            "warnings": tally.warnings,
+            "score": tally.score
+        }
         
-        return safety_report
+    def check_packages_safety(self, packages: List[Tuple[str, Optional[str]]], 
+                              full: bool = False) -> List[Dict]:
+        """Safety reports for several (name, version) packages, fetching PyPI concurrently"""
+        # Every document the checks will read: the requested release plus the
+        # latest one (age check); blocklisted names won't need any
+        checked = [(package_name, version) for package_name, version in packages 
+                   if full or not self._find_malicious_patterns(package_name)]
+        keys = []
+        for package_name, version in checked:
+            keys.append((package_name, version))
+            keys.append((package_name, None))
+        self._prefetch_pypi_json(list(dict.fromkeys(keys)))
+        # Then every package's vulnerabilities in one OSV request
+        self._prefetch_osv(checked)
         
-    def _basic_validation(self, package_name: str, version: str = None) -> Dict:
+        return [self.check_package_safety(package_name, version, full=full) 
+                for package_name, version in packages]
+        
+    def _basic_validation(self, package_name: str, version: str = None) -> CheckResult:
         """Basic validation of package name and version"""
-        result = {
-            "status": "PASS",
-            "issues": [],
-            "details": {}
-        }
+        status = "PASS"
+        issues, warnings, details = [], [], {}
         
         # Check package name format
-        if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', package_name):
-            result["status"] = "FAIL"
-            result["issues"].append("Package name contains invalid characters")
+        if not _PKG_NAME_RE.match(package_name):
+            status = "FAIL"
+            issues.append("Package name contains invalid characters")
             
         # Check for suspicious patterns
-        for pattern in self.malicious_patterns:
-            if re.search(pattern, package_name.lower()):
-                result["status"] = "FAIL"
-                result["issues"].append(f"Package name matches suspicious pattern: {pattern}")
+        patterns = self._find_malicious_patterns(package_name)
+        for pattern in patterns:
+            status = "FAIL"
+            issues.append(f"Package name matches suspicious pattern: {pattern}")
                 
         # Check version format if provided
         if version and not self._is_valid_version(version):
-            result["warnings"].append("Version format appears unusual")
+            warnings.append("Version format appears unusual")
             
-        result["details"]["name_format"] = "VALID" if result["status"] == "PASS" else "INVALID"
-        result["details"]["suspicious_patterns"] = len(result["issues"])
+        details["name_format"] = "VALID" if status == "PASS" else "INVALID"
+        details["suspicious_patterns"] = len(issues)
+        details["blocklisted"] = bool(patterns)
         
-        return result
+        return CheckResult(status, issues, warnings, details)
         
-    def _check_package_metadata(self, package_name: str, version: str = None) -> Dict:
+    def _check_package_metadata(self, package_name: str, version: str = None) -> CheckResult:
         """Check package metadata from PyPI"""
-        result = {
-            "status": "PASS",
-            "issues": [],
-            "warnings": [],
-            "details": {}
-        }
+        status = "PASS"
+        issues, warnings, details = [], [], {}
         
         try:
             # Get package info from PyPI
-            url = f"https://pypi.org/pypi/{package_name}/json"
-            if version:
-                url = f"https://pypi.org/pypi/{package_name}/{version}/json"
-                
-            response = requests.get(url, timeout=10)
+            http_status, data = self._get_pypi_json(package_name, version)
             
-            if response.status_code != 200:
-                result["status"] = "FAIL"
-                result["issues"].append(f"Package not found in PyPI: HTTP {response.status_code}")
-                return result
+            if http_status != 200:
+                status = "FAIL"
+                issues.append(f"Package not found in PyPI: HTTP {http_status}")
+                return CheckResult(status, issues, warnings, details)
                 
-            data = response.json()
             info = data.get("info", {})
             
             # Check basic metadata
             if not info.get("name"):
-                result["status"] = "FAIL"
-                result["issues"].append("Package has no name in metadata")
+                status = "FAIL"
+                issues.append("Package has no name in metadata")
                 
             if not info.get("version"):
-                result["status"] = "FAIL"
-                result["issues"].append("Package has no version in metadata")
+                status = "FAIL"
+                issues.append("Package has no version in metadata")
                 
             # Check for suspicious metadata
-            summary = info.get("summary", "").lower()
-            description = info.get("description", "").lower()
+            summary = info.get("summary", "")
+            description = info.get("description", "")
             
-            for pattern in self.malicious_patterns:
-                if pattern in summary or pattern in description:
-                    result["warnings"].append(f"Suspicious keyword in metadata: {pattern}")
+            for pattern in self._find_malicious_patterns(summary, description):
+                warnings.append(f"Suspicious keyword in metadata: {pattern}")
                     
             # Check author information
             author = info.get("author")
             if not author or author == "Unknown":
-                result["warnings"].append("Missing or unknown author information")
+                warnings.append("Missing or unknown author information")
                 
             # Check license
             license_info = info.get("license")
             if not license_info:
-                result["warnings"].append("No license information available")
+                warnings.append("No license information available")
             elif "unknown" in license_info.lower():
-                result["warnings"].append("License marked as unknown")
+                warnings.append("License marked as unknown")
                 
-            result["details"]["has_metadata"] = True
-            result["details"]["author"] = author or "Unknown"
-            result["details"]["license"] = license_info or "Unknown"
-            result["details"]["summary"] = info.get("summary", "")
+            details["has_metadata"] = True
+            details["author"] = author or "Unknown"
+            details["license"] = license_info or "Unknown"
+            details["summary"] = info.get("summary", "")
             
         except Exception as e:
-            result["status"] = "FAIL"
-            result["issues"].append(f"Failed to retrieve metadata: {str(e)}")
+            status = "FAIL"
+            issues.append(f"Failed to retrieve metadata: {str(e)}")
             
-        return result
+        return CheckResult(status, issues, warnings, details)
         
-    def _check_download_urls(self, package_name: str, version: str = None) -> Dict:
+    def _check_download_urls(self, package_name: str, version: str = None) -> CheckResult:
         """Check download URLs for security"""
-        result = {
-            "status": "PASS",
-            "issues": [],
-            "warnings": [],
-            "details": {}
-        }
+        status = "PASS"
+        issues, warnings, details = [], [], {}
         
         try:
             # Get package info
-            url = f"https://pypi.org/pypi/{package_name}/json"
-            if version:
-                url = f"https://pypi.org/pypi/{package_name}/{version}/json"
+            http_status, data = self._get_pypi_json(package_name, version)
+            if http_status != 200:
+                return CheckResult(status, issues, warnings, details)
                 
-            response = requests.get(url, timeout=10)
-            if response.status_code != 200:
-                return result
-                
-            data = response.json()
             urls = data.get("urls", [])
             
-            trusted_domains = set(["pypi.org", "files.pythonhosted.org"])
             suspicious_urls = []
             
             for url_info in urls:
-                download_url = url_info.get("upload_time")
+                download_url = url_info.get("url", "")
                 
-                # Parse URL domain
-                parsed_url = urlparse(download_url)
-                domain = parsed_url.netloc.lower()
+                # URL domain: what sits between "scheme://" and the path
+                domain = download_url.split("://", 1)[-1].split("/", 1)[0].lower()
                 
-                if domain not in trusted_domains:
+                if domain not in self.TRUSTED_DOMAINS:
                     suspicious_urls.append(download_url)
-                    result["warnings"].append(f"Untrusted domain: {domain}")
+                    warnings.append(f"Untrusted domain: {domain}")
                     
                 # Check file size
                 file_size = url_info.get("size", 0)
                 if file_size > 100 * 1024 * 1024:  # 100MB
-                    result["warnings"].append(f"Large package size: {file_size} bytes")
+                    warnings.append(f"Large package size: {file_size} bytes")
                     
-            result["details"]["total_urls"] = len(urls)
-            result["details"]["suspicious_urls"] = len(suspicious_urls)
+            details["total_urls"] = len(urls)
+            details["suspicious_urls"] = len(suspicious_urls)
             
             if suspicious_urls:
-                result["status"] = "WARNING"
+                status = "WARNING"
                 
         except Exception as e:
-            result["issues"].append(f"Failed to check download URLs: {str(e)}")
-            result["status"] = "FAIL"
+            issues.append(f"Failed to check download URLs: {str(e)}")
+            status = "FAIL"
             
-        return result
+        return CheckResult(status, issues, warnings, details)
         
-    def _check_file_types(self, package_name: str, version: str = None) -> Dict:
+    def _check_file_types(self, package_name: str, version: str = None) -> CheckResult:
         """Check for suspicious file types in package"""
-        result = {
-            "status": "PASS",
-            "issues": [],
-            "warnings": [],
-            "details": {}
-        }
+        status = "PASS"
+        issues, warnings, details = [], [], {}
         
         try:
             # Get package info
-            url = f"https://pypi.org/pypi/{package_name}/json"
-            if version:
-                url = f"https://pypi.org/pypi/{package_name}/{version}/json"
+            http_status, data = self._get_pypi_json(package_name, version)
+            if http_status != 200:
+                return CheckResult(status, issues, warnings, details)
                 
-            response = requests.get(url, timeout=10)
-            if response.status_code != 200:
-                return result
-                
-            data = response.json()
             urls = data.get("urls", [])
             
             binary_files = []
@@ -297,234 +366,210 @@ class SecurityChecker:
                 file_type = url_info.get("packagetype", "")
                 
                 # Check for binary file types
-                if file_type in ["bdist_dumb", "bdist_wininst"]:
+                if file_type in ("bdist_dumb", "bdist_wininst"):
                     binary_files.append(filename)
                     
                 # Check for suspicious extensions
-                for ext in self.suspicious_extensions:
-                    if filename.lower().endswith(ext):
-                        suspicious_files.append(filename)
-                        result["warnings"].append(f"Suspicious file extension: {ext}")
+                filename_lower = filename.lower()
+                if filename_lower.endswith(self._suspicious_suffixes):
+                    suspicious_files.append(filename)
+                    ext = os.path.splitext(filename_lower)[1]
+                    warnings.append(f"Suspicious file extension: {ext}")
                         
-            result["details"]["binary_files"] = len(binary_files)
-            result["details"]["suspicious_files"] = len(suspicious_files)
+            details["binary_files"] = len(binary_files)
+            details["suspicious_files"] = len(suspicious_files)
             
             if suspicious_files:
-                result["status"] = "WARNING"
+                status = "WARNING"
                 
         except Exception as e:
-            result["issues"].append(f"Failed to check file types: {str(e)}")
-            result["status"] = "FAIL"
+            issues.append(f"Failed to check file types: {str(e)}")
+            status = "FAIL"
             
-        return result
+        return CheckResult(status, issues, warnings, details)
         
-    def _check_dependencies(self, package_name: str, version: str = None) -> Dict:
+    def _check_dependencies(self, package_name: str, version: str = None) -> CheckResult:
         """Check package dependencies for security risks"""
-        result = {
-            "status": "PASS",
-            "issues": [],
-            "warnings": [],
-            "details": {}
-        }
+        status = "PASS"
+        issues, warnings, details = [], [], {}
         
         try:
             # Get package info
-            url = f"https://pypi.org/pypi/{package_name}/json"
-            if version:
-                url = f"https://pypi.org/pypi/{package_name}/{version}/json"
+            http_status, data = self._get_pypi_json(package_name, version)
+            if http_status != 200:
+                return CheckResult(status, issues, warnings, details)
                 
-            response = requests.get(url, timeout=10)
-            if response.status_code != 200:
-                return result
-                
-            data = response.json()
             requires_dist = data.get("info", {}).get("requires_dist", [])
             
             if not requires_dist:
-                result["details"]["has_dependencies"] = False
-                return result
+                details["has_dependencies"] = False
+                return CheckResult(status, issues, warnings, details)
                 
-            result["details"]["has_dependencies"] = True
-            result["details"]["dependency_count"] = len(requires_dist)
+            details["has_dependencies"] = True
+            details["dependency_count"] = len(requires_dist)
             
             # Check for suspicious dependencies
             suspicious_deps = []
             for dep in requires_dist:
-                dep_lower = dep.lower()
-                for pattern in self.malicious_patterns:
-                    if pattern in dep_lower:
-                        suspicious_deps.append(dep)
-                        result["warnings"].append(f"Suspicious dependency: {dep}")
-                        break
+                if self._has_malicious_pattern(dep):
+                    suspicious_deps.append(dep)
+                    warnings.append(f"Suspicious dependency: {dep}")
                         
-            result["details"]["suspicious_dependencies"] = len(suspicious_deps)
+            details["suspicious_dependencies"] = len(suspicious_deps)
             
             if suspicious_deps:
-                result["status"] = "WARNING"
+                status = "WARNING"
                 
         except Exception as e:
-            result["issues"].append(f"Failed to check dependencies: {str(e)}")
-            result["status"] = "FAIL"
+            issues.append(f"Failed to check dependencies: {str(e)}")
+            status = "FAIL"
             
-        return result
+        return CheckResult(status, issues, warnings, details)
         
-    def _check_package_age_and_popularity(self, package_name: str) -> Dict:
+    def _check_package_age_and_popularity(self, package_name: str, 
+                                          now: datetime = None) -> CheckResult:
         """Check package age and download statistics"""
-        result = {
-            "status": "PASS",
-            "issues": [],
-            "warnings": [],
-            "details": {}
-        }
+        status = "PASS"
+        issues, warnings, details = [], [], {}
         
         try:
             # Get package info
-            url = f"https://pypi.org/pypi/{package_name}/json"
-            response = requests.get(url, timeout=10)
+            http_status, data = self._get_pypi_json(package_name)
             
-            if response.status_code != 200:
-                return result
+            if http_status != 200:
+                return CheckResult(status, issues, warnings, details)
                 
-            data = response.json()
             info = data.get("info", {})
             
-            # Check upload time
-            upload_time_str = info.get("upload_time")
+            # Check upload time: the project's first upload (or, without a
+            # release history, the current release's files)
+            files = [f for release in data.get("releases", {}).values() for f in release]
+            upload_times = [f.get("upload_time_iso_8601") for f in files or data.get("urls", [])]
+            upload_time_str = min(filter(None, upload_times), default=None)
             if upload_time_str:
-                upload_time = datetime.strptime(upload_time_str, "%Y-%m-%dT%H:%M:%S")
-                days_old = (datetime.now() - upload_time).days
+                # PyPI timestamps carry microseconds and a "Z" suffix
+                upload_time = datetime.fromisoformat(upload_time_str.replace("Z", "+00:00"))
+                days_old = ((now or datetime.now(timezone.utc)) - upload_time).days
                 
-                result["details"]["days_old"] = days_old
-                result["details"]["upload_time"] = upload_time_str
+                details["days_old"] = days_old
+                details["upload_time"] = upload_time_str
                 
                 if days_old < 7:
-                    result["warnings"].append("Package created less than 7 days ago")
-                    result["status"] = "WARNING"
+                    warnings.append("Package created less than 7 days ago")
+                    status = "WARNING"
                 elif days_old < 30:
-                    result["warnings"].append("Package created less than 30 days ago")
+                    warnings.append("Package created less than 30 days ago")
                     
-            # Check download count
+            # Check download count (PyPI now reports -1 for every period: unknown)
             downloads = info.get("downloads", 0)
-            result["details"]["downloads"] = downloads
+            if isinstance(downloads, dict):
+                downloads = downloads.get("last_month", -1)
+            details["downloads"] = downloads
             
             if downloads == 0:
-                result["warnings"].append("Package has no downloads")
-            elif downloads < 100:
-                result["warnings"].append("Package has very few downloads")
+                warnings.append("Package has no downloads")
+            elif 0 < downloads < 100:
+                warnings.append("Package has very few downloads")
                 
         except Exception as e:
-            result["issues"].append(f"Failed to check age and popularity: {str(e)}")
-            result["status"] = "FAIL"
+            issues.append(f"Failed to check age and popularity: {str(e)}")
+            status = "FAIL"
             
-        return result
+        return CheckResult(status, issues, warnings, details)
         
-    def _check_known_vulnerabilities(self, package_name: str, version: str = None) -> Dict:
+    def _check_known_vulnerabilities(self, package_name: str, version: str = None) -> CheckResult:
         """Check for known vulnerabilities in the package"""
-        result = {
-            "status": "PASS",
-            "issues": [],
-            "warnings": [],
-            "details": {}
-        }
-        
-        # This is a simplified vulnerability check
-        # In a real implementation, you would integrate with vulnerability databases
+        status = "PASS"
+        issues, warnings, details = [], [], {}
         
         try:
-            # Basic checks for common vulnerable packages
-            vulnerable_packages = {
-                "requests": ["<2.25.0"],
-                "django": ["<3.2.0"],
-                "flask": ["<2.0.0"],
-                "sqlalchemy": ["<1.4.0"]
-            }
-            
-            package_lower = package_name.lower()
-            
-            if package_lower in vulnerable_packages:
-                if version and self._is_version_older(version, vulnerable_packages[package_lower][0]):
-                    result["status"] = "FAIL"
-                    result["issues"].append(f"Package has known vulnerabilities in this version")
-                    
-            result["details"]["vulnerability_check"] = "SIMPLIFIED"
+            version = self._resolve_version(package_name, version)
+            if version is None:
+                return CheckResult(status, issues, warnings, details)
+            
+            try:
+                vulns = self._query_osv(package_name, version)
+            except Exception as e:
+                warnings.append(f"Vulnerability database unavailable: {str(e)}")
+                vulns = None
+                
+            if vulns is None:
+                affected = VULNERABLE_PACKAGES.get(package_name.lower())
+                if affected is not None and self._is_valid_version(version):
+                    if affected.contains(version, prereleases=True):
+                        status = "FAIL"
+                        issues.append(f"Package has known vulnerabilities in this version")
+                details["vulnerability_check"] = "SIMPLIFIED"
+            else:
+                for vuln in vulns:
+                    issues.append(
+                        f"Known vulnerability {vuln.get('id')}: {vuln.get('summary') or 'no summary'}"
+                    )
+                if vulns:
+                    status = "FAIL"
+                details["vulnerability_check"] = "OSV"
+                details["vulnerabilities"] = len(vulns)
+                
+            details["checked_version"] = version
             
         except Exception as e:
-            result["issues"].append(f"Failed to check vulnerabilities: {str(e)}")
-            result["status"] = "FAIL"
+            issues.append(f"Failed to check vulnerabilities: {str(e)}")
+            status = "FAIL"
             
-        return result
+        return CheckResult(status, issues, warnings, details)
         
-    def _check_license(self, package_name: str, version: str = None) -> Dict:
+    def _check_license(self, package_name: str, version: str = None) -> CheckResult:
         """Check package license"""
-        result = {
-            "status": "PASS",
-            "issues": [],
-            "warnings": [],
-            "details": {}
-        }
+        status = "PASS"
+        issues, warnings, details = [], [], {}
         
         try:
             # Get package info
-            url = f"https://pypi.org/pypi/{package_name}/json"
-            if version:
-                url = f"https://pypi.org/pypi/{package_name}/{version}/json"
-                
-            response = requests.get(url, timeout=10)
+            http_status, data = self._get_pypi_json(package_name, version)
             
-            if response.status_code != 200:
-                return result
+            if http_status != 200:
+                return CheckResult(status, issues, warnings, details)
                 
-            data = response.json()
-            license_info = data.get("info", {}).get("license", "")
+            # PyPI sends null for packages that declare no license
+            license_info = data.get("info", {}).get("license") or ""
+            license_lower = license_info.lower()
             
-            result["details"]["license"] = license_info or "Unknown"
+            details["license"] = license_info or "Unknown"
             
             # Check for problematic licenses
-            if "unknown" in license_info.lower():
-                result["warnings"].append("License marked as unknown")
+            if "unknown" in license_lower:
+                warnings.append("License marked as unknown")
                 
             # Check for permissive but review-required licenses
-            permissive_licenses = ["MIT", "Apache", "BSD", "GPL"]
-            license_lower = license_info.lower()
-            
-            for perm_license in permissive_licenses:
-                if perm_license.lower() in license_lower:
-                    result["details"]["license_type"] = "PERMISSIVE"
+            for perm_license in PERMISSIVE_LICENSES:
+                if perm_license in license_lower:
+                    details["license_type"] = "PERMISSIVE"
                     break
             else:
-                result["details"]["license_type"] = "UNKNOWN"
+                details["license_type"] = "UNKNOWN"
                 
         except Exception as e:
-            result["issues"].append(f"Failed to check license: {str(e)}")
-            result["status"] = "FAIL"
+            issues.append(f"Failed to check license: {str(e)}")
+            status = "FAIL"
             
-        return result
+        return CheckResult(status, issues, warnings, details)
         
-    def _check_source_code_integrity(self, package_name: str, version: str = None) -> Dict:
+    def _check_source_code_integrity(self, package_name: str, version: str = None) -> CheckResult:
         """Basic source code integrity check"""
-        result = {
-            "status": "PASS",
-            "issues": [],
-            "warnings": [],
-            "details": {}
-        }
+        status = "PASS"
+        issues, warnings, details = [], [], {}
         
         # This is a simplified check
         # In a real implementation, you would download and analyze the source code
         
         try:
             # Get package info
-            url = f"https://pypi.org/pypi/{package_name}/json"
-            if version:
-                url = f"https://pypi.org/pypi/{package_name}/{version}/json"
-                
-            response = requests.get(url, timeout=10)
+            http_status, data = self._get_pypi_json(package_name, version)
             
-            if response.status_code != 200:
-                return result
+            if http_status != 200:
+                return CheckResult(status, issues, warnings, details)
                 
-            data = response.json()
-            project_urls = data.get("info", {}).get("project_urls", {})
+            project_urls = data.get("info", {}).get("project_urls") or {}
             
             # Check if source code is available
             source_url = None
@@ -533,100 +578,314 @@ class SecurityChecker:
                     source_url = url_value
                     break
                     
-            result["details"]["has_source_code"] = source_url is not None
-            result["details"]["source_url"] = source_url or "Not available"
+            details["has_source_code"] = source_url is not None
+            details["source_url"] = source_url or "Not available"
             
             if not source_url:
-                result["warnings"].append("Source code URL not available")
+                warnings.append("Source code URL not available")
+            elif self.probe_source_urls:
+                reachable = self._probe_url(source_url)
+                details["source_reachable"] = reachable
+                if not reachable:
+                    warnings.append(f"Source code URL unreachable: {source_url}")
+                    status = "WARNING"
                 
         except Exception as e:
-            result["issues"].append(f"Failed to check source code: {str(e)}")
-            result["status"] = "FAIL"
+            issues.append(f"Failed to check source code: {str(e)}")
+            status = "FAIL"
             
-        return result
+        return CheckResult(status, issues, warnings, details)
         
-    def _update_score(self, safety_report: Dict, check_result: Dict):
-        """Update safety score based on check result"""
-        if check_result["status"] == "FAIL":
-            safety_report["score"] -= 20
-            safety_report["critical_issues"].extend(check_result["issues"])
-        elif check_result["status"] == "WARNING":
-            safety_report["score"] -= 10
-            safety_report["warnings"].extend(check_result["warnings"])
-            
-    def _generate_recommendations(self, safety_report: Dict):
-        """Generate recommendations based on safety report"""
-        if safety_report["overall_status"] == "FAIL":
-            safety_report["recommendations"].append("DO NOT INSTALL - Critical security issues found")
+    def _probe_url(self, url: str) -> bool:
+        """Whether a URL answers without error, downloading (almost) nothing"""
+        session = self._get_session()
+        try:
+            response = session.head(url, timeout=5, allow_redirects=True)
+            # Some hosts refuse HEAD: ask for a single byte instead
+            if response.status_code in (403, 405, 501):
+                response = session.get(url, timeout=5, headers={"Range": "bytes=0-0"}, 
+                                       stream=True)
+                response.close()
+        except Exception:
+            return False
+        return response.status_code < 400
+        
+    def _find_malicious_patterns(self, *texts: str) -> List[str]:
+        """Malicious patterns found in any of the texts, in pattern-list order"""
+        found = set()
+        for text in texts:
+            if self._malicious_automaton is not None:
+                found.update(pattern for _, pattern in self._malicious_automaton.iter(text.lower()))
+            else:
+                found.update(match.lower() for match in self._malicious_re.findall(text))
+        return [pattern for pattern in self.malicious_patterns if pattern in found]
+        
+    def _has_malicious_pattern(self, text: str) -> bool:
+        """Whether any malicious pattern occurs in the text"""
+        if self._malicious_automaton is not None:
+            return next(self._malicious_automaton.iter(text.lower()), None) is not None
+        return self._malicious_re.search(text) is not None
+        
+    @staticmethod
+    def _build_automaton(patterns):
+        """Build an Aho-Corasick automaton over literal patterns (None if unavailable)"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return automaton
+        
+    def _get_session(self):
+        """HTTP session shared by every check, built on first use"""
+        with self._pypi_lock:
+            if self._session is None:
+                # requests is only needed once a check goes to the network
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=16, pool_maxsize=16,
+                    max_retries=Retry(total=3, backoff_factor=0.3, 
+                                      status_forcelist=[429, 502, 503, 504])
+                ))
+                self._session = session
+        return self._session
+        
+    def _get_pypi_json(self, package_name: str, version: str = None) -> Tuple[int, Optional[Dict]]:
+        """Fetch the PyPI JSON document for a package once, returning (status, data)"""
+        key = (package_name, version)
+        with self._pypi_lock:
+            future = self._pypi_cache.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._pypi_cache[key] = Future()
+                
+        # The first caller fetches; concurrent callers wait on its result
+        if is_owner:
+            self._fetch_pypi_json(future, package_name, version)
+        return future.result()
+        
+    def _fetch_pypi_json(self, future: Future, package_name: str, version: str = None):
+        """Resolve a PyPI cache entry from the disk cache or a blocking request"""
+        data = self._load_cached_json(package_name, version)
+        if data is not None:
+            future.set_result((200, data))
             return
             
-        if safety_report["overall_status"] == "WARNING":
-            safety_review.append("Review carefully before installation")
+        try:
+            response = self._get_session().get(self._pypi_url(package_name, version), timeout=10)
+            data = response.json() if response.status_code == 200 else None
+            if data is not None:
+                self._store_cached_json(package_name, version, data)
+            future.set_result((response.status_code, data))
+        except Exception as e:
+            # Failed fetches are remembered too: the other checks report
+            # the same error instead of retrying
+            future.set_exception(e)
+            
+    @staticmethod
+    def _pypi_url(package_name: str, version: str = None) -> str:
+        """PyPI JSON API URL for a package, or one of its releases"""
+        if version:
+            return f"https://pypi.org/pypi/{package_name}/{version}/json"
+        return f"https://pypi.org/pypi/{package_name}/json"
+        
+    def _prefetch_pypi_json(self, keys: List[Tuple[str, Optional[str]]]):
+        """Fill the PyPI cache for many (package, version) keys concurrently"""
+        with self._pypi_lock:
+            pending = {}
+            for key in keys:
+                if key not in self._pypi_cache:
+                    pending[key] = self._pypi_cache[key] = Future()
+                    
+        missing = []
+        for (package_name, version), future in pending.items():
+            data = self._load_cached_json(package_name, version)
+            if data is not None:
+                future.set_result((200, data))
+            else:
+                missing.append((package_name, version, future))
+        if not missing:
+            return
             
-        if safety_report["score"] < 80:
-            safety_report["recommendations"].append("Exercise caution - multiple warnings detected")
+        try:
+            import aiohttp  # optional: every fetch on one event loop
+        except ImportError:
+            # Same lookups on a thread pool over the pooled requests session
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                for package_name, version, future in missing:
+                    executor.submit(self._fetch_pypi_json, future, package_name, version)
+            return
+            
+        import asyncio
+        results = asyncio.run(self._aio_fetch_pypi_json(
+            aiohttp, [(package_name, version) for package_name, version, _ in missing]
+        ))
+        for (package_name, version, future), outcome in zip(missing, results):
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+                continue
+            status, data = outcome
+            if data is not None:
+                self._store_cached_json(package_name, version, data)
+            future.set_result((status, data))
+            
+    async def _aio_fetch_pypi_json(self, aiohttp, keys: List[Tuple[str, Optional[str]]]) -> List:
+        """(status, data) or the raised exception for each key, fetched concurrently"""
+        import asyncio
+        
+        # At most 16 requests in flight, like the requests session's pool
+        connector = aiohttp.TCPConnector(limit=16)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            async def fetch(package_name, version):
+                async with session.get(self._pypi_url(package_name, version)) as response:
+                    if response.status != 200:
+                        return response.status, None
+                    return response.status, await response.json()
+                    
+            return await asyncio.gather(*(fetch(*key) for key in keys), return_exceptions=True)
+        
+    def _resolve_version(self, package_name: str, version: str = None) -> Optional[str]:
+        """Version to check: the pinned one, else the one pip would install (None if unknown)"""
+        if not version:
+            http_status, data = self._get_pypi_json(package_name)
+            if http_status != 200:
+                return None
+            version = data.get("info", {}).get("version")
+        return version.lstrip(VERSION_OPERATORS)
+        
+    def _query_osv(self, package_name: str, version: str) -> List[Dict]:
+        """Known vulnerabilities (OSV records) affecting one package version"""
+        cached = self._osv_cache.get((package_name, version))
+        if isinstance(cached, Exception):
+            raise cached
+        if cached is not None:
+            return cached
+            
+        payload = {"package": {"name": package_name, "ecosystem": "PyPI"}, "version": version}
+        response = self._get_session().post(OSV_QUERY_URL, json=payload, timeout=10)
+        response.raise_for_status()
+        vulns = self._osv_cache[(package_name, version)] = response.json().get("vulns", [])
+        return vulns
+        
+    def _prefetch_osv(self, packages: List[Tuple[str, Optional[str]]]):
+        """Query OSV for every package of a batch in as few requests as possible"""
+        keys = []
+        for package_name, version in packages:
+            try:
+                resolved = self._resolve_version(package_name, version)
+            except Exception:
+                continue  # The check itself reports the PyPI failure
+            if resolved is not None and (package_name, resolved) not in self._osv_cache:
+                keys.append((package_name, resolved))
+        keys = list(dict.fromkeys(keys))
+        
+        for start in range(0, len(keys), OSV_BATCH_SIZE):
+            chunk = keys[start:start + OSV_BATCH_SIZE]
+            payload = {"queries": [
+                {"package": {"name": package_name, "ecosystem": "PyPI"}, "version": version}
+                for package_name, version in chunk
+            ]}
+            try:
+                response = self._get_session().post(OSV_QUERYBATCH_URL, json=payload, timeout=30)
+                response.raise_for_status()
+                results = response.json().get("results", [])
+            except Exception as e:
+                # Remembered like failed PyPI fetches: the checks fall back
+                # without querying OSV again one package at a time
+                for key in chunk:
+                    self._osv_cache[key] = e
+                continue
+                
+            # Batch results only carry advisory ids, not summaries
+            for key, entry in zip(chunk, results):
+                self._osv_cache[key] = entry.get("vulns", [])
+        
+    def _cache_path(self, package_name: str, version: str = None) -> str:
+        """Disk cache file for a package's PyPI document"""
+        safe_name = re.sub(r"[^a-z0-9._-]", "_", package_name.lower())
+        if version:
+            safe_name += "==" + re.sub(r"[^a-z0-9._+-]", "_", version.lower())
+        return os.path.join(self.cache_dir, f"{safe_name}.json")
+        
+    def _load_cached_json(self, package_name: str, version: str = None) -> Optional[Dict]:
+        """Return the cached PyPI document if present and fresh"""
+        if not self.use_cache:
+            return None
+        path = self._cache_path(package_name, version)
+        try:
+            if time.time() - os.stat(path).st_mtime > PYPI_CACHE_TTL:
+                return None
+            with open(path, 'rb') as f:
+                return _loads(f.read())
+        except (OSError, ValueError):
+            return None
+            
+    def _store_cached_json(self, package_name: str, version: str, data: Dict):
+        """Save a PyPI document to the disk cache (best effort)"""
+        if not self.use_cache:
+            return
+        path = self._cache_path(package_name, version)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(data))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+            
+    def _update_score(self, tally: _ScoreAccumulator, check_result: CheckResult):
+        """Update safety score based on check result"""
+        if check_result.status == "FAIL":
+            tally.score -= 20
+            tally.critical_issues.extend(check_result.issues)
+        elif check_result.status == "WARNING":
+            tally.score -= 10
+            tally.warnings.extend(check_result.warnings)
+            # Noted here so recommendations needn't rescan every warning
+            if any("suspicious" in warning.lower() for warning in check_result.warnings):
+                tally.has_suspicious = True
+                
+    @staticmethod
+    def _status_for_score(score: int) -> str:
+        """Overall status for a final score (below 70 callers refuse to install)"""
+        return "SAFE" if score >= 90 else ("WARNING" if score >= 70 else "FAIL")
+        
+    def _generate_recommendations(self, overall_status: str, tally: _ScoreAccumulator) -> List[str]:
+        """Generate recommendations based on the overall status and score"""
+        if overall_status == "FAIL":
+            return ["DO NOT INSTALL - Critical security issues found"]
+            
+        recommendations = []
+        if overall_status == "WARNING":
+            recommendations.append("Review carefully before installation")
+            
+        if tally.score < 80:
+            recommendations.append("Exercise caution - multiple warnings detected")
             
         # Check specific conditions
-        if any("suspicious" in warning.lower() for warning in safety_report["warnings"]):
-            safety_report["recommendations"].append("Strongly recommend manual review of source code")
+        if tally.has_suspicious:
+            recommendations.append("Strongly recommend manual review of source code")
+        return recommendations
             
     def _is_valid_version(self, version: str) -> bool:
-        """Check if version format is valid"""
+        """Check if version format is valid (PEP 440, optionally with an operator)"""
         try:
-            # Simple version format check
-            if version.startswith(("==", "!=", "<=", ">=", "~=", "===")):
-                version = version[2:]
-                
-            # Basic semantic versioning check
-            if re.match(r'^\d+\.\d+\.\d+([a-zA-Z0-9]+)?$', version):
-                return True
-                
-            # Check for valid version components
-            parts = version.split('.')
-            for part in parts:
-                if not part.isdigit() and not part.isalpha():
-                    return False
-                    
+            Version(version.lstrip(VERSION_OPERATORS))
             return True
-            
-        except:
-            return False
-            
-    def _is_version_older(self, version: str, threshold: str) -> bool:
-        """Compare versions to check if older than threshold"""
-        try:
-            # Simple version comparison (not comprehensive)
-            v_parts = [int(x) for x in version.split('.')]
-            t_parts = [int(x) for x in threshold.split('.')]
-            
-            for v, t in zip(v_parts, t_parts):
-                if v < t:
-                    return True
-                elif v > t:
-                    return False
-                    
-            return len(v_parts) < len(t_parts)
-            
-        except:
+        except InvalidVersion:
             return False
 
 
-def main():
-    """Main function for CLI usage"""
-    if len(sys.argv) < 3:
-        print("Usage: python security_checker.py <package> [version]")
-        sys.exit(1)
-        
-    checker = SecurityChecker()
-    package_name = sys.argv[2]
-    version = sys.argv[3] if len(sys.argv) > 3 else None
-    
-    print(f"🔒 SECURITY CHECK FOR: {package_name} ({version or 'latest'})")
-    print("=" * 50)
-    
-    safety_report = checker.check_package_safety(package_name, version)
-    
-    # Print results
+def print_report(safety_report: Dict):
+    """Print a safety report for humans"""
     print(f"Overall Status: {safety_report['overall_status']}")
     print(f"Safety Score: {safety_report['score']}/100")
     
@@ -644,10 +903,76 @@ def main():
         print(f"\n💡 RECOMMENDATIONS:")
         for rec in safety_report['recommendations']:
             print(f"  • {rec}")
+
+
+def write_json(obj):
+    """Write reports to stdout as indented JSON, encoded in one go"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_dumps(obj, indent=True) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def main():
+    """Main function for CLI usage"""
+    # Options may appear anywhere; strip them before positional parsing
+    use_cache = "--no-cache" not in sys.argv
+    full = "--full" in sys.argv
+    as_json = "--json" in sys.argv
+    probe = "--probe-source" in sys.argv
+    sys.argv = [arg for arg in sys.argv 
+                if arg not in ("--no-cache", "--full", "--json", "--probe-source")]
+    
+    if "--batch" in sys.argv:
+        index = sys.argv.index("--batch")
+        if index + 1 >= len(sys.argv):
+            print("Usage: python security_checker.py --batch <requirements.txt> [--no-cache] [--full] [--json] [--probe-source]")
+            sys.exit(1)
+            
+        # Same requirements parsing as package_installer's install-many
+        from package_installer import read_requirements
+        
+        packages = read_requirements(sys.argv[index + 1])
+        checker = SecurityChecker(use_cache=use_cache, probe_source_urls=probe)
+        
+        if as_json:
+            write_json(checker.check_packages_safety(packages, full=full))
+            return
+            
+        for (package_name, version), safety_report in zip(packages, 
+                                                          checker.check_packages_safety(packages, full=full)):
+            print(f"🔒 SECURITY CHECK FOR: {package_name} ({version or 'latest'})")
+            print("=" * 50)
+            print_report(safety_report)
+            print()
+            
+        print("=" * 50)
+        print(f"Security check completed: {len(packages)} package(s).")
+        return
+        
+    if len(sys.argv) < 2:
+        print("Usage: python security_checker.py <package> [version] [--no-cache] [--full] [--json] [--probe-source]")
+        print("       python security_checker.py --batch <requirements.txt> [--no-cache] [--full] [--json] [--probe-source]")
+        sys.exit(1)
+        
+    checker = SecurityChecker(use_cache=use_cache, probe_source_urls=probe)
+    package_name = sys.argv[1]
+    version = sys.argv[2] if len(sys.argv) > 2 else None
+    
+    if as_json:
+        write_json(checker.check_package_safety(package_name, version, full=full))
+        return
+        
+    print(f"🔒 SECURITY CHECK FOR: {package_name} ({version or 'latest'})")
+    print("=" * 50)
+    
+    safety_report = checker.check_package_safety(package_name, version, full=full)
+    
+    # Print results
+    print_report(safety_report)
             
     print("\n" + "=" * 50)
     print("Security check completed.")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Shared validation tests for package-installer skill
+(run through validation_simple.py or validation_tests.py)
+"""
+
+import sys
+import os
+import io
+import json
+import importlib.util
+import threading
+import contextlib
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson  # optional: faster parsing of the reference JSON files
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+@lru_cache(maxsize=4)
+def _load_json(path, mtime_ns):
+    """Parse a JSON file once per on-disk version (mtime_ns is part of the cache key)"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+def load_json(path):
+    """Parsed JSON file, reparsed only when the file changes"""
+    return _load_json(path, os.stat(path).st_mtime_ns)
+
+class ThreadLocalStream(io.TextIOBase):
+    """Stand-in for sys.stdout/sys.stderr sending each thread's writes to its own target"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def write(self, text):
+        return getattr(self.local, 'target', self.stream).write(text)
+    
+    def flush(self):
+        getattr(self.local, 'target', self.stream).flush()
+
+_streams_lock = threading.Lock()
+
+@contextlib.contextmanager
+def redirect_thread_output(stdout, stderr=None):
+    """Like contextlib.redirect_stdout/stderr, but only for the calling thread"""
+    redirected = []
+    for name, target in (('stdout', stdout), ('stderr', stderr)):
+        if target is None:
+            continue
+        with _streams_lock:
+            stream = getattr(sys, name)
+            if not isinstance(stream, ThreadLocalStream):
+                stream = ThreadLocalStream(stream)
+                setattr(sys, name, stream)
+        redirected.append((stream, getattr(stream.local, 'target', None)))
+        stream.local.target = target
+    try:
+        yield
+    finally:
+        for stream, previous in redirected:
+            if previous is None:
+                del stream.local.target
+            else:
+                stream.local.target = previous
+
+_scripts = {}
+_scripts_lock = threading.Lock()
+
+def load_script(name):
+    """Import scripts/<name>.py once, without touching sys.path"""
+    with _scripts_lock:
+        module = _scripts.get(name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(name, os.path.join('scripts', f'{name}.py'))
+            module = importlib.util.module_from_spec(spec)
+            # Registered before running it: dataclasses look their module up here
+            sys.modules[name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[name]
+                raise
+            _scripts[name] = module
+        return module
+
+def run_command(script, *args, timeout=15, stdlib_only=False):
+    """Run a script's CLI, returning (exit code, stderr output)
+    
+    The script's main() runs in-process with a patched sys.argv; set
+    CLAWDBOT_TEST_CLI=1 to spawn a real interpreter instead. Scripts that
+    import nothing outside the standard library (stdlib_only) then start
+    without site processing.
+    """
+    if os.environ.get('CLAWDBOT_TEST_CLI') == '1':
+        # -s: no user site-packages; -S: no site at all (third-party imports fail)
+        flags = ['-S'] if stdlib_only else ['-s']
+        env = {**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'}
+        result = subprocess.run([sys.executable, *flags, os.path.join('scripts', script), *args], 
+                              capture_output=True, text=True, timeout=timeout, env=env)
+        return result.returncode, result.stderr
+    
+    module = load_script(os.path.splitext(script)[0])
+    saved_argv = sys.argv
+    sys.argv = [script, *args]
+    errors = io.StringIO()
+    try:
+        with redirect_thread_output(io.StringIO(), errors):
+            module.main()
+        returncode = 0
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except Exception as e:
+        errors.write(f"{type(e).__name__}: {e}")
+        returncode = 1
+    finally:
+        sys.argv = saved_argv
+    return returncode, errors.getvalue()
+
+def test_skill_structure():
+    """Test skill file structure"""
+    # Grouped by directory: one listing per directory instead of one stat per file
+    required_files = {
+        '.': ['SKILL.md', 'requirements.txt'],
+        'scripts': ['environment_manager.py', 'package_installer.py', 'security_checker.py'],
+        'references': ['package_database.json', 'security_guidelines.md', 'approved_packages_list.md']
+    }
+    
+    missing_files = []
+    for directory, names in required_files.items():
+        try:
+            with os.scandir(directory) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        for name in names:
+            if name not in present:
+                missing_files.append(name if directory == '.' else f"{directory}/{name}")
+    
+    if missing_files:
+        return False, f"Fichiers manquants: {missing_files}"
+    
+    print("All required files present")
+    return True, "Structure du skill complète"
+
+def test_environment_manager():
+    """Test Environment Manager functionality"""
+    try:
+        EnvironmentManager = load_script('environment_manager').EnvironmentManager
+        
+        env_manager = EnvironmentManager()
+        envs = env_manager.list_environments(include_size=True)
+        
+        print(f"Environnements disponibles: {len(envs)}")
+        for env in envs:
+            print(f"  - {env['name']}: {env['size_mb']:.1f}MB")
+            
+        return True, "EnvironmentManager fonctionne"
+        
+    except Exception as e:
+        return False, f"EnvironmentManager erreur: {e}"
+
+def test_environment_creation():
+    """Test environment creation"""
+    try:
+        EnvironmentManager = load_script('environment_manager').EnvironmentManager
+        
+        success, message = EnvironmentManager().create_environment("test_env")
+        print(f"Création test: {success} - {message}")
+        
+        return True, "Création d'environnement fonctionne"
+        
+    except Exception as e:
+        return False, f"Création d'environnement erreur: {e}"
+
+def test_security_checker():
+    """Test Security Checker functionality"""
+    try:
+        SecurityChecker = load_script('security_checker').SecurityChecker
+        
+        checker = SecurityChecker()
+        
+        # Tester un package sûr
+        safety_report = checker.check_package_safety('requests')
+        print(f"Status: {safety_report['overall_status']}")
+        print(f"Score: {safety_report['score']}/100")
+        
+        return True, "SecurityChecker fonctionne"
+        
+    except Exception as e:
+        return False, f"SecurityChecker erreur: {e}"
+
+def test_unknown_package():
+    """Test Security Checker on an unknown package"""
+    try:
+        SecurityChecker = load_script('security_checker').SecurityChecker
+        
+        suspicious_report = SecurityChecker().check_package_safety('unknown_package_xyz')
+        print(f"Suspicious package status: {suspicious_report['overall_status']}")
+        
+        return True, "Package inconnu évalué"
+        
+    except Exception as e:
+        return False, f"SecurityChecker erreur: {e}"
+
+def test_package_database():
+    """Test Package Database"""
+    try:
+        db = load_json('references/package_database.json')
+        
+        print(f"Categories: {len(db['trusted_packages'])}")
+        for category, packages in db['trusted_packages'].items():
+            print(f"  - {category}: {len(packages)} packages")
+        
+        total_packages = sum(len(packages) for packages in db['trusted_packages'].values())
+        print(f"Total packages: {total_packages}")
+        print(f"Whitelist: {len(db['security_whitelist'])} packages")
+        
+        return True, "Package database valide"
+        
+    except Exception as e:
+        return False, f"Package database erreur: {e}"
+
+def test_security_guidelines():
+    """Test Security Guidelines"""
+    try:
+        with open('references/security_guidelines.md', 'r') as f:
+            guidelines = f.read()
+        
+        print(f"Document length: {len(guidelines)} characters")
+        return True, "Security guidelines disponibles"
+        
+    except Exception as e:
+        return False, f"Security guidelines erreur: {e}"
+
+def test_approved_packages():
+    """Test Approved Packages List"""
+    try:
+        with open('references/approved_packages_list.md', 'r') as f:
+            approved_list = f.read()
+        
+        lines = approved_list.split('\n')
+        package_count = 0
+        
+        for line in lines:
+            if '| Package | Version |' in line:
+                break
+            elif line.strip().startswith('|') and '---' not in line:
+                if line.strip():
+                    package_count += 1
+        
+        print(f"Package categories found: {package_count}")
+        return True, "Approved packages list valide"
+        
+    except Exception as e:
+        return False, f"Approved packages list erreur: {e}"
+
+def test_main_commands():
+    """Test command line commands"""
+    try:
+        # Test environment listing
+        returncode, stderr = run_command('environment_manager.py', 'list', timeout=10, stdlib_only=True)
+        if returncode == 0:
+            print("Environment listing command works")
+        else:
+            print("Environment listing command failed")
+            return False, f"Environment listing failed: {stderr}"
+        
+        # Test security check
+        returncode, stderr = run_command('security_checker.py', 'requests', timeout=15)
+        if returncode == 0:
+            print("Security check command works")
+        else:
+            print("Security check command failed")
+            return False, f"Security check failed: {stderr}"
+        
+        return True, "Commandes opérationnelles"
+        
+    except Exception as e:
+        return False, f"Commandes erreur: {e}"
+
+# (title, test) in report order
+TESTS_MINIMAL = [
+    ("Skill Structure", test_skill_structure),
+    ("Environment Manager", test_environment_manager),
+    ("Security Checker", test_security_checker),
+    ("Package Database", test_package_database),
+    ("Command Line Commands", test_main_commands)
+]
+
+TESTS_FULL = [
+    ("Skill Structure", test_skill_structure),
+    ("Environment Manager", test_environment_manager),
+    ("Environment Creation", test_environment_creation),
+    ("Security Checker", test_security_checker),
+    ("Unknown Package", test_unknown_package),
+    ("Package Database", test_package_database),
+    ("Security Guidelines", test_security_guidelines),
+    ("Approved Packages List", test_approved_packages),
+    ("Command Line Commands", test_main_commands)
+]
+
+# Tests that change shared state (test_environment_creation builds an
+# environment the other tests list and size): run alone, after the rest
+SERIAL_TESTS = {test_environment_creation}
+
+# Status labels, plain or with emoji (for consoles that can display them)
+LABELS = {
+    False: {"pass": "PASS", "fail": "FAIL", "error": "ERROR", "done": "", "warn": ""},
+    True: {"pass": "✅ PASS", "fail": "❌ FAIL", "error": "❌ ERROR", "done": "🎉 ", "warn": "⚠️  "}
+}
+
+def run_test(number, title, test_func, labels):
+    """Run one test with its output captured: (name, success, message, output)"""
+    output = io.StringIO()
+    with redirect_thread_output(output):
+        print(f"\n=== TEST {number}: {title} ===")
+        try:
+            success, message = test_func()
+            status = labels["pass"] if success else labels["fail"]
+            print(f"{status}: {message}")
+        except Exception as e:
+            success, message = False, str(e)
+            print(f"{labels['error']} in {test_func.__name__}: {e}")
+    return test_func.__name__, success, message, output.getvalue()
+
+def run(tests, banner, emoji=False):
+    """Run tests and print their reports and a summary; returns the exit code"""
+    labels = LABELS[emoji]
+    print(banner)
+    print("=" * 50)
+    
+    numbered = list(enumerate(tests, 1))
+    saved_streams = sys.stdout, sys.stderr
+    try:
+        # The other tests only read shared state and mostly wait on I/O: run
+        # them all at once, each with its own output buffer
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {number: executor.submit(run_test, number, title, test_func, labels)
+                       for number, (title, test_func) in numbered
+                       if test_func not in SERIAL_TESTS}
+            reports = {number: future.result() for number, future in futures.items()}
+        
+        for number, (title, test_func) in numbered:
+            if test_func in SERIAL_TESTS:
+                reports[number] = run_test(number, title, test_func, labels)
+    finally:
+        # Drop the per-thread stream wrappers installed while capturing
+        sys.stdout, sys.stderr = saved_streams
+    
+    # Reports in test order
+    results = []
+    for number, _ in numbered:
+        name, success, message, output = reports[number]
+        sys.stdout.write(output)
+        results.append((name, success, message))
+    
+    # Summary
+    print("\n" + "=" * 50)
+    print("TEST SUMMARY:")
+    passed = sum(1 for _, success, _ in results if success)
+    total = len(results)
+    
+    print(f"Tests passés: {passed}/{total}")
+    
+    if passed == total:
+        print(f"\n{labels['done']}ALL TESTS PASSED - SKILL READY FOR PRODUCTION")
+        return 0
+    else:
+        print(f"\n{labels['warn']}{total - passed} tests failed - SKILL NEEDS FIXES")
+        return 1
@@ -10,15 +10,39 @@ ERREURS DÉTECTÉES dans l'implémentation précédente:
 """
 
 import os
+import re
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List
 from datetime import datetime, timedelta
+from urllib3.util.retry import Retry
+
+try:
+    import ahocorasick  # pyahocorasick (optionnel): tous les mots-clés en un seul passage
+except ImportError:
+    ahocorasick = None
+
+MOLTBOT_API_URL = "http://localhost:18789/api/agent/message"
+
+# Session partagée: connexions keep-alive réutilisées d'un appel à l'autre
+# (pas de nouvelle connexion TCP par article)
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, 
+                                      max_retries=Retry(total=1, backoff_factor=0.1)))
 
 class ImprovedPreCognitiveFilter:
     def __init__(self):
         self.config = self.load_config()
+        # Niveaux par priorité décroissante; les deux matchers renvoient un rang
+        self.keyword_levels = list(self.config["keywords"])
+        self.keyword_automaton = self.build_keyword_automaton()
+        self.keyword_regex = self.build_keyword_regex()
         self.state_file = "filter_state.json"
+        # Journal en ajout seul: un item traité = une ligne, jamais de réécriture
+        self.items_file = "filter_processed_items.jsonl"
+        self._items_log = None
         self.load_state()
     
     def load_config(self) -> Dict:
@@ -41,46 +65,143 @@ class ImprovedPreCognitiveFilter:
             }
         }
     
+    def build_keyword_automaton(self):
+        """Automate Aho-Corasick mot-clé -> rang du niveau, None sans pyahocorasick"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for rank, keywords in enumerate(self.config["keywords"].values()):
+            for keyword in keywords:
+                # Un mot-clé présent à plusieurs niveaux garde le plus prioritaire
+                if keyword not in automaton:
+                    automaton.add_word(keyword, rank)
+        automaton.make_automaton()
+        return automaton
+    
+    def build_keyword_regex(self) -> re.Pattern:
+        """Regex unique, un groupe par niveau (match.lastindex - 1 = rang du niveau)"""
+        groups = []
+        for keywords in self.config["keywords"].values():
+            # (?!) ne matche jamais: un niveau vide ne doit pas matcher la chaîne vide
+            groups.append("(" + ("|".join(map(re.escape, keywords)) or "(?!)") + ")")
+        return re.compile("|".join(groups), re.IGNORECASE)
+    
     def load_state(self):
         """Persistance des états"""
         try:
             with open(self.state_file, 'r') as f:
                 self.state = json.load(f)
         except:
-            self.state = {"last_check": None, "processed_items": []}
+            self.state = {"last_check": None}
+        
+        # Ancien format: items dans l'en-tête, migrés vers le journal au prochain save
+        self._unlogged_items = self.state.pop("processed_items", [])
+        self.state["processed_items"] = self._unlogged_items + self.load_processed_items()
+        # Index des items traités: test "déjà vu ?" en O(1) au lieu d'un parcours de liste
+        self.processed_keys = {self.item_key(item) for item in self.state["processed_items"]}
+    
+    def load_processed_items(self) -> List:
+        """Relecture du journal des items traités, ligne par ligne"""
+        items = []
+        try:
+            with open(self.items_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        items.append(json.loads(line))
+        except OSError:
+            pass
+        return items
+    
+    @staticmethod
+    def item_key(item) -> str:
+        """Clé d'identité d'un item (JSON canonique: deux dicts égaux ont la même clé)"""
+        return json.dumps(item, sort_keys=True)
+    
+    def is_processed(self, item) -> bool:
+        """Item déjà traité (lors de cette session ou d'une précédente) ?"""
+        return self.item_key(item) in self.processed_keys
+    
+    def mark_processed(self, item):
+        """Ajoute un item traité à l'état et au journal (écriture bufferisée)"""
+        self.state["processed_items"].append(item)
+        self.processed_keys.add(self.item_key(item))
+        self._open_items_log().write(json.dumps(item) + "\n")
+    
+    def _open_items_log(self):
+        """Journal ouvert en ajout (une seule fois pour toute la session)"""
+        if self._items_log is None:
+            self._items_log = open(self.items_file, 'a', buffering=8192)
+            # Les items de l'ancien format passent en tête du journal
+            for old_item in self._unlogged_items:
+                self._items_log.write(json.dumps(old_item) + "\n")
+            self._unlogged_items = []
+        return self._items_log
     
     def save_state(self):
         """Sauvegarde des états"""
-        with open(self.state_file, 'w') as f:
-            json.dump(self.state, f)
+        if self._unlogged_items:
+            self._open_items_log()
+        if self._items_log is not None:
+            self._items_log.flush()
+        
+        # Seul le petit en-tête est réécrit, via un fichier temporaire
+        # renommé atomiquement (jamais d'état à moitié écrit)
+        header = {key: value for key, value in self.state.items() if key != "processed_items"}
+        tmp_file = self.state_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(header, f)
+        os.replace(tmp_file, self.state_file)
+    
+    def close(self):
+        """Sauvegarde l'état et ferme le journal"""
+        self.save_state()
+        if self._items_log is not None:
+            self._items_log.close()
+            self._items_log = None
     
     def enhanced_keyword_filter(self, text: str) -> tuple[bool, str]:
         """Filtre mots-clés avec niveaux de priorité"""
-        text_lower = text.lower()
+        if self.keyword_automaton is not None:
+            ranks = (rank for _, rank in self.keyword_automaton.iter(text.lower()))
+        else:
+            ranks = (match.lastindex - 1 for match in self.keyword_regex.finditer(text))
         
-        for level, keywords in self.config["keywords"].items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return True, level
+        # Les occurrences arrivent dans l'ordre du texte: garder le niveau
+        # le plus prioritaire, pas le premier trouvé
+        best = None
+        for rank in ranks:
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
         
-        return False, "none"
+        if best is None:
+            return False, "none"
+        return True, self.keyword_levels[best]
     
     def call_moltbot_api(self, data: Dict) -> str:
         """Intégration réelle avec Moltbot"""
         try:
             # Appel vers l'API Moltbot locale
-            response = requests.post(
-                "http://localhost:18789/api/agent/message",
+            response = _SESSION.post(
+                MOLTBOT_API_URL,
                 json={
                     "message": f"SIGNAL CRITIQUE: {data['title']}",
                     "context": data
                 },
-                timeout=30
+                timeout=(1, 30)  # (connexion, lecture)
             )
             return response.json().get("response", "Erreur API")
         except Exception as e:
             return f"Erreur Moltbot: {e}"
     
+    def call_moltbot_api_batch(self, articles: List[Dict]) -> List[str]:
+        """Appels Moltbot en parallèle (I/O réseau), réponses dans l'ordre des articles"""
+        if not articles:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(articles))) as executor:
+            return list(executor.map(self.call_moltbot_api, articles))
+    
     def process_with_priority(self, articles: List[Dict]) -> List[Dict]:
         """Traitement avec système de priorité"""
         prioritized = []
@@ -4,22 +4,43 @@ FILTRE PRE-COGNITIF - Architecture "Entonnoir"
 Philosophie: BRUIT vs SIGNAL (99% filtré, 1% vers IA)
 """
 
+import os
+import re
+import asyncio
+import logging
+import aiohttp
 import requests
 import time
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+try:
+    import ahocorasick  # pyahocorasick (optionnel): tous les mots-clés en un seul passage
+except ImportError:
+    ahocorasick = None
+
+# Niveau via SCOUT_LOG (DEBUG pour suivre chaque filtre); par défaut seuls
+# les signaux, exécutions et erreurs sortent: aucune I/O par article écarté
+log = logging.getLogger("scout")
+
 # =============================================================================
 # CONFIGURATION ZERO-TOKEN
 # =============================================================================
 
-# Mots-clés DANGER (Filtre 1)
-TRIGGER_KEYWORDS = [
+# Mots-clés DANGER (Filtre 1) - figés: l'automate et la regex sont compilés
+# une fois au chargement et ne verraient pas un ajout ultérieur
+TRIGGER_KEYWORDS = frozenset({
     "crash", "scam", "hack", "crisis", "default", "halted", "investigation",
     "bankruptcy", "ceo resigns", "sec", "fda rejected", "exploit", "breach",
     "suspended", "delisted", "fraud", "lawsuit", "emergency", "collapse"
-]
+})
+
+# Sources d'actualités: URLs renvoyant une liste JSON d'articles
+# ({"title": ..., "source": ...}); vide = simulation fetch_news_api()
+NEWS_SOURCES: List[str] = []
+POLL_INTERVAL = 30  # secondes entre deux cycles
 
 # Seuils de volatilité (Filtre 2)
 VOLATILITY_THRESHOLD = 0.05  # 5% de mouvement
@@ -34,6 +55,27 @@ SENTIMENT_THRESHOLD = 0.5  # Seuil pour réveiller l'IA
 
 analyzer = SentimentIntensityAnalyzer()
 
+def build_automaton(keywords) -> Optional["ahocorasick.Automaton"]:
+    """Automate Aho-Corasick sur les mots-clés (None sans pyahocorasick)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_TRIGGER_AUTOMATON = build_automaton(TRIGGER_KEYWORDS)
+# Sans pyahocorasick: une seule regex compilée plutôt qu'un `in` par mot-clé
+# (IGNORECASE évite aussi la copie en minuscules du titre)
+_TRIGGER_RE = re.compile("|".join(map(re.escape, sorted(TRIGGER_KEYWORDS))), re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
+def sentiment_score(text: str) -> float:
+    """Score VADER compound d'un titre, calculé une seule fois par titre
+    (les mêmes dépêches reviennent d'une source et d'un cycle à l'autre)"""
+    return analyzer.polarity_scores(text)['compound']
+
 def fetch_news_api() -> List[Dict]:
     """ÉTAPE A: L'ASPIRATEUR - Scraping hard-coded"""
     # Simulation - remplacer par vos vraies sources
@@ -45,6 +87,23 @@ def fetch_news_api() -> List[Dict]:
     ]
     return mock_news
 
+async def fetch_source(session: aiohttp.ClientSession, url: str) -> List[Dict]:
+    """Articles d'une source (liste vide si elle ne répond pas)"""
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            response.raise_for_status()
+            return await response.json()
+    except Exception as e:
+        log.warning("❌ SOURCE %s: %s", url, e)
+        return []
+
+async def fetch_all_news(session: aiohttp.ClientSession) -> List[Dict]:
+    """ÉTAPE A en parallèle: un cycle dure la source la plus lente, pas leur somme"""
+    if not NEWS_SOURCES:
+        return fetch_news_api()
+    batches = await asyncio.gather(*(fetch_source(session, url) for url in NEWS_SOURCES))
+    return [article for batch in batches for article in batch]
+
 def fetch_price_data(symbol: str) -> Optional[Dict]:
     """Récupération des prix (Alpha Vantage, Yahoo, etc.)"""
     # Simulation - remplacer par vraie API
@@ -61,53 +120,57 @@ def fetch_price_data(symbol: str) -> Optional[Dict]:
 
 def filter_keywords(text: str) -> bool:
     """Filtre 1: Mots-clés DANGER"""
-    text_lower = text.lower()
-    has_keyword = any(keyword in text_lower for keyword in TRIGGER_KEYWORDS)
+    if _TRIGGER_AUTOMATON is not None:
+        has_keyword = next(_TRIGGER_AUTOMATON.iter(text.lower()), None) is not None
+    else:
+        has_keyword = _TRIGGER_RE.search(text) is not None
     
     if not has_keyword:
-        print(f"💤 FILTRE 1: Aucun mot-clé danger -> POUBELLE")
+        log.debug("💤 FILTRE 1: Aucun mot-clé danger -> POUBELLE")
         return False
     
-    print(f"⚠️  FILTRE 1: Mot-clé détecté -> GARDE")
+    log.debug("⚠️  FILTRE 1: Mot-clé détecté -> GARDE")
     return True
 
+def is_volatile(current: float, average: float, change_1min: float) -> bool:
+    """Noyau du filtre 2: deux comparaisons sur des floats, sans dict ni I/O
+    (appelable tel quel sur un grand nombre de cotations)"""
+    # Mouvement rapide (1 minute), sinon écart à la moyenne
+    if abs(change_1min) > VOLATILITY_THRESHOLD:
+        return True
+    return average <= 0 or abs(current - average) / average >= PRICE_CHANGE_THRESHOLD
+
 def filter_volatility(price_data: Dict) -> bool:
     """Filtre 2: Volatilité mathématique"""
     if not price_data:
         return False
     
     current = price_data.get("current", 0)
-    previous = price_data.get("previous", 0)
     average = price_data.get("average_5d", 0)
     change_1min = abs(price_data.get("change_1min", 0))
     
-    # Mouvement rapide (1 minute)
-    if change_1min > VOLATILITY_THRESHOLD:
-        print(f"🚨 FILTRE 2: Mouvement rapide {change_1min:.1%} -> GARDE")
-        return True
-    
-    # Écart à la moyenne
-    if average > 0:
-        deviation = abs(current - average) / average
-        if deviation < PRICE_CHANGE_THRESHOLD:
-            print(f"💤 FILTRE 2: Prix stable ({deviation:.1%}) -> POUBELLE")
-            return False
+    if not is_volatile(current, average, change_1min):
+        log.debug("💤 FILTRE 2: Prix stable (%.1f%%) -> POUBELLE", 
+                  abs(current - average) / average * 100)
+        return False
     
-    print(f"📈 FILTRE 2: Volatilité détectée -> GARDE")
+    if change_1min > VOLATILITY_THRESHOLD:
+        log.debug("🚨 FILTRE 2: Mouvement rapide %.1f%% -> GARDE", change_1min * 100)
+    else:
+        log.debug("📈 FILTRE 2: Volatilité détectée -> GARDE")
     return True
 
 def filter_sentiment(text: str) -> bool:
     """Filtre 3: Sentiment GRATUIT (VADER)"""
-    scores = analyzer.polarity_scores(text)
-    compound = scores['compound']  # -1 (horrible) à +1 (génial)
+    compound = sentiment_score(text)  # -1 (horrible) à +1 (génial)
     
     # On ne réveille l'IA que pour les extrêmes
     if abs(compound) < SENTIMENT_THRESHOLD:
-        print(f"💤 FILTRE 3: Sentiment neutre ({compound:.2f}) -> POUBELLE")
+        log.debug("💤 FILTRE 3: Sentiment neutre (%.2f) -> POUBELLE", compound)
         return False
     
-    sentiment_label = "TRÈS NÉGATIF" if compound < 0 else "TRÈS POSITIF"
-    print(f"😱 FILTRE 3: {sentiment_label} ({compound:.2f}) -> GARDE")
+    log.debug("😱 FILTRE 3: %s (%.2f) -> GARDE", 
+              "TRÈS NÉGATIF" if compound < 0 else "TRÈS POSITIF", compound)
     return True
 
 def check_news_relevance(article: Dict) -> bool:
@@ -117,7 +180,7 @@ def check_news_relevance(article: Dict) -> bool:
     """
     title = article.get("title", "")
     
-    print(f"\n🔍 ANALYSE: {title}")
+    log.debug("🔍 ANALYSE: %s", title)
     
     # Les 3 filtres en cascade
     if not filter_keywords(title):
@@ -133,6 +196,16 @@ def check_news_relevance(article: Dict) -> bool:
     
     return True
 
+def filter_batch(articles: List[Dict]) -> List[Dict]:
+    """
+    TAMIS HEURISTIQUE PAR LOT
+    Chaque filtre passe sur tout le lot avant le suivant: le sentiment
+    n'est calculé que pour les survivants du filtre mots-clés
+    """
+    titles = [article.get("title", "") for article in articles]
+    survivors = [i for i, title in enumerate(titles) if filter_keywords(title)]
+    return [articles[i] for i in survivors if filter_sentiment(titles[i])]
+
 # =============================================================================
 # ÉTAPE C: LE RÉVEIL (HANDOFF VERS IA)
 # =============================================================================
@@ -155,14 +228,14 @@ def call_sila_ai(article: Dict) -> str:
     """
     
     # Simulation d'appel API (remplacer par vraie intégration)
-    print(f"🤖 APPEL IA: Analyse en cours...")
+    log.info("🤖 APPEL IA: Analyse en cours...")
     time.sleep(1)  # Simulation
     
     return "ANALYSE IA: Gravité 8/10 - Vendre positions Tesla immédiatement"
 
 def execute_trade(analysis: str):
     """Exécution des ordres basés sur l'analyse IA"""
-    print(f"💰 EXÉCUTION: {analysis}")
+    log.warning("💰 EXÉCUTION: %s", analysis)
 
 # =============================================================================
 # BOUCLE PRINCIPALE
@@ -170,47 +243,56 @@ def execute_trade(analysis: str):
 
 def main_loop():
     """Boucle de surveillance continue"""
-    print("🚀 DÉMARRAGE DU FILTRE PRE-COGNITIF")
-    print("📊 Philosophie: 99% BRUIT filtré, 1% SIGNAL vers IA")
+    logging.basicConfig(format="%(asctime)s %(message)s", datefmt="%H:%M:%S")
+    log.setLevel(os.environ.get("SCOUT_LOG", "WARNING").upper())
+    asyncio.run(watch_news())
+
+async def watch_news():
+    """Cycles asynchrones: sources récupérées en parallèle, calcul hors de la boucle d'événements"""
+    log.info("🚀 DÉMARRAGE DU FILTRE PRE-COGNITIF")
+    log.info("📊 Philosophie: 99% BRUIT filtré, 1% SIGNAL vers IA")
     
+    loop = asyncio.get_running_loop()
     cycle = 0
     
-    while True:
-        cycle += 1
-        print(f"\n{'='*50}")
-        print(f"CYCLE {cycle} - {time.strftime('%H:%M:%S')}")
-        print(f"{'='*50}")
-        
-        try:
-            # ÉTAPE A: Aspiration des données
-            latest_news = fetch_news_api()
-            print(f"📥 {len(latest_news)} articles récupérés")
-            
-            signals_detected = 0
+    async with aiohttp.ClientSession() as session:
+        while True:
+            cycle += 1
+            log.info("CYCLE %d", cycle)
             
-            # ÉTAPE B: Filtrage heuristique
-            for article in latest_news:
-                if check_news_relevance(article):
-                    signals_detected += 1
-                    
-                    print(f"\n🚨 SIGNAL #{signals_detected} DÉTECTÉ!")
-                    print(f"⚡ Activation de l'IA pour analyse profonde...")
+            try:
+                # ÉTAPE A: Aspiration des données (toutes les sources à la fois)
+                latest_news = await fetch_all_news(session)
+                log.info("📥 %d articles récupérés", len(latest_news))
+                
+                # ÉTAPE B: Filtrage heuristique (tout le lot d'un coup, dans un
+                # thread: VADER ne doit pas bloquer la boucle d'événements)
+                signals = await loop.run_in_executor(None, filter_batch, latest_news)
+                signals_detected = len(signals)
+                
+                for number, article in enumerate(signals, 1):
+                    log.warning("🚨 SIGNAL #%d DÉTECTÉ: %s", number, article.get('title', ''))
+                    log.info("⚡ Activation de l'IA pour analyse profonde...")
                     
                     # ÉTAPE C: Réveil de l'IA (COÛT EN TOKENS)
-                    sila_response = call_sila_ai(article)
+                    sila_response = await loop.run_in_executor(None, call_sila_ai, article)
                     execute_trade(sila_response)
+                
+                if signals_detected == 0:
+                    log.info("✅ Aucun signal critique - %d articles filtrés", len(latest_news))
+                
+                log.info("💰 COÛT: %d appels IA sur %d articles", signals_detected, len(latest_news))
+                if latest_news:
+                    log.info("📊 EFFICACITÉ: %.1f%% de bruit filtré", 
+                             (len(latest_news) - signals_detected) / len(latest_news) * 100)
+                else:
+                    log.warning("⚠️  Aucun article récupéré (sources indisponibles?)")
+                
+            except Exception as e:
+                log.error("❌ ERREUR: %s", e)
             
-            if signals_detected == 0:
-                print(f"✅ Aucun signal critique - {len(latest_news)} articles filtrés")
-            
-            print(f"💰 COÛT: {signals_detected} appels IA sur {len(latest_news)} articles")
-            print(f"📊 EFFICACITÉ: {((len(latest_news) - signals_detected) / len(latest_news) * 100):.1f}% de bruit filtré")
-            
-        except Exception as e:
-            print(f"❌ ERREUR: {e}")
-        
-        # Attente avant le prochain cycle
-        time.sleep(30)  # 30 secondes
+            # Attente avant le prochain cycle (sans bloquer la boucle)
+            await asyncio.sleep(POLL_INTERVAL)
 
 if __name__ == "__main__":
     main_loop()
\ No newline at end of file
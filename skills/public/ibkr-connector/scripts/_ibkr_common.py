@@ -0,0 +1,31 @@
+"""
+Connection bootstrap shared by the IBKR scripts.
+"""
+
+import socket
+import threading
+
+def tune_socket(sock):
+    # Requests and orders are small writes: send them without Nagle delay,
+    # and let the OS notice a dead TWS link on a long session
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+def connect_and_wait(client, host, port, client_id, timeout=10):
+    """Connect, start the message thread and wait until nextValidId sets client.ready
+
+    Raises ConnectionError if the socket cannot be opened and TimeoutError if
+    TWS does not answer within timeout seconds.
+    """
+    client.connect(host, port, client_id)
+    if not client.isConnected():
+        raise ConnectionError(f"Could not connect to {host}:{port}")
+    tune_socket(client.conn.socket)
+
+    # Start message thread: EClient.run reads the socket and dispatches callbacks
+    threading.Thread(target=client.run, daemon=True).start()
+
+    if not client.ready.wait(timeout):
+        client.disconnect()
+        raise TimeoutError(f"No answer from {host}:{port} after {timeout}s")
+    return client
@@ -6,6 +6,9 @@ Récupère les positions, le P&L et les données de compte.
 Usage:
     python monitor_portfolio.py
     python monitor_portfolio.py --watch AAPL SPY MSFT
+    python monitor_portfolio.py --cache-ttl 60
+    python monitor_portfolio.py --force-refresh
+    python monitor_portfolio.py --json | jq .account_pnl
 
 Environment Variables:
     IBKR_HOST       - TWS host (default: 127.0.0.1)
@@ -16,34 +19,140 @@ Environment Variables:
 import sys
 import time
 import os
+import json
+import argparse
+import itertools
+import threading
 from ibapi.client import EClient
 from ibapi.wrapper import EWrapper
 from ibapi.common import *
 from ibapi.utils import iswrapper
+from collections import defaultdict
 from datetime import datetime
+from _ibkr_common import connect_and_wait
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".moltbot", "ibkr_portfolio_cache.json")
+
+# Seconds each section of a snapshot stays fresh: the account summary moves
+# slowly, positions and P&L do not
+CACHE_TTL = {
+    'positions': 30,
+    'portfolio': 30,
+    'account_pnl': 30,
+    'account_summary': 300
+}
+
+# Account summary tags worth displaying, in display order
+IMPORTANT_TAGS = (
+    'NetLiquidation',
+    'AvailableFunds',
+    'TotalCashValue',
+    'GrossPositionValue',
+    'MaintMarginReq',
+    'EquityWithLoanValue'
+)
+
+# Informational market data farm messages
+IGNORED_CODES = frozenset({2104, 2106, 2158})
+
+# Table rows, formatted straight from the stored dicts
+POSITION_ROW = "{symbol:<10} {position:>12} ${avgCost:>11.2f} {secType:<8} {exchange:<8}".format_map
+PORTFOLIO_ROW = "{symbol:<10} {position:>12} ${marketPrice:>13.2f} ${marketValue:>15.2f} ${unrealizedPNL:>17.2f}".format_map
+SUMMARY_ROW = "  {tag:<25} {value:>15} {currency}".format
+SYMBOL_PNL_ROW = "{symbol:<10} ${daily:>14.2f} ${unrealized:>15.2f} ${value:>14.2f}".format
+
+PORTFOLIO_HEADER = (
+    "\n" + "=" * 100,
+    "PORTFOLIO",
+    "=" * 100,
+    f"{'Symbol':<10} {'Position':>12} {'Market Price':>14} {'Market Value':>16} {'Unrealized P&L':>18}",
+    "-" * 100
+)
+
+def load_cache(path, key, ttls):
+    """Return {section: data} for the sections of the cached snapshot still within their TTL"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f).get(key, {})
+    except (OSError, ValueError):
+        return {}
+
+    now = time.time()
+    return {
+        section: cached['data']
+        for section, cached in entry.items()
+        if section in ttls and now - cached.get('fetched_at', 0) < ttls[section]
+    }
+
+def save_cache(path, key, sections):
+    """Store freshly fetched {section: data} in the snapshot for key"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    now = time.time()
+    entry = cache.setdefault(key, {})
+    for section, data in sections.items():
+        entry[section] = {'fetched_at': now, 'data': data}
+
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # ibapi reports quantities as Decimal; they are cached as floats
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, default=float)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 class PortfolioMonitor(EWrapper, EClient):
-    def __init__(self):
+    def __init__(self, watch_symbols=()):
         EWrapper.__init__(self)
         EClient.__init__(self, self)
         self.positions = {}
         self.portfolio = {}
-        self.account_summary = {}
-        self.pnl = {}
+        self.account_summary = defaultdict(dict)
+        # Kept apart from pnl(), the EWrapper callback that fills them
+        self.account_pnl = {}
+        self.symbol_pnl = {}
         self.connected = False
         self.data_received = False
-        self.watch_symbols = []
+        # Only these symbols are kept (all of them when empty)
+        self.watch_symbols = frozenset(watch_symbols)
+        # With --stream, portfolio rows are printed as they arrive
+        self.stream = False
+        # Set by nextValidId, the first message once the connection is up
+        self.ready = threading.Event()
+        # Set by the *End callbacks, so main() wakes as soon as data is complete
+        self.positions_done = threading.Event()
+        self.portfolio_done = threading.Event()
+        self.summary_done = threading.Event()
+        # reqId -> account (reqPnL) / symbol (reqPnLSingle); pnl_done fires
+        # once every request in pending_pnl has answered
+        self.pnl_accounts = {}
+        self.pnl_symbols = {}
+        self.pending_pnl = set()
+        self.pnl_done = threading.Event()
 
     @iswrapper
     def nextValidId(self, orderId):
         self.connected = True
         print(f"[OK] Connected. Next Order ID: {orderId}")
+        self.ready.set()
 
     @iswrapper
     def position(self, account, contract, position, avgCost):
+        if self.watch_symbols and contract.symbol not in self.watch_symbols:
+            return
         self.positions[contract.symbol] = {
             'account': account,
             'symbol': contract.symbol,
+            'conId': contract.conId,
             'position': position,
             'avgCost': avgCost,
             'secType': contract.secType,
@@ -55,9 +164,12 @@ class PortfolioMonitor(EWrapper, EClient):
     def positionEnd(self):
         print(f"[DATA] Received {len(self.positions)} positions")
         self.data_received = True
+        self.positions_done.set()
 
     @iswrapper
     def updatePortfolio(self, contract, position, marketPrice, marketValue, averageCost, unrealizedPNL, realizedPNL, accountName):
+        if self.watch_symbols and contract.symbol not in self.watch_symbols:
+            return
         self.portfolio[contract.symbol] = {
             'symbol': contract.symbol,
             'position': position,
@@ -68,16 +180,17 @@ class PortfolioMonitor(EWrapper, EClient):
             'realizedPNL': realizedPNL,
             'accountName': accountName
         }
+        if self.stream:
+            sys.stdout.write(PORTFOLIO_ROW(self.portfolio[contract.symbol]) + "\n")
 
     @iswrapper
     def accountDownloadEnd(self, accountName):
         print(f"[DATA] Portfolio download complete for {accountName}")
         self.data_received = True
+        self.portfolio_done.set()
 
     @iswrapper
     def accountSummary(self, reqId, account, tag, value, currency):
-        if account not in self.account_summary:
-            self.account_summary[account] = {}
         self.account_summary[account][tag] = {
             'value': value,
             'currency': currency
@@ -87,208 +200,327 @@ class PortfolioMonitor(EWrapper, EClient):
     def accountSummaryEnd(self, reqId):
         print(f"[DATA] Account summary complete")
         self.data_received = True
+        self.summary_done.set()
 
     @iswrapper
     def pnl(self, reqId, dailyPnL, unrealizedPnL, realizedPnL):
-        self.pnl = {
+        self.account_pnl[self.pnl_accounts[reqId]] = {
             'daily': dailyPnL,
             'unrealized': unrealizedPnL,
             'realized': realizedPnL
         }
+        self._pnl_received(reqId)
+
+    @iswrapper
+    def pnlSingle(self, reqId, pos, dailyPnL, unrealizedPnL, realizedPnL, value):
+        self.symbol_pnl[self.pnl_symbols[reqId]] = {
+            'position': pos,
+            'daily': dailyPnL,
+            'unrealized': unrealizedPnL,
+            'realized': realizedPnL,
+            'value': value
+        }
+        self._pnl_received(reqId)
+
+    def _pnl_received(self, reqId):
+        self.pending_pnl.discard(reqId)
+        if not self.pending_pnl:
+            self.pnl_done.set()
+
+    def request_pnl(self, accounts, positions):
+        """Subscribe to P&L for every account and every given position at once"""
+        req_ids = itertools.count(1000)
+        self.pnl_accounts = {next(req_ids): account for account in accounts}
+        self.pnl_symbols = {next(req_ids): pos['symbol'] for pos in positions}
+
+        # Registered before sending, so every answer finds its reqId
+        self.pending_pnl = set(self.pnl_accounts) | set(self.pnl_symbols)
+        if not self.pending_pnl:
+            self.pnl_done.set()
+
+        for req_id, account in self.pnl_accounts.items():
+            self.reqPnL(req_id, account, "")
+        for req_id, pos in zip(self.pnl_symbols, positions):
+            self.reqPnLSingle(req_id, pos['account'], "", pos['conId'])
+
+    def cancel_pnl(self):
+        for req_id in self.pnl_accounts:
+            self.cancelPnL(req_id)
+        for req_id in self.pnl_symbols:
+            self.cancelPnLSingle(req_id)
 
     @iswrapper
     def error(self, reqId, errorCode, errorString):
-        if errorCode in [2104, 2106, 2158]:
+        if errorCode in IGNORED_CODES:
             return
         print(f"[ERROR] Code {errorCode}: {errorString}")
 
     def is_connected(self):
         return self.connected
 
+def write_lines(lines):
+    """Write a whole block of output at once"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 def print_positions(positions):
     """Display current positions"""
-    print("\n" + "=" * 80)
-    print("POSITIONS")
-    print("=" * 80)
-    print(f"{'Symbol':<10} {'Position':>12} {'Avg Cost':>12} {'Sec Type':<8} {'Exchange':<8}")
-    print("-" * 80)
-
-    for symbol, pos in positions.items():
-        print(f"{pos['symbol']:<10} {pos['position']:>12} ${pos['avgCost']:>11.2f} {pos['secType']:<8} {pos['exchange']:<8}")
-
-    print("-" * 80)
-    print(f"Total positions: {len(positions)}")
-    print("=" * 80)
-
-def print_portfolio(portfolio):
-    """Display portfolio with market values and P&L"""
-    print("\n" + "=" * 100)
-    print("PORTFOLIO")
-    print("=" * 100)
-    print(f"{'Symbol':<10} {'Position':>12} {'Market Price':>14} {'Market Value':>16} {'Unrealized P&L':>18}")
-    print("-" * 100)
-
-    total_market_value = 0
-    total_unrealized_pnl = 0
-
-    for symbol, pos in portfolio.items():
-        print(f"{pos['symbol']:<10} {pos['position']:>12} ${pos['marketPrice']:>13.2f} ${pos['marketValue']:>15.2f} ${pos['unrealizedPNL']:>17.2f}")
-        total_market_value += pos['marketValue']
-        total_unrealized_pnl += pos['unrealizedPNL']
-
-    print("-" * 100)
-    print(f"{'TOTAL':<10} {'':>12} {'':>14} ${total_market_value:>15.2f} ${total_unrealized_pnl:>17.2f}")
-    print("=" * 100)
+    lines = [
+        "\n" + "=" * 80,
+        "POSITIONS",
+        "=" * 80,
+        f"{'Symbol':<10} {'Position':>12} {'Avg Cost':>12} {'Sec Type':<8} {'Exchange':<8}",
+        "-" * 80
+    ]
+    lines += map(POSITION_ROW, positions.values())
+    lines += [
+        "-" * 80,
+        f"Total positions: {len(positions)}",
+        "=" * 80
+    ]
+    write_lines(lines)
+
+def print_portfolio(portfolio, streamed=False):
+    """Display portfolio with market values and P&L (only the totals if the rows were streamed)"""
+    total_market_value = sum(pos['marketValue'] for pos in portfolio.values())
+    total_unrealized_pnl = sum(pos['unrealizedPNL'] for pos in portfolio.values())
+
+    if streamed:
+        lines = ["\n" + "=" * 100, "PORTFOLIO (rows streamed above)"]
+    else:
+        lines = [*PORTFOLIO_HEADER, *map(PORTFOLIO_ROW, portfolio.values())]
+    lines += [
+        "-" * 100,
+        f"{'TOTAL':<10} {'':>12} {'':>14} ${total_market_value:>15.2f} ${total_unrealized_pnl:>17.2f}",
+        "=" * 100
+    ]
+    write_lines(lines)
 
 def print_account_summary(account_summary):
     """Display account information"""
-    print("\n" + "=" * 60)
-    print("ACCOUNT SUMMARY")
-    print("=" * 60)
+    lines = [
+        "\n" + "=" * 60,
+        "ACCOUNT SUMMARY",
+        "=" * 60
+    ]
 
     for account, data in account_summary.items():
-        print(f"\nAccount: {account}")
-        print("-" * 60)
-
-        important_tags = [
-            'NetLiquidation',
-            'AvailableFunds',
-            'TotalCashValue',
-            'GrossPositionValue',
-            'MaintMarginReq',
-            'EquityWithLoanValue'
+        lines.append(f"\nAccount: {account}")
+        lines.append("-" * 60)
+        lines += [
+            SUMMARY_ROW(tag=tag, **data[tag])
+            for tag in IMPORTANT_TAGS
+            if tag in data
         ]
 
-        for tag in important_tags:
-            if tag in data:
-                value = data[tag]['value']
-                currency = data[tag]['currency']
-                print(f"  {tag:<25} {value:>15} {currency}")
+    lines.append("=" * 60)
+    write_lines(lines)
+
+def print_pnl(account_pnl, symbol_pnl):
+    """Display P&L information, per account then per watched symbol"""
+    lines = [
+        "\n" + "=" * 60,
+        "PROFIT & LOSS",
+        "=" * 60
+    ]
+
+    for account, pnl in account_pnl.items():
+        lines += [
+            f"\nAccount: {account}",
+            "-" * 60,
+            f"Daily P&L:     ${pnl.get('daily', 0):>15.2f}",
+            f"Unrealized P&L: ${pnl.get('unrealized', 0):>15.2f}",
+            f"Realized P&L:   ${pnl.get('realized', 0):>15.2f}"
+        ]
 
-    print("=" * 60)
+    if symbol_pnl:
+        lines += [
+            "-" * 60,
+            f"{'Symbol':<10} {'Daily P&L':>15} {'Unrealized P&L':>16} {'Value':>15}"
+        ]
+        lines += [
+            SYMBOL_PNL_ROW(symbol=symbol, **pnl)
+            for symbol, pnl in symbol_pnl.items()
+        ]
 
-def print_pnl(pnl):
-    """Display P&L information"""
-    print("\n" + "=" * 60)
-    print("PROFIT & LOSS")
-    print("=" * 60)
-    print(f"Daily P&L:     ${pnl.get('daily', 0):>15.2f}")
-    print(f"Unrealized P&L: ${pnl.get('unrealized', 0):>15.2f}")
-    print(f"Realized P&L:   ${pnl.get('realized', 0):>15.2f}")
-    print("=" * 60)
+    lines.append("=" * 60)
+    write_lines(lines)
 
-def parse_args(args):
-    result = {
-        'host': os.getenv('IBKR_HOST', '127.0.0.1'),
-        'port': int(os.getenv('IBKR_PORT', '7497')),
-        'client_id': int(os.getenv('IBKR_CLIENT_ID', '2')),
-        'watch': []
-    }
+def print_summary(positions, account_pnl):
+    """Display position count and P&L totals across accounts"""
+    lines = [
+        "\n" + "=" * 80,
+        "SUMMARY",
+        "=" * 80
+    ]
 
-    for i, arg in enumerate(args):
-        if arg == '--watch' and i + 1 < len(args):
-            symbols = args[i + 1].upper().split(',')
-            result['watch'] = [s.strip() for s in symbols]
-        elif arg in ['--help', '-h']:
-            print("Usage: python monitor_portfolio.py [OPTIONS]")
-            print("\nOptions:")
-            print("  --watch SYMBOLS    - Comma-separated symbols to watch (e.g., AAPL,SPY,MSFT)")
-            print("  --host HOST         - TWS host (default: 127.0.0.1)")
-            print("  --port PORT         - TWS port (default: 7497)")
-            print("  --client-id ID      - Client ID (default: 2)")
-            print("\nExample:")
-            print("  python monitor_portfolio.py --watch AAPL,SPY,MSFT")
-            sys.exit(0)
-
-    return result
+    if positions:
+        lines.append(f"Positions: {len(positions)}")
 
-def main():
-    params = parse_args(sys.argv[1:])
+    if account_pnl:
+        daily_pnl = sum(pnl.get('daily', 0) for pnl in account_pnl.values())
+        unrealized_pnl = sum(pnl.get('unrealized', 0) for pnl in account_pnl.values())
+        realized_pnl = sum(pnl.get('realized', 0) for pnl in account_pnl.values())
 
-    print(f"[INIT] Connecting to IBKR at {params['host']}:{params['port']}")
+        pnl_color = "🟢" if daily_pnl >= 0 else "🔴"
+        lines += [
+            f"Daily P&L: {pnl_color} ${daily_pnl:,.2f}",
+            f"Total Unrealized: ${unrealized_pnl:,.2f}",
+            f"Total Realized:   ${realized_pnl:,.2f}"
+        ]
 
-    monitor = PortfolioMonitor()
+    lines.append("=" * 80)
+    write_lines(lines)
 
-    try:
-        monitor.connect(params['host'], params['port'], params['client_id'])
-        print("[INIT] Connection initiated...")
-    except Exception as e:
-        print(f"[FAIL] Could not initiate connection: {e}")
-        return 1
-
-    # Start message thread
-    monitor.nextOrderId()
-
-    # Wait for connection
-    timeout = 10
-    elapsed = 0
-    while not monitor.is_connected() and elapsed < timeout:
-        time.sleep(0.1)
-        elapsed += 0.1
-        monitor.nextOrderId()
-
-    if not monitor.is_connected():
-        print("[FAIL] Connection timeout")
-        monitor.disconnect()
-        return 1
+def parse_args(args):
+    parser = argparse.ArgumentParser(
+        description="Monitor the IBKR portfolio",
+        epilog="Example:\n  python monitor_portfolio.py --watch AAPL,SPY,MSFT",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--watch', type=lambda value: [s.strip() for s in value.upper().split(',')], default=[],
+                        metavar='SYMBOLS', help="Comma-separated symbols to watch (e.g., AAPL,SPY,MSFT)")
+    parser.add_argument('--host', default=os.getenv('IBKR_HOST', '127.0.0.1'), help="TWS host (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=int(os.getenv('IBKR_PORT', '7497')), help="TWS port (default: 7497)")
+    parser.add_argument('--client-id', type=int, default=int(os.getenv('IBKR_CLIENT_ID', '2')), help="Client ID (default: 2)")
+    parser.add_argument('--cache-ttl', type=int, metavar='SECONDS',
+                        help="Reuse positions/P&L fetched less than SECONDS ago (default: 30, 0 disables)")
+    parser.add_argument('--force-refresh', action='store_true', help="Ignore the cached snapshot and fetch everything")
+    parser.add_argument('--stream', action='store_true', help="Print portfolio rows as they arrive instead of after the download")
+    parser.add_argument('--json', action=argparse.BooleanOptionalAction,
+                        help="Print the snapshot as one JSON document (default when stdout is not a terminal)")
+    return vars(parser.parse_args(args))
 
-    # Request all data
-    print("\n[DATA] Requesting portfolio data...")
-    monitor.reqPositions()
-    monitor.reqAccountUpdates(True, "")
-    monitor.reqAccountSummary(0, "All", "$LEDGER")
+def main():
+    params = parse_args(sys.argv[1:])
 
-    # Wait for data
-    print("[WAIT] Waiting for data...")
-    time.sleep(3)
+    as_json = params['json'] if params['json'] is not None else not sys.stdout.isatty()
+    if as_json:
+        # Progress messages go to stderr, so stdout carries only the JSON document
+        out, sys.stdout = sys.stdout, sys.stderr
+
+    ttls = dict(CACHE_TTL)
+    if params['cache_ttl'] is not None:
+        for section in ('positions', 'portfolio', 'account_pnl'):
+            ttls[section] = params['cache_ttl']
+
+    # Watched runs keep only their symbols, so they get their own snapshot
+    cache_key = f"{params['host']}:{params['port']}"
+    if params['watch']:
+        cache_key += "/" + ",".join(sorted(params['watch']))
+    cached = {} if params['force_refresh'] else load_cache(CACHE_PATH, cache_key, ttls)
+    stale = [section for section in CACHE_TTL if section not in cached]
+
+    monitor = PortfolioMonitor(params['watch'])
+    streamed = params['stream'] and 'portfolio' in stale
+    for section, data in cached.items():
+        setattr(monitor, section, data)
+
+    # Per-symbol P&L depends on --watch and is never cached
+    if stale or monitor.watch_symbols:
+        if cached:
+            print(f"[CACHE] Reusing cached {', '.join(cached)}")
+
+        print(f"[INIT] Connecting to IBKR at {params['host']}:{params['port']}")
+
+        try:
+            connect_and_wait(monitor, params['host'], params['port'], params['client_id'])
+        except TimeoutError:
+            print("[FAIL] Connection timeout")
+            return 1
+        except Exception as e:
+            print(f"[FAIL] Could not initiate connection: {e}")
+            return 1
+
+        # Request the sections that are not fresh in the cache
+        print("\n[DATA] Requesting portfolio data...")
+        pending = []
+        if 'positions' in stale:
+            monitor.reqPositions()
+            pending.append(monitor.positions_done)
+        if 'portfolio' in stale:
+            if streamed:
+                write_lines(PORTFOLIO_HEADER)
+                monitor.stream = True
+            monitor.reqAccountUpdates(True, "")
+            pending.append(monitor.portfolio_done)
+        if 'account_summary' in stale:
+            monitor.reqAccountSummary(0, "All", "$LEDGER")
+            pending.append(monitor.summary_done)
+
+        # Wait for data: until every request has completed, at most 5s overall
+        print("[WAIT] Waiting for data...")
+        deadline = time.monotonic() + 5
+        for done in pending:
+            if not done.wait(max(0, deadline - time.monotonic())):
+                print("[WARN] Timed out waiting for data, showing what was received")
+                break
+
+        # P&L needs the account names, and per-symbol P&L the contract ids:
+        # request it all at once, then wait for the slowest answer
+        accounts = []
+        if 'account_pnl' in stale:
+            accounts = sorted({pos['account'] for pos in monitor.positions.values()} | set(monitor.account_summary))
+        watched = [
+            monitor.positions[symbol]
+            for symbol in sorted(monitor.watch_symbols)
+            if 'conId' in monitor.positions.get(symbol, {})
+        ]
+        monitor.request_pnl(accounts, watched)
+        if not monitor.pnl_done.wait(timeout=2):
+            print("[WARN] Timed out waiting for P&L")
+        monitor.cancel_pnl()
 
-    # Check for P&L (requires account name)
-    if monitor.positions:
-        first_account = next(iter(monitor.positions.values()))['account']
-        monitor.reqPnL(first_account, "")
-        time.sleep(1)
+        if 'portfolio' in stale:
+            monitor.reqAccountUpdates(False, "")
+        monitor.disconnect()
+
+        # Only sections that actually came back are cached
+        received = {
+            'positions': monitor.positions_done.is_set(),
+            'portfolio': monitor.portfolio_done.is_set(),
+            'account_summary': monitor.summary_done.is_set(),
+            'account_pnl': all(account in monitor.account_pnl for account in accounts)
+        }
+        save_cache(CACHE_PATH, cache_key, {
+            section: getattr(monitor, section)
+            for section in stale
+            if received[section]
+        })
+    else:
+        print(f"[CACHE] Using cached snapshot for {cache_key} (--force-refresh to fetch)")
+
+    if as_json:
+        sys.stdout = out
+        sys.stdout.write(json.dumps({
+            'positions': monitor.positions,
+            'portfolio': monitor.portfolio,
+            'account_summary': monitor.account_summary,
+            'account_pnl': monitor.account_pnl,
+            'symbol_pnl': monitor.symbol_pnl
+        }, default=str) + "\n")
+        return 0
 
     # Display results
-    print(f"\n{'=' * 80}")
-    print(f"PORTFOLIO MONITORING - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'=' * 80}")
+    write_lines([
+        f"\n{'=' * 80}",
+        f"PORTFOLIO MONITORING - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"{'=' * 80}"
+    ])
 
     if monitor.positions:
         print_positions(monitor.positions)
 
     if monitor.portfolio:
-        print_portfolio(monitor.portfolio)
+        print_portfolio(monitor.portfolio, streamed)
 
     if monitor.account_summary:
         print_account_summary(monitor.account_summary)
 
-    if monitor.pnl:
-        print_pnl(monitor.pnl)
-
-    # Summary
-    print("\n" + "=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
-
-    if monitor.positions:
-        num_positions = len(monitor.positions)
-        print(f"Positions: {num_positions}")
-
-    if monitor.pnl:
-        daily_pnl = monitor.pnl.get('daily', 0)
-        unrealized_pnl = monitor.pnl.get('unrealized', 0)
-        realized_pnl = monitor.pnl.get('realized', 0)
-
-        pnl_color = "🟢" if daily_pnl >= 0 else "🔴"
-        print(f"Daily P&L: {pnl_color} ${daily_pnl:,.2f}")
-        print(f"Total Unrealized: ${unrealized_pnl:,.2f}")
-        print(f"Total Realized:   ${realized_pnl:,.2f}")
-
-    print("=" * 80)
+    if monitor.account_pnl or monitor.symbol_pnl:
+        print_pnl(monitor.account_pnl, monitor.symbol_pnl)
 
-    # Stop updates
-    monitor.reqAccountUpdates(False, "")
-    monitor.disconnect()
+    print_summary(monitor.positions, monitor.account_pnl)
 
     print("[DONE] Portfolio monitoring completed")
 
@@ -15,14 +15,37 @@ Environment Variables:
 """
 
 import sys
-import time
 import os
+import argparse
+import threading
 from ibapi.client import EClient
 from ibapi.wrapper import EWrapper
 from ibapi.contract import Contract
 from ibapi.order import *
 from ibapi.common import *
 from ibapi.utils import iswrapper
+from _ibkr_common import connect_and_wait
+
+# Order status as shown to the user
+STATUS_MAP = {
+    "PendingSubmit": "Pending Submit",
+    "PendingCancel": "Pending Cancel",
+    "PreSubmitted": "Pre Submitted",
+    "Submitted": "Submitted",
+    "ApiPending": "API Pending",
+    "ApiCancelled": "API Cancelled",
+    "Cancelled": "Cancelled",
+    "Filled": "Filled",
+    "Inactive": "Inactive"
+}
+
+STATUS_FMT = "[STATUS] Order {order_id}: {status} - Filled: {filled}/{total} @ ${price}".format
+
+# Statuses after which the order gets no further updates
+FINAL_STATUSES = frozenset({'Filled', 'Cancelled'})
+
+# Informational market data farm messages
+IGNORED_CODES = frozenset({2104, 2106, 2158})
 
 class OrderClient(EWrapper, EClient):
     def __init__(self):
@@ -33,10 +56,15 @@ class OrderClient(EWrapper, EClient):
         self.execution = None
         self.open_order = None
         self.error_messages = []
+        # Notified on every status update; see order_finished
+        self.order_cv = threading.Condition()
+        # Set by nextValidId, the first message once the connection is up
+        self.ready = threading.Event()
 
     @iswrapper
     def nextValidId(self, orderId):
         self.next_order_id = orderId
+        self.ready.set()
 
     @iswrapper
     def openOrder(self, orderId, contract, order, orderState):
@@ -52,26 +80,27 @@ class OrderClient(EWrapper, EClient):
 
     @iswrapper
     def orderStatus(self, orderId, status, filled, remaining, avgFillPrice, permId, parentId, lastFillPrice, clientId, whyHeld, mktCapPrice):
-        status_map = {
-            "PendingSubmit": "Pending Submit",
-            "PendingCancel": "Pending Cancel",
-            "PreSubmitted": "Pre Submitted",
-            "Submitted": "Submitted",
-            "ApiPending": "API Pending",
-            "ApiCancelled": "API Cancelled",
-            "Cancelled": "Cancelled",
-            "Filled": "Filled",
-            "Inactive": "Inactive"
-        }
-        self.order_status = {
-            'orderId': orderId,
-            'status': status_map.get(status, status),
-            'filled': filled,
-            'remaining': remaining,
-            'avgFillPrice': avgFillPrice,
-            'lastFillPrice': lastFillPrice
-        }
-        print(f"[STATUS] Order {orderId}: {status_map.get(status, status)} - Filled: {filled}/{filled+remaining} @ ${avgFillPrice}")
+        status = STATUS_MAP.get(status, status)
+
+        # TWS often repeats an update unchanged: report each state once
+        previous = self.order_status
+        if previous and (previous['orderId'], previous['status'], previous['filled']) == (orderId, status, filled):
+            return
+
+        print(STATUS_FMT(order_id=orderId, status=status, filled=filled, total=filled + remaining, price=avgFillPrice))
+        with self.order_cv:
+            self.order_status = {
+                'orderId': orderId,
+                'status': status,
+                'filled': filled,
+                'remaining': remaining,
+                'avgFillPrice': avgFillPrice,
+                'lastFillPrice': lastFillPrice
+            }
+            self.order_cv.notify_all()
+
+    def order_finished(self):
+        return self.order_status is not None and self.order_status['status'] in FINAL_STATUSES
 
     @iswrapper
     def execDetails(self, reqId, contract, execution):
@@ -89,7 +118,7 @@ class OrderClient(EWrapper, EClient):
         self.error_messages.append(f"{errorCode}: {errorString}")
 
         # Ignore market data info messages
-        if errorCode in [2104, 2106, 2158]:
+        if errorCode in IGNORED_CODES:
             return
 
         print(f"[ERROR] Code {errorCode}: {errorString}")
@@ -128,70 +157,24 @@ def create_order(action, quantity, order_type, **kwargs):
     return order
 
 def parse_args(args):
-    if len(args) < 4:
-        print("Usage: python place_order.py SYMBOL ACTION QUANTITY [OPTIONS]")
-        print("\nRequired:")
-        print("  SYMBOL      - Stock symbol (e.g., AAPL)")
-        print("  ACTION      - BUY or SELL")
-        print("  QUANTITY    - Number of shares")
-        print("\nOptions:")
-        print("  --order-type TYPE    - MARKET (default), LIMIT, STOP, STP_LMT")
-        print("  --limit-price PRICE   - Limit price (for LIMIT and STP_LMT)")
-        print("  --stop-price PRICE    - Stop price (for STOP and STP_LMT)")
-        print("  --host HOST          - TWS host (default: 127.0.0.1)")
-        print("  --port PORT          - TWS port (default: 7497)")
-        print("  --client-id ID       - Client ID (default: 1)")
-        print("\nExamples:")
-        print("  python place_order.py AAPL BUY 100")
-        print("  python place_order.py SPY BUY 50 --order-type LIMIT --limit-price 450.00")
-        print("  python place_order.py TSLA SELL 20 --order-type STOP --stop-price 240.00")
-        sys.exit(1)
-
-    result = {
-        'symbol': args[0].upper(),
-        'action': args[1].upper(),
-        'quantity': int(args[2]),
-        'order_type': 'MARKET',
-        'host': os.getenv('IBKR_HOST', '127.0.0.1'),
-        'port': int(os.getenv('IBKR_PORT', '7497')),
-        'client_id': int(os.getenv('IBKR_CLIENT_ID', '1'))
-    }
-
-    if result['action'] not in ['BUY', 'SELL']:
-        print(f"Error: ACTION must be BUY or SELL, got {result['action']}")
-        sys.exit(1)
-
-    # Parse optional arguments
-    i = 3
-    while i < len(args):
-        if args[i] == '--order-type':
-            if i + 1 < len(args):
-                result['order_type'] = args[i + 1]
-                i += 2
-        elif args[i] == '--limit-price':
-            if i + 1 < len(args):
-                result['limit_price'] = float(args[i + 1])
-                i += 2
-        elif args[i] == '--stop-price':
-            if i + 1 < len(args):
-                result['stop_price'] = float(args[i + 1])
-                i += 2
-        elif args[i] == '--host':
-            if i + 1 < len(args):
-                result['host'] = args[i + 1]
-                i += 2
-        elif args[i] == '--port':
-            if i + 1 < len(args):
-                result['port'] = int(args[i + 1])
-                i += 2
-        elif args[i] == '--client-id':
-            if i + 1 < len(args):
-                result['client_id'] = int(args[i + 1])
-                i += 2
-        else:
-            i += 1
-
-    return result
+    parser = argparse.ArgumentParser(
+        description="Place an order via the IBKR API",
+        epilog="""Examples:
+  python place_order.py AAPL BUY 100
+  python place_order.py SPY BUY 50 --order-type LIMIT --limit-price 450.00
+  python place_order.py TSLA SELL 20 --order-type STOP --stop-price 240.00""",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('symbol', type=str.upper, help="Stock symbol (e.g., AAPL)")
+    parser.add_argument('action', type=str.upper, choices=['BUY', 'SELL'], help="BUY or SELL")
+    parser.add_argument('quantity', type=int, help="Number of shares")
+    parser.add_argument('--order-type', default='MARKET', help="MARKET (default), LIMIT, STOP, STP_LMT")
+    parser.add_argument('--limit-price', type=float, help="Limit price (for LIMIT and STP_LMT)")
+    parser.add_argument('--stop-price', type=float, help="Stop price (for STOP and STP_LMT)")
+    parser.add_argument('--host', default=os.getenv('IBKR_HOST', '127.0.0.1'), help="TWS host (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=int(os.getenv('IBKR_PORT', '7497')), help="TWS port (default: 7497)")
+    parser.add_argument('--client-id', type=int, default=int(os.getenv('IBKR_CLIENT_ID', '1')), help="Client ID (default: 1)")
+    return vars(parser.parse_args(args))
 
 def confirm_order(params):
     """Ask user to confirm order placement"""
@@ -202,9 +185,9 @@ def confirm_order(params):
     print(f"Action:     {params['action']}")
     print(f"Quantity:   {params['quantity']}")
     print(f"Order Type: {params['order_type']}")
-    if 'limit_price' in params:
+    if params['limit_price'] is not None:
         print(f"Limit Price: ${params['limit_price']:.2f}")
-    if 'stop_price' in params:
+    if params['stop_price'] is not None:
         print(f"Stop Price:  ${params['stop_price']:.2f}")
     print(f"Environment: {'Paper Trading' if params['port'] == 7497 else 'Live Trading'}")
     print("=" * 60)
@@ -225,28 +208,14 @@ def main():
     client = OrderClient()
 
     try:
-        client.connect(params['host'], params['port'], params['client_id'])
-        print("[INIT] Connection initiated...")
+        connect_and_wait(client, params['host'], params['port'], params['client_id'])
+    except TimeoutError:
+        print("[FAIL] Timeout waiting for connection")
+        return 1
     except Exception as e:
         print(f"[FAIL] Could not initiate connection: {e}")
         return 1
 
-    # Start message thread
-    client.nextOrderId()
-
-    # Wait for next order ID
-    timeout = 10
-    elapsed = 0
-    while client.next_order_id is None and elapsed < timeout:
-        time.sleep(0.1)
-        elapsed += 0.1
-        client.nextOrderId()
-
-    if client.next_order_id is None:
-        print("[FAIL] Timeout waiting for connection")
-        client.disconnect()
-        return 1
-
     print(f"[OK] Connected. Next Order ID: {client.next_order_id}")
 
     # Create contract and order
@@ -255,8 +224,8 @@ def main():
         params['action'],
         params['quantity'],
         params['order_type'],
-        limit_price=params.get('limit_price'),
-        stop_price=params.get('stop_price')
+        limit_price=params['limit_price'],
+        stop_price=params['stop_price']
     )
 
     # Place order
@@ -265,18 +234,10 @@ def main():
     client.placeOrder(order_id, contract, order)
     client.next_order_id += 1
 
-    # Wait for order status
+    # Wait for the order to be filled or cancelled (at most 30s)
     print("[WAIT] Waiting for order status...")
-    time.sleep(1)
-
-    # Monitor order status
-    max_wait = 30
-    elapsed = 0
-    while elapsed < max_wait:
-        if client.order_status and client.order_status['status'] in ['Filled', 'Cancelled']:
-            break
-        time.sleep(0.5)
-        elapsed += 0.5
+    with client.order_cv:
+        client.order_cv.wait_for(client.order_finished, timeout=30)
 
     # Summary
     print("\n" + "=" * 60)
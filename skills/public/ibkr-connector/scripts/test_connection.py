@@ -8,11 +8,16 @@ Usage:
 """
 
 import sys
-import time
+import argparse
+import threading
 from ibapi.client import EClient
 from ibapi.wrapper import EWrapper
 from ibapi.common import *
 from ibapi.utils import iswrapper
+from _ibkr_common import connect_and_wait
+
+# Informational market data farm messages
+IGNORED_CODES = frozenset({2104, 2106, 2158})
 
 class IBKRClient(EWrapper, EClient):
     def __init__(self):
@@ -22,13 +27,16 @@ class IBKRClient(EWrapper, EClient):
         self.next_order_id = None
         self.error_count = 0
         self.server_time = None
+        # Set by nextValidId, the first message once the connection is up
+        self.ready = threading.Event()
+        self.time_received = threading.Event()
 
     @iswrapper
     def error(self, reqId, errorCode, errorString):
         self.error_count += 1
 
         # Ignore market data info messages
-        if errorCode in [2104, 2106, 2158]:
+        if errorCode in IGNORED_CODES:
             return
 
         print(f"[ERROR] Code {errorCode}: {errorString}")
@@ -42,11 +50,13 @@ class IBKRClient(EWrapper, EClient):
         self.next_order_id = orderId
         print(f"[OK] Next valid order ID: {orderId}")
         self.connected = True
+        self.ready.set()
 
     @iswrapper
     def currentTime(self, time):
         self.server_time = time
         print(f"[OK] Server time: {time}")
+        self.time_received.set()
 
     @iswrapper
     def connectAck(self):
@@ -55,32 +65,12 @@ class IBKRClient(EWrapper, EClient):
     def is_connected(self):
         return self.connected and self.next_order_id is not None
 
-    def run(self):
-        self.run()
-
 def parse_args():
-    args = {
-        'host': '127.0.0.1',
-        'port': 7497,
-        'client_id': 0
-    }
-
-    for i, arg in enumerate(sys.argv[1:], 1):
-        if arg == '--host' and i + 1 < len(sys.argv):
-            args['host'] = sys.argv[i + 1]
-        elif arg == '--port' and i + 1 < len(sys.argv):
-            args['port'] = int(sys.argv[i + 1])
-        elif arg == '--client-id' and i + 1 < len(sys.argv):
-            args['client_id'] = int(sys.argv[i + 1])
-        elif arg in ['--help', '-h']:
-            print("Usage: python test_connection.py [--host HOST] [--port PORT] [--client-id ID]")
-            print("\nDefaults:")
-            print("  --host 127.0.0.1")
-            print("  --port 7497 (Paper Trading) or 7496 (Live)")
-            print("  --client-id 0")
-            sys.exit(0)
-
-    return args
+    parser = argparse.ArgumentParser(description="Test the connection to TWS or IB Gateway")
+    parser.add_argument('--host', default='127.0.0.1', help="TWS host (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=7497, help="7497 (Paper Trading, default) or 7496 (Live)")
+    parser.add_argument('--client-id', type=int, default=0, help="Client ID (default: 0)")
+    return vars(parser.parse_args())
 
 def main():
     print("=" * 60)
@@ -96,9 +86,15 @@ def main():
 
     client = IBKRClient()
 
+    # Wait for connection with timeout
+    timeout = 10
+
+    print(f"\nWaiting for connection (timeout: {timeout}s)...")
+
     try:
-        client.connect(args['host'], args['port'], args['client_id'])
-        print("[INIT] Connection initiated...")
+        connect_and_wait(client, args['host'], args['port'], args['client_id'], timeout=timeout)
+    except TimeoutError:
+        pass
     except Exception as e:
         print(f"[FAIL] Could not initiate connection: {e}")
         print("\nPossible causes:")
@@ -108,21 +104,6 @@ def main():
         print("  4. Firewall blocking connection")
         sys.exit(1)
 
-    # Start message thread
-    client.nextOrderId()
-
-    # Wait for connection with timeout
-    timeout = 10
-    elapsed = 0
-    interval = 0.1
-
-    print(f"\nWaiting for connection (timeout: {timeout}s)...")
-
-    while not client.is_connected() and elapsed < timeout:
-        time.sleep(interval)
-        elapsed += interval
-        client.nextOrderId()  # Keep connection alive
-
     if client.is_connected():
         print("\n" + "=" * 60)
         print("[SUCCESS] Connection established!")
@@ -135,7 +116,8 @@ def main():
         # Test server time
         print("\n[TEST] Requesting server time...")
         client.reqCurrentTime()
-        time.sleep(1)
+        if not client.time_received.wait(timeout=5):
+            print("[WARN] No server time received")
 
         # Disconnect gracefully
         print("\n[CLEANUP] Disconnecting...")